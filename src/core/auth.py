@@ -1,10 +1,28 @@
 from pathlib import Path
 import sys
-from typing import Tuple, Any
+import threading
+from typing import Dict, Tuple, Any
 import json
 from core.tts.service_types import TTSService
 
 class AuthManager:
+    """
+    Locates, validates and loads service credentials and builds API clients.
+
+    Resolved paths, parsed credential files and initialized clients are
+    memoized at class level, so every AuthManager shares them and engines
+    built repeatedly (on service switches, batch runs) reuse one long-lived
+    client instead of opening a new channel each time. Parsed credentials
+    and clients are keyed on the file's mtime and size and rebuilt when the
+    file changes; a remembered path is re-probed once it stops existing.
+    """
+
+    _paths: Dict[TTSService, Path] = {}
+    _credentials: Dict[Tuple[TTSService, Path], Tuple[Tuple[int, int], dict]] = {}
+    _clients: Dict[Tuple[TTSService, Path], Tuple[Tuple[int, int], Tuple[Any, Any]]] = {}
+    _client_locks: Dict[Tuple[TTSService, Path], threading.Lock] = {}
+    _lock = threading.Lock()
+
     def __init__(self):
         self.service_configs = {
             TTSService.GOOGLE: { 
@@ -20,8 +38,26 @@ class AuthManager:
             }
         }
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget resolved paths, credentials and clients"""
+        with cls._lock:
+            cls._paths.clear()
+            cls._credentials.clear()
+            cls._clients.clear()
+            cls._client_locks.clear()
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     def get_credentials_path(self, service: TTSService) -> Path:
         """Get path for service credentials file"""
+        cached = self._paths.get(service)
+        if cached is not None and cached.exists():
+            return cached
+
         base_path = Path(getattr(sys, '_MEIPASS', Path(__file__).parent.parent))
         possible_paths = [
             Path(sys.executable).parent / "credentials" / self.service_configs[service]['config_name'],
@@ -32,6 +68,8 @@ class AuthManager:
 
         for path in possible_paths:
             if path.exists():
+                with self._lock:
+                    self._paths[service] = path
                 return path
 
         default_path = Path(sys.executable).parent / "credentials" / self.service_configs[service]['config_name']
@@ -46,13 +84,43 @@ class AuthManager:
         validator = self.service_configs[service]['validator']
         validator(credentials_path)
 
+    def load_credentials(self, service: TTSService, credentials_path: Path) -> dict:
+        """Parsed credentials file, re-read only when the file has changed"""
+        key = (service, Path(credentials_path))
+        stamp = self._stamp(key[1])
+        cached = self._credentials.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            with open(credentials_path) as f:
+                creds = json.load(f)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid {service.value} credentials JSON file")
+        with self._lock:
+            self._credentials[key] = (stamp, creds)
+        return creds
+
     def initialize_client(self, service: TTSService, credentials_path: Path) -> Tuple[Any, Any]:
-        """Initialize client for specified service"""
+        """Initialize client for specified service, reusing the one built for unchanged credentials"""
         if service not in self.service_configs:
             raise ValueError(f"Unsupported service: {service}")
-        
-        initializer = self.service_configs[service]['initializer']
-        return initializer(credentials_path)
+
+        key = (service, Path(credentials_path))
+        with self._lock:
+            build_lock = self._client_locks.setdefault(key, threading.Lock())
+        # One build per credentials file; concurrent callers wait for it
+        with build_lock:
+            stamp = self._stamp(key[1])
+            cached = self._clients.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            initializer = self.service_configs[service]['initializer']
+            result = initializer(credentials_path)
+            with self._lock:
+                self._clients[key] = (stamp, result)
+            return result
 
     def _validate_creds(self, service: TTSService, credentials_path: Path) -> None:
         """Common credential validation for all services"""
@@ -61,12 +129,8 @@ class AuthManager:
                 f"{service.value.capitalize()} credentials not found at {credentials_path}\n"
                 f"Please create a JSON file with your {service.value} credentials"
             )
-        
-        try:
-            with open(credentials_path) as f:
-                creds = json.load(f)
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid {service.value} credentials JSON file")
+
+        self.load_credentials(service, credentials_path)
     
     # Google Cloud methods
     def _init_google_client(self, credentials_path: Path) -> Tuple[Any, Any]:
@@ -87,10 +151,9 @@ class AuthManager:
     def _init_elevenlabs_client(self, credentials_path: Path) -> Tuple[Any, Any]:
         """Simplified ElevenLabs initialization"""
         try:
-            with open(credentials_path) as f:
-                creds = json.load(f)
-                from .tts.elevenlabs.elevenlabs import ElevenLabsTTS
-                return ElevenLabsTTS(creds['api_key']), None
+            creds = self.load_credentials(TTSService.ELEVENLABS, credentials_path)
+            from .tts.elevenlabs.elevenlabs import ElevenLabsTTS
+            return ElevenLabsTTS(creds['api_key']), None
         except Exception as e:
             raise RuntimeError(f"ElevenLabs initialization failed: {str(e)}")
         
@@ -101,10 +164,8 @@ class AuthManager:
             
         credentials_path = self.get_credentials_path(service)
         self.validate_credentials(service, credentials_path)
-        
-        with open(credentials_path) as f:
-            creds = json.load(f)
-            
+        creds = self.load_credentials(service, credentials_path)
+
         if service == TTSService.ELEVENLABS:
             return creds.get('api_key')
         elif service == TTSService.GOOGLE:
@@ -0,0 +1,12 @@
+from .items import BatchItem, read_items
+from .manifest import JobManifest
+from .runner import BatchResult, BatchRunner, BatchStats
+
+__all__ = [
+    'BatchItem',
+    'BatchResult',
+    'BatchRunner',
+    'BatchStats',
+    'JobManifest',
+    'read_items',
+]
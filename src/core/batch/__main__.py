@@ -0,0 +1,53 @@
+import argparse
+import sys
+from ..tts.service_types import TTSService
+from .items import read_items
+from .manifest import JobManifest
+from .runner import BatchRunner, DEFAULT_WORKERS
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.batch",
+        description="Render a JSONL or CSV file of prompts to audio files."
+    )
+    parser.add_argument("input", help="JSONL or CSV file of rows with text and output, or - for stdin")
+    parser.add_argument("--format", choices=["jsonl", "csv"], dest="input_format",
+                        help="Input format (default: from the file suffix, else jsonl)")
+    parser.add_argument("--service", choices=[s.value for s in TTSService], default=TTSService.GOOGLE.value,
+                        help="Service for rows that don't name one (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Concurrent synthesis requests (default: %(default)s)")
+    parser.add_argument("--output-dir", default=".",
+                        help="Directory that relative output paths resolve against (default: current directory)")
+    parser.add_argument("--hedge", action="store_true",
+                        help="Send a duplicate of any request slower than the observed p95; the loser is "
+                             "cancelled but may still be billed, so this can double spend (default: off)")
+    parser.add_argument("--channels", type=int, default=1,
+                        help="gRPC connections to spread Google requests over (default: %(default)s)")
+    parser.add_argument("--manifest",
+                        help="Job manifest file; finished items are recorded there and skipped when the job is re-run")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    items = read_items(args.input, args.input_format, TTSService(args.service))
+    runner = BatchRunner(output_dir=args.output_dir, workers=args.workers, hedge=args.hedge, channels=args.channels)
+
+    manifest = None
+    try:
+        if args.manifest:
+            manifest = JobManifest(args.manifest)
+            print(f"Resuming with {len(manifest)} completed items in {args.manifest}")
+        stats = runner.run(items, manifest=manifest)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if manifest is not None:
+            manifest.close()
+
+    print(stats.summary())
+    return 1 if stats.failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
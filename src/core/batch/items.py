@@ -0,0 +1,104 @@
+import csv
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO, Union
+from ..tts.service_types import TTSService
+
+FORMAT_BY_SUFFIX = {".mp3": "MP3", ".wav": "WAV", ".ogg": "OGG", ".pcm": "PCM", ".ulaw": "ULAW"}
+
+@dataclass
+class BatchItem:
+    """One row of a batch job: what to say, with which service and voice, and where to write it"""
+    text: str
+    output: str
+    service: TTSService = TTSService.GOOGLE
+    voice: Optional[Union[str, Dict[str, Any]]] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    line: int = 0
+
+    @property
+    def audio_format(self) -> str:
+        """Explicit audio_format param, else inferred from the output file suffix"""
+        fmt = self.params.get("audio_format")
+        if fmt:
+            return str(fmt).upper()
+        return FORMAT_BY_SUFFIX.get(Path(self.output).suffix.lower(), "MP3")
+
+def read_items(
+    source: Union[str, Path, TextIO],
+    input_format: Optional[str] = None,
+    default_service: TTSService = TTSService.GOOGLE
+) -> Iterator[BatchItem]:
+    """
+    Stream BatchItems from a JSONL or CSV source without loading it whole.
+
+    Rows carry text and output, plus optional service, voice and params. In
+    CSV, voice and params may hold JSON. A path of "-" reads standard input.
+    """
+    if isinstance(source, (str, Path)):
+        if input_format is None:
+            input_format = "csv" if Path(source).suffix.lower() == ".csv" else "jsonl"
+        if str(source) == "-":
+            yield from read_items(sys.stdin, input_format, default_service)
+            return
+        with open(source, newline="", encoding="utf-8") as f:
+            yield from read_items(f, input_format, default_service)
+        return
+
+    if (input_format or "jsonl") == "csv":
+        reader = csv.DictReader(source)
+        rows = ((reader.line_num, row) for row in reader)
+    else:
+        rows = _jsonl_rows(source)
+
+    for line, row in rows:
+        yield _parse_row(row, line, default_service)
+
+def _jsonl_rows(source: TextIO) -> Iterator:
+    for line, raw in enumerate(source, start=1):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            yield line, json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line}: invalid JSON ({e.msg})") from e
+
+def _parse_row(row: Dict[str, Any], line: int, default_service: TTSService) -> BatchItem:
+    text = row.get("text")
+    output = row.get("output")
+    if not text or not output:
+        raise ValueError(f"Line {line}: every row needs 'text' and 'output'")
+
+    service = row.get("service") or default_service
+    try:
+        service = service if isinstance(service, TTSService) else TTSService(str(service).lower())
+    except ValueError:
+        raise ValueError(
+            f"Line {line}: unsupported service {service!r}. "
+            f"Supported: {[s.value for s in TTSService]}"
+        )
+
+    params = _maybe_json(row.get("params"), line) or {}
+    if not isinstance(params, dict):
+        raise ValueError(f"Line {line}: 'params' must be a JSON object")
+
+    return BatchItem(
+        text=text,
+        output=output,
+        service=service,
+        voice=_maybe_json(row.get("voice"), line) or None,
+        params=params,
+        line=line
+    )
+
+def _maybe_json(value: Any, line: int) -> Any:
+    """CSV cells arrive as strings; decode the ones holding JSON objects"""
+    if isinstance(value, str) and value.lstrip().startswith("{"):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line}: invalid JSON cell ({e.msg})") from e
+    return value
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+from ..tts.cache import SynthesisCache
+from ..utils import setup_logger
+from .items import BatchItem
+
+SYNC_EVERY = 50
+
+class JobManifest:
+    """
+    Append-only record of finished batch items, used to resume interrupted jobs.
+
+    Each completed item adds one JSON line with its key, output path, audio
+    SHA-256 and billed characters. On open the file is indexed into a dict,
+    so checking an item is a hash lookup plus one stat of its output file. A
+    torn last line left by a crash is ignored and that item is simply redone.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.logger = setup_logger()
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict] = {}
+        self._unsynced = 0
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() and not self._ends_with_newline():
+            self._file.write("\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    @staticmethod
+    def item_key(item: BatchItem) -> str:
+        """Identity of an item: everything that affects its audio, plus where it goes"""
+        payload = {
+            "service": item.service.value,
+            "text": item.text,
+            "voice": SynthesisCache._normalize_value(item.voice),
+            "params": SynthesisCache._normalize_value(item.params),
+            "output": item.output
+        }
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    record = json.loads(line)
+                    self._records[record["key"]] = record
+                except (ValueError, KeyError, TypeError):
+                    self.logger.warning(f"Ignoring unreadable manifest line {line_number} in {self.path}")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, item: BatchItem) -> Optional[Dict]:
+        return self._records.get(self.item_key(item))
+
+    def is_done(self, item: BatchItem, output_path: Path) -> bool:
+        """Whether item finished in an earlier run and its output is still on disk"""
+        return self.get(item) is not None and output_path.exists()
+
+    def record(self, item: BatchItem, audio: bytes, chars: int) -> None:
+        """Append a completion record; fsynced every SYNC_EVERY records and on close"""
+        record = {
+            "key": self.item_key(item),
+            "output": item.output,
+            "sha256": hashlib.sha256(audio).hexdigest(),
+            "chars": chars
+        }
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self._records[record["key"]] = record
+            self._unsynced += 1
+            if self._unsynced >= SYNC_EVERY:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    @property
+    def billed_chars(self) -> int:
+        return sum(record.get("chars", 0) for record in self._records.values())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
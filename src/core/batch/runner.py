@@ -0,0 +1,201 @@
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+from ..auth import AuthManager
+from ..tts.base_tts import BaseTTS
+from ..tts.factory import TTSFactory
+from ..tts.retry import RetryPolicy
+from ..tts.service_types import TTSService
+from ..utils import atomic_write_bytes, setup_logger
+from .items import BatchItem
+from .manifest import JobManifest
+
+DEFAULT_WORKERS = 4
+
+@dataclass
+class BatchResult:
+    """Outcome of rendering one BatchItem"""
+    item: BatchItem
+    path: Path
+    latency: float
+    audio: Optional[bytes] = None
+    error: Optional[Exception] = None
+    # Characters the service charged for; 0 when the audio came from the cache
+    billed_chars: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+@dataclass
+class BatchStats:
+    """Running totals for a batch job, with latency percentiles over successful items"""
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    characters: int = 0
+    audio_bytes: int = 0
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    def add(self, result: BatchResult) -> None:
+        if result.ok:
+            self.succeeded += 1
+            self.characters += len(result.item.text)
+            self.audio_bytes += len(result.audio)
+            self.latencies.append(result.latency)
+        else:
+            self.failed += 1
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of item latency in seconds"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> str:
+        total = self.succeeded + self.failed
+        skipped = f" ({self.skipped} already done, skipped)" if self.skipped else ""
+        rate = self.succeeded / self.elapsed if self.elapsed else 0.0
+        char_rate = self.characters / self.elapsed if self.elapsed else 0.0
+        return (
+            f"{self.succeeded}/{total} items rendered, {self.failed} failed in {self.elapsed:.1f}s{skipped}\n"
+            f"Throughput: {rate:.2f} items/s, {char_rate:.0f} chars/s, "
+            f"{self.audio_bytes / 1024 / 1024:.1f} MB written\n"
+            f"Latency: p50 {self.percentile(50):.3f}s  p90 {self.percentile(90):.3f}s  "
+            f"p99 {self.percentile(99):.3f}s"
+        )
+
+class BatchRunner:
+    """
+    Renders a stream of BatchItems to files on a bounded worker pool.
+
+    Items are pulled from the source only as workers free up, so arbitrarily
+    large inputs run in constant memory. Engines are created through
+    TTSFactory on first use of each service and shared across workers;
+    hedge gives those engines a hedging RetryPolicy. An engine_factory builds
+    its engines as it sees fit.
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path] = ".",
+        workers: int = DEFAULT_WORKERS,
+        auth_manager: Optional[AuthManager] = None,
+        engine_factory: Optional[Callable[[TTSService], BaseTTS]] = None,
+        hedge: bool = False,
+        channels: int = 1
+    ):
+        self.output_dir = Path(output_dir)
+        self.workers = max(1, workers)
+        self.hedge = hedge
+        self.retry_policy = RetryPolicy(hedge=True) if hedge else None
+        self.channels = max(1, channels)
+        self.auth_manager = auth_manager
+        self.engine_factory = engine_factory or self._create_engine
+        self.logger = setup_logger()
+        self._engines: Dict[TTSService, BaseTTS] = {}
+        self._engines_lock = threading.Lock()
+
+    def run(
+        self,
+        items: Iterable[BatchItem],
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+        manifest: Optional[JobManifest] = None
+    ) -> BatchStats:
+        """
+        Render every item and return the job's stats.
+
+        on_result sees each result as it completes. With a manifest, items it
+        records as done are skipped and newly finished items are appended to it.
+        """
+        stats = BatchStats()
+        started = time.perf_counter()
+        if manifest is not None:
+            items = self._skip_done(items, manifest, stats)
+
+        for result in self.iter_results(items):
+            stats.add(result)
+            if result.ok and manifest is not None:
+                manifest.record(result.item, result.audio, result.billed_chars)
+            if not result.ok:
+                self.logger.error(f"Line {result.item.line} ({result.item.output}) failed: {result.error}")
+            if on_result:
+                on_result(result)
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _skip_done(self, items: Iterable[BatchItem], manifest: JobManifest, stats: BatchStats) -> Iterator[BatchItem]:
+        for item in items:
+            if manifest.is_done(item, self.output_dir / item.output):
+                stats.skipped += 1
+            else:
+                yield item
+
+    def iter_results(self, items: Iterable[BatchItem]) -> Iterator[BatchResult]:
+        """Yield results in completion order, keeping at most twice the worker count in flight"""
+        window = self.workers * 2
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tts-batch") as executor:
+            pending = set()
+            for item in items:
+                pending.add(executor.submit(self.render, item))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in pending:
+                yield future.result()
+
+    def render(self, item: BatchItem) -> BatchResult:
+        """Synthesize a single item and write it atomically; errors are captured in the result"""
+        path = self.output_dir / item.output
+        started = time.perf_counter()
+        try:
+            engine = self.get_engine(item.service)
+            args = self._request_args(item)
+            # Probed before synthesis; an identical item finishing in between is still counted as billed
+            billed_chars = 0 if engine.is_cached(item.text, **args) else len(item.text)
+            audio = engine.generate_to_memory(item.text, **args)
+            atomic_write_bytes(path, audio)
+            return BatchResult(item, path, time.perf_counter() - started, audio=audio, billed_chars=billed_chars)
+        except Exception as e:
+            return BatchResult(item, path, time.perf_counter() - started, error=e)
+
+    def get_engine(self, service: TTSService) -> BaseTTS:
+        with self._engines_lock:
+            engine = self._engines.get(service)
+            if engine is None:
+                engine = self._engines[service] = self.engine_factory(service)
+            return engine
+
+    def _create_engine(self, service: TTSService) -> BaseTTS:
+        return TTSFactory.create(
+            service,
+            auth_manager=self.auth_manager or AuthManager(),
+            channels=self.channels,
+            retry_policy=self.retry_policy
+        )
+
+    @staticmethod
+    def _request_args(item: BatchItem) -> Dict:
+        """Map a row's voice and params onto the engine's generate_to_memory arguments"""
+        params = dict(item.params)
+        params["audio_format"] = item.audio_format
+
+        if item.service == TTSService.ELEVENLABS:
+            voice_data = dict(item.voice) if isinstance(item.voice, dict) else {}
+            if isinstance(item.voice, str):
+                voice_data["voice_id"] = item.voice
+            if "model" in params:
+                voice_data["model"] = params.pop("model")
+            return {"voice_data": voice_data, **params}
+
+        if isinstance(item.voice, dict):
+            return {"voice_data": item.voice, **params}
+        return {"voice_name": item.voice, **params}
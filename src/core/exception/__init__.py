@@ -1,7 +1,8 @@
-from .base import TTSAPIError
+from .base import TTSAPIError, SynthesisCancelled
 from .elevenlabs import ElevenLabsAPIError
 
 __all__ = [
     'TTSAPIError',
+    'SynthesisCancelled',
     'ElevenLabsAPIError',
-]
\ No newline at end of file
+]
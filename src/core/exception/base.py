@@ -9,4 +9,7 @@ class TTSAPIError(Exception):
         full_message = f"{self.service_name} Error: {message}"
         if details:
             full_message += f" (Details: {details})"
-        super().__init__(full_message)
\ No newline at end of file
+        super().__init__(full_message)
+
+class SynthesisCancelled(Exception):
+    """Raised inside a synthesis job once its CancellationToken has been cancelled"""
@@ -1,9 +1,14 @@
 from enum import Enum
+from .auth import AuthManager
 from .tts.factory import TTSService, TTSFactory
+from .tts.registry import ProviderRegistry
 
 class ServiceManager:
-    def __init__(self):
+    def __init__(self, auth_manager=None):
         self.current_service = None
+        self.auth_manager = auth_manager or AuthManager()
+        # Engines are kept per service so switching back reuses the existing client
+        self.providers = ProviderRegistry(self.auth_manager)
         self.available_services = {
             "google": TTSService.GOOGLE,
             "elevenlabs": TTSService.ELEVENLABS
@@ -14,5 +19,9 @@ class ServiceManager:
             raise ValueError(f"Unknown service: {service_name}")
         
         service_enum = self.available_services[service_name]
-        self.current_service = TTSFactory.create(service_enum, **kwargs)
-        return self.current_service
\ No newline at end of file
+        if kwargs:
+            kwargs.setdefault("auth_manager", self.auth_manager)
+            self.current_service = TTSFactory.create(service_enum, **kwargs)
+        else:
+            self.current_service = self.providers.get(service_enum)
+        return self.current_service
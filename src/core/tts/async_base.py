@@ -0,0 +1,59 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
+from .service_types import TTSService
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+class AsyncBaseTTS(ABC):
+    """
+    Asyncio counterpart of BaseTTS.
+
+    Every request an engine sends goes through a shared semaphore, so one event
+    loop can hold hundreds of agenerate() calls while only max_concurrency of
+    them are on the wire at once.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Base initialization that all async TTS services must call"""
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @abstractmethod
+    async def agenerate(self, text: str, **kwargs) -> bytes:
+        """Generate audio for text"""
+        pass
+
+    @abstractmethod
+    async def aget_available_voices(self, language_code: Optional[str] = None) -> List[Dict]:
+        """Get available voices for a language"""
+        pass
+
+    @abstractmethod
+    async def aget_usage_stats(self) -> Dict[str, Union[int, str]]:
+        """Get combined usage statistics"""
+        pass
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """Release network resources held by the engine"""
+        pass
+
+    @abstractmethod
+    def get_service_name(self) -> TTSService:
+        pass
+
+    async def agenerate_many(self, texts: Iterable[str], **kwargs) -> List[bytes]:
+        """Generate audio for many texts concurrently, returning results in input order"""
+        return await asyncio.gather(*(self.agenerate(text, **kwargs) for text in texts))
+
+    async def _bounded(self, call: Callable[..., Awaitable[bytes]], *args, **kwargs) -> bytes:
+        """Make a single API call under the engine's concurrency limit"""
+        async with self._semaphore:
+            return await call(*args, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
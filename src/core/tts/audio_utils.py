@@ -0,0 +1,127 @@
+import io
+import wave
+from typing import Iterable, Iterator, List, Optional
+
+MP3_SEGMENT_BYTES = 16 * 1024
+
+# Layer III bitrates in kbps by bitrate index, for MPEG-1 and MPEG-2/2.5
+_MP3_BITRATES_MPEG1 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+_MP3_BITRATES_MPEG2 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+# Sample rates by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+def utf8_len(text: str) -> int:
+    """Length of text in UTF-8 bytes, the unit Google's input limit is measured in"""
+    return len(text.encode("utf-8"))
+
+def join_audio(parts: List[bytes], audio_format: str) -> bytes:
+    """
+    Concatenate separately synthesized audio segments into one result.
+
+    MP3 and raw PCM/ULAW segments are frame streams and concatenate directly
+    (MP3 ID3 tags are dropped from all but the first segment). WAV segments are
+    re-muxed under a single header. OGG segments form a chained Ogg stream,
+    which the Ogg spec allows and common decoders play back to back.
+    """
+    if not parts:
+        return b""
+    if len(parts) == 1:
+        return parts[0]
+
+    fmt = audio_format.upper()
+    if fmt == "WAV":
+        return _join_wav(parts)
+    if fmt == "MP3":
+        return parts[0] + b"".join(_strip_id3v2(part) for part in parts[1:])
+    return b"".join(parts)
+
+def pcm_to_wav(pcm: bytes, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Wrap raw little-endian PCM samples in a WAV header"""
+    output = io.BytesIO()
+    with wave.open(output, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(sample_rate)
+        writer.writeframes(pcm)
+    return output.getvalue()
+
+def _strip_id3v2(data: bytes) -> bytes:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return data
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return data[10 + size + footer:]
+
+def _join_wav(parts: List[bytes]) -> bytes:
+    params = None
+    frames = []
+    for part in parts:
+        with wave.open(io.BytesIO(part), "rb") as reader:
+            part_params = reader.getparams()
+            if params is None:
+                params = part_params
+            elif part_params[:3] != params[:3]:
+                raise ValueError("Cannot join WAV segments with different channel/sample formats")
+            frames.append(reader.readframes(reader.getnframes()))
+
+    return pcm_to_wav(b"".join(frames), params.framerate, params.nchannels, params.sampwidth)
+
+def regroup_mp3_frames(stream: Iterable[bytes], segment_bytes: int = MP3_SEGMENT_BYTES) -> Iterator[bytes]:
+    """
+    Regroup an MP3 byte stream into independently decodable segments.
+
+    Network chunks split MP3 frames at arbitrary offsets; this buffers the
+    stream and yields runs of whole Layer III frames of at least segment_bytes,
+    plus whatever remains when the stream ends. A leading ID3v2 tag is dropped.
+    """
+    buffer = bytearray()
+    offset = 0
+    tag_checked = False
+    for data in stream:
+        buffer += data
+        if not tag_checked:
+            if len(buffer) < 10:
+                continue
+            if buffer[:3] == b"ID3":
+                tag_size = 10 + ((buffer[6] << 21) | (buffer[7] << 14) | (buffer[8] << 7) | buffer[9])
+                if len(buffer) < tag_size:
+                    continue
+                del buffer[:tag_size]
+            tag_checked = True
+
+        while len(buffer) - offset >= 4:
+            frame_length = _mp3_frame_length(buffer, offset)
+            if frame_length is None:
+                resync = buffer.find(b"\xff", offset + 1)
+                offset = resync if resync != -1 else len(buffer)
+                continue
+            if offset + frame_length > len(buffer):
+                break
+            offset += frame_length
+
+        if offset >= segment_bytes:
+            yield bytes(buffer[:offset])
+            del buffer[:offset]
+            offset = 0
+
+    if buffer:
+        yield bytes(buffer)
+
+def _mp3_frame_length(buffer: bytearray, offset: int) -> Optional[int]:
+    """Length of the Layer III frame whose header starts at offset, or None if there isn't one"""
+    b0, b1, b2 = buffer[offset], buffer[offset + 1], buffer[offset + 2]
+    if b0 != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    padding = (b2 >> 1) & 0x01
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    if version == 3:
+        return 144 * _MP3_BITRATES_MPEG1[bitrate_index] * 1000 // sample_rate + padding
+    return 72 * _MP3_BITRATES_MPEG2[bitrate_index] * 1000 // sample_rate + padding
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Union, List, Tuple
+from typing import Dict, Iterator, Optional, Union, List, Tuple
 from .service_types import TTSService
+from .cancellation import CancellationToken, SynthesisHandle
 
 class BaseTTS(ABC):
     def __init__(self):
@@ -12,6 +13,29 @@ class BaseTTS(ABC):
         """Generate audio with business logic"""
         pass
     
+    @abstractmethod
+    def generate_chunks(self, text: str, **kwargs) -> Iterator[bytes]:
+        """Yield audio in order, one synthesis chunk at a time, for progressive playback"""
+        pass
+    
+    @abstractmethod
+    def stream_audio(self, text: str, **kwargs) -> Iterator[bytes]:
+        """Yield audio bytes as the service produces them, for the lowest time to first audio"""
+        pass
+    
+    def start_synthesis(self, text: str, stream: bool = False, **kwargs) -> SynthesisHandle:
+        """
+        Start stream_audio (or generate_chunks) for text and return a handle
+        that yields its audio and can cancel it from another thread.
+        """
+        token = CancellationToken()
+        produce = self.stream_audio if stream else self.generate_chunks
+        return SynthesisHandle(produce(text, cancel_token=token, **kwargs), token)
+    
+    def is_cached(self, text: str, **kwargs) -> bool:
+        """Whether generate_to_memory would serve text from the cache, without billing it"""
+        return False
+    
     @abstractmethod
     def get_usage_stats(self) -> Dict[str, Union[int, str]]:
         """Get combined usage statistics"""
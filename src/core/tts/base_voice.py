@@ -1,6 +1,5 @@
 from typing import Dict, List, Tuple, Union, Optional
 from abc import ABC, abstractmethod
-from langcodes import Language
 
 class BaseVoiceDetails(ABC):
     """Abstract base class for voice details formatting"""
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from ..utils import setup_logger, atomic_write_bytes
+from .service_types import TTSService
+
+DEFAULT_CACHE_DIR = Path.home() / ".tts_app" / "cache"
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+class SynthesisCache:
+    """
+    Persistent, content-addressed cache of synthesized audio.
+
+    Entries are keyed on a SHA-256 of the normalized text, service and every
+    parameter that affects the audio. The cache is bounded by total size and
+    evicts least recently used entries first; recency survives restarts via
+    file modification times. A max_bytes of 0 disables the cache.
+
+    The size bound is kept by one instance's index, so everything in a
+    process that uses a directory should share the instance for_dir() returns.
+    """
+
+    FILE_SUFFIX = ".audio"
+
+    _instances: Dict[Path, "SynthesisCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.logger = setup_logger()
+        self._lock = threading.Lock()
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+
+    @classmethod
+    def for_dir(cls, cache_dir: Optional[Union[str, Path]] = None,
+                max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> "SynthesisCache":
+        """Return the shared cache for a directory, creating it on first use with max_bytes"""
+        key = Path(cache_dir or DEFAULT_CACHE_DIR).expanduser().resolve()
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls._instances[key] = cls(key, max_bytes)
+            return cache
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Unicode-normalize and collapse whitespace so trivial edits still hit"""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    @classmethod
+    def make_key(cls, service: TTSService, text: str, **params: Any) -> str:
+        """Build the cache key for a synthesis request"""
+        payload = {
+            "service": service.value,
+            "text": cls.normalize_text(text),
+            "params": cls._normalize_value(params)
+        }
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _normalize_value(cls, value: Any) -> Any:
+        """Reduce parameter values to a stable JSON-compatible form"""
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, dict):
+            return {str(k): cls._normalize_value(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._normalize_value(v) for v in value]
+        if hasattr(value, "__dataclass_fields__"):
+            return cls._normalize_value(vars(value))
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        """Whether key has an entry, without reading it or touching its recency"""
+        if not self.enabled:
+            return False
+        with self._lock:
+            return key in self._load_index()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio for key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                return None
+
+            path = self._path_for(key)
+            try:
+                data = path.read_bytes()
+                os.utime(path)
+            except OSError as e:
+                self.logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+                self._total_bytes -= index.pop(key)
+                return None
+            # put() never stores empty audio, so an empty or resized file was truncated or overwritten
+            if not data or len(data) != index[key]:
+                self.logger.warning(f"Dropping corrupt cache entry {key}")
+                self._remove(key)
+                return None
+
+            index.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store audio under key and evict old entries beyond the size bound"""
+        if not self.enabled or not data or len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            index = self._load_index()
+            try:
+                atomic_write_bytes(self._path_for(key), data)
+            except OSError as e:
+                self.logger.warning(f"Failed to write cache entry {key}: {e}")
+                return
+
+            self._total_bytes += len(data) - index.pop(key, 0)
+            index[key] = len(data)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            index = self._load_index()
+            for key in list(index):
+                self._remove(key)
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._index:
+            oldest = next(iter(self._index))
+            self._remove(oldest)
+
+    def _remove(self, key: str) -> None:
+        self._total_bytes -= self._index.pop(key, 0)
+        try:
+            self._path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to remove cache entry {key}: {e}")
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Build the in-memory LRU index from disk on first use"""
+        if self._index is not None:
+            return self._index
+
+        entries = []
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob(f"*/*{self.FILE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total_bytes = sum(self._index.values())
+        self._evict()
+        return self._index
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.FILE_SUFFIX}"
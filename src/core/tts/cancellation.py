@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Iterator, List, Optional
+from ..exception import SynthesisCancelled
+from ..utils import setup_logger
+
+class CancellationToken:
+    """
+    Cancellation signal shared by everything working on one synthesis job.
+
+    Blocking calls register a callback that aborts them (closing an HTTP
+    response, cancelling a gRPC call); code between calls checks the token
+    with raise_if_cancelled(). cancel() may be called from any thread.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.logger = setup_logger()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Signal cancellation and run every registered abort callback once"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self._run(callback)
+
+    def register(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run callback when the token is cancelled, or now if it already is.
+
+        Returns a function that unregisters the callback once the guarded
+        call has finished.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+        self._run(callback)
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise SynthesisCancelled("Synthesis was cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to timeout seconds, returning early (True) on cancellation"""
+        return self._event.wait(timeout)
+
+    def as_future(self) -> Future:
+        """A future that completes on cancellation, for use with concurrent.futures.wait"""
+        future = Future()
+        self.register(lambda: future.done() or future.set_result(None))
+        return future
+
+    def _unregister(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def _run(self, callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception as e:
+            self.logger.debug(f"Cancellation callback failed: {e}")
+
+class SynthesisHandle:
+    """
+    Audio from one running synthesis job, with a way to stop it.
+
+    Iterating yields audio exactly like the generator it wraps. cancel(),
+    safe from any thread, aborts in-flight requests and drops pending
+    chunks; the iterator then raises SynthesisCancelled.
+    """
+
+    def __init__(self, segments: Iterator[bytes], token: CancellationToken):
+        self._segments = segments
+        self.token = token
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+    def __iter__(self) -> "SynthesisHandle":
+        return self
+
+    def __next__(self) -> bytes:
+        self.token.raise_if_cancelled()
+        return next(self._segments)
+
+    def close(self) -> None:
+        """Release the underlying generator, recording usage for what was delivered"""
+        self._segments.close()
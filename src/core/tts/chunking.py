@@ -0,0 +1,133 @@
+import re
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional
+from .cancellation import CancellationToken
+
+DEFAULT_MAX_WORKERS = 4
+# Size of the first chunk of progressive synthesis; later chunks double up to the request limit
+FIRST_CHUNK_LIMIT = 200
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?…])\s+|(?<=[。！？])")
+
+def split_text(text: str, limit: int, measure: Callable[[str], int] = len,
+               first_limit: Optional[int] = None) -> List[str]:
+    """
+    Split text into chunks whose measure stays within limit.
+
+    Paragraph boundaries are preferred, then sentence boundaries, then
+    whitespace; a single word longer than the limit is split by characters.
+    Text that already fits is returned unchanged as a single chunk.
+
+    With first_limit, the first chunk is kept to about that size (at least
+    one sentence) and each later chunk may be twice as large as the one
+    before, up to limit, so the first audio comes back quickly even for
+    text that would fit in a single request.
+    """
+    if measure(text) <= min(limit, first_limit or limit):
+        return [text]
+
+    unit_limit = min(limit, first_limit or limit)
+    units = []
+    for paragraph in PARAGRAPH_BREAK.split(text.strip()):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if measure(paragraph) <= unit_limit:
+            units.append(("\n\n", paragraph))
+            continue
+        for i, sentence in enumerate(s for s in SENTENCE_BREAK.split(paragraph) if s):
+            sep = "\n\n" if i == 0 else " "
+            for j, piece in enumerate(_split_sentence(sentence, limit, measure)):
+                units.append((sep if j == 0 else " ", piece))
+
+    chunks: List[str] = []
+    current = ""
+    for sep, piece in units:
+        cap = min(limit, first_limit * 2 ** len(chunks)) if first_limit else limit
+        candidate = f"{current}{sep}{piece}" if current else piece
+        if not current or measure(candidate) <= cap:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _split_sentence(sentence: str, limit: int, measure: Callable[[str], int]) -> List[str]:
+    """Break an over-long sentence at whitespace, hard-splitting over-long words"""
+    if measure(sentence) <= limit:
+        return [sentence]
+
+    pieces = []
+    for word in sentence.split():
+        if measure(word) <= limit:
+            pieces.append(word)
+            continue
+        current = ""
+        for char in word:
+            if current and measure(current + char) > limit:
+                pieces.append(current)
+                current = ""
+            current += char
+        if current:
+            pieces.append(current)
+    return pieces
+
+class ChunkedSynthesizer:
+    """
+    Synthesizes chunks of long text in parallel and yields the audio in order.
+
+    Every call shares one pool of max_workers threads, started on first use,
+    so concurrent documents queue behind each other instead of each getting
+    a pool of its own.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tts-chunk")
+            return self._executor
+
+    def iter_synthesize(
+        self,
+        chunks: Iterable[str],
+        synth: Callable[[str], bytes],
+        prefetch: Optional[int] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[bytes]:
+        """
+        Yield synthesized chunks in order as soon as each one is ready.
+
+        At most prefetch chunks (default max_workers) are in flight or finished
+        but not yet consumed, so a slow consumer applies backpressure instead of
+        the whole document being synthesized ahead of playback. Closing the
+        generator cancels chunks that have not started, and so does cancelling
+        cancel_token, which also stops the wait for the chunk in progress.
+        """
+        window = max(1, prefetch or self.max_workers)
+        executor = self._pool()
+        remaining = iter(chunks)
+        pending = deque(executor.submit(synth, chunk) for chunk in islice(remaining, window))
+        cancelled = cancel_token.as_future() if cancel_token else None
+        try:
+            while pending:
+                if cancelled is not None:
+                    wait([pending[0], cancelled], return_when=FIRST_COMPLETED)
+                    cancel_token.raise_if_cancelled()
+                audio = pending.popleft().result()
+                for chunk in islice(remaining, 1):
+                    pending.append(executor.submit(synth, chunk))
+                yield audio
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from ..exception import ElevenLabsAPIError
+from ..utils import setup_logger
+from .retry import google_errors
+from .service_types import TTSService
+
+# (initial, maximum) in-flight requests; ElevenLabs plans allow 2 to 15 concurrent requests
+DEFAULT_CONCURRENCY: Dict[TTSService, Tuple[int, int]] = {
+    TTSService.GOOGLE: (8, 64),
+    TTSService.ELEVENLABS: (2, 15)
+}
+# Latency jitter below this many seconds never counts as instability
+LATENCY_SLACK = 0.01
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error is the provider saying it is over its rate or concurrency limit"""
+    while error is not None:
+        if isinstance(error, google_errors("ResourceExhausted")):
+            return True
+        if isinstance(error, ElevenLabsAPIError) and error.status_code == 429:
+            return True
+        error = error.__cause__
+    return False
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on in-flight requests to one provider account.
+
+    Each success with latency within latency_tolerance times the running
+    average adds about one slot per window of requests (limit += 1 / limit).
+    A 429 or RESOURCE_EXHAUSTED multiplies the limit by backoff, at most once
+    per average latency, so a burst of rejections from the same window only
+    counts once. Slower responses hold the limit where it is. Threads take
+    slots with slot() and asyncio tasks with aslot(); both draw on the same
+    limit.
+    """
+
+    _instances: Dict[Tuple[TTSService, Optional[str]], "AdaptiveConcurrencyLimiter"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.logger = setup_logger()
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._in_flight = 0
+        self._avg_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @classmethod
+    def for_service(cls, service: TTSService, key: Optional[str] = None) -> "AdaptiveConcurrencyLimiter":
+        """Return the shared limiter for a service account, creating it on first use"""
+        with cls._instances_lock:
+            limiter = cls._instances.get((service, key))
+            if limiter is None:
+                initial, max_limit = DEFAULT_CONCURRENCY.get(service, (4, 64))
+                limiter = cls(initial=initial, max_limit=max_limit)
+                cls._instances[(service, key)] = limiter
+            return limiter
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def metrics(self) -> Dict[str, float]:
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "avg_latency": self._avg_latency or 0.0
+            }
+
+    @contextmanager
+    def slot(self, record_latency: bool = True) -> Iterator[None]:
+        """
+        Hold one in-flight slot for the duration of a request.
+
+        Waits while the account is at its limit. Overload errors raised inside
+        the block shrink the limit; successes feed the latency average, unless
+        record_latency is off for long-lived calls such as streams.
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._release(overloaded=is_overload_error(e))
+            raise
+        else:
+            self._release(latency=time.monotonic() - started if record_latency else None)
+
+    @asynccontextmanager
+    async def aslot(self, record_latency: bool = True) -> AsyncIterator[None]:
+        """slot() for asyncio tasks: waits on the event loop instead of blocking it"""
+        while True:
+            with self._condition:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    break
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._release(overloaded=is_overload_error(e))
+            raise
+        else:
+            self._release(latency=time.monotonic() - started if record_latency else None)
+
+    def _release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            previous = self.limit
+            if overloaded:
+                self._decrease()
+            elif latency is not None:
+                self._on_success(latency)
+            if self.limit != previous:
+                self.logger.debug(f"Concurrency limit {previous} -> {self.limit}")
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        # Waiting tasks re-check the limit themselves, like threads woken by notify_all
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # The waiter's event loop has already closed
+
+    def _on_success(self, latency: float) -> None:
+        if self._avg_latency is None:
+            self._avg_latency = latency
+        stable = latency <= self._avg_latency * self.latency_tolerance + LATENCY_SLACK
+        self._avg_latency += self.smoothing * (latency - self._avg_latency)
+        if stable:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < (self._avg_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(self.min_limit, self._limit * self.backoff)
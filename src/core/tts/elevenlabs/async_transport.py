@@ -0,0 +1,67 @@
+from typing import Optional
+from .transport import DEFAULT_BASE_URL, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+
+DEFAULT_ASYNC_POOL_SIZE = 100
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "The async ElevenLabs engine needs the httpx package. Install it with `pip install httpx`."
+        ) from e
+    return httpx
+
+class AsyncElevenLabsTransport:
+    """
+    Pooled keep-alive asyncio HTTP client for a single ElevenLabs API key.
+
+    The async counterpart of ElevenLabsTransport, built on httpx. httpx is an
+    optional dependency and is only imported when an instance is created.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        pool_size: int = DEFAULT_ASYNC_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT
+    ):
+        self.httpx = _import_httpx()
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.client = self.httpx.AsyncClient(
+            headers={
+                "xi-api-key": api_key,
+                "Accept-Encoding": "gzip, deflate"
+            },
+            timeout=self.httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=self.httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    async def request(self, method: str, path: str, timeout: Optional[float] = None, **kwargs):
+        """
+        Send a request to a path relative to the API base URL.
+
+        timeout is the seconds left before the caller's deadline; it caps the
+        client's connect and read timeouts rather than replacing them.
+        """
+        url = path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+        if timeout is not None:
+            connect_timeout, read_timeout = self.timeout
+            kwargs["timeout"] = self.httpx.Timeout(
+                min(read_timeout, timeout), connect=min(connect_timeout, timeout)
+            )
+        return await self.client.request(method, url, **kwargs)
+
+    async def get(self, path: str, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
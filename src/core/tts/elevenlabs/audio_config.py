@@ -1,8 +1,17 @@
 import requests
-from typing import Dict, Optional, Union, List
+from typing import Dict, Iterator, Optional, Union, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from .voice import ElevenLabsVoiceManager
+from .transport import ElevenLabsTransport
+from ..rate_limit import RateLimiter
+from ..concurrency import AdaptiveConcurrencyLimiter
+from ..retry import Retrier, RetryPolicy
+from ..cancellation import CancellationToken
+from ...exception import ElevenLabsAPIError, SynthesisCancelled
+from ..service_types import TTSService
+
+STREAM_CHUNK_SIZE = 4096
 
 class ElevenLabsModel(str, Enum):
     """Supported ElevenLabs models"""
@@ -31,56 +40,177 @@ class ElevenLabsAudioConfig:
     
     API_URL = "https://api.elevenlabs.io/v1"
     
-    def __init__(self, api_key):
+    MODEL_CHAR_LIMITS = {
+        ElevenLabsModel.MULTILINGUAL_V2: 10000,
+        ElevenLabsModel.TURBO_V2: 30000
+    }
+    DEFAULT_CHAR_LIMIT = 10000
+    
+    def __init__(self, api_key, transport: Optional[ElevenLabsTransport] = None,
+                 voice_manager: Optional[ElevenLabsVoiceManager] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
         self.api_key = api_key
-        self.voice_manager = ElevenLabsVoiceManager(api_key)
+        self.transport = transport or ElevenLabsTransport.for_api_key(api_key)
+        self.voice_manager = voice_manager or ElevenLabsVoiceManager(api_key, transport=self.transport)
+        self.rate_limiter = rate_limiter or RateLimiter.for_service(TTSService.ELEVENLABS, api_key)
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter.for_service(TTSService.ELEVENLABS, api_key)
+        self.retrier = Retrier(retry_policy)
 
     def generate_to_memory(
         self,
         text: str,
         voice_data: Optional[Union[Dict, ElevenLabsVoiceParams]] = None,
-        audio_format: Union[str, ElevenLabsAudioFormat] = ElevenLabsAudioFormat.MP3
+        audio_format: Union[str, ElevenLabsAudioFormat] = ElevenLabsAudioFormat.MP3,
+        cancel_token: Optional[CancellationToken] = None
     ) -> bytes:
         """Generate speech from ElevenLabs API and return audio bytes."""
         try:
-            fmt = self._validate_format(audio_format)
-            voice_params = self._prepare_voice_params(voice_data)
-            model = voice_data.get("model", ElevenLabsModel.MULTILINGUAL_V2.value)
-            
-            headers = {
-                "xi-api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
+            endpoint, params, body = self.build_request(text, voice_data, audio_format)
+            return self.retrier.call(
+                lambda timeout, token: self._post(endpoint, params, body, len(text), timeout, token),
+                cancel_token=cancel_token
+            )
 
-            body = {
-                "text": text,
-                "model_id": model,
-                "voice_settings": {
-                    "stability": self._validate_range(voice_params.stability, "stability", 0, 1),
-                    "similarity_boost": self._validate_range(voice_params.similarity_boost, "similarity_boost", 0, 1),
-                    "speaker_boost": bool(voice_params.speaker_boost),
-                }
-            }
+        except (requests.RequestException, ElevenLabsAPIError, TimeoutError) as e:
+            # The API error stays reachable as __cause__ for status-code checks
+            raise RuntimeError(f"ElevenLabs TTS generation failed: {str(e)}") from e
 
-            if voice_params.style is not None:
-                body["voice_settings"]["style"] = self._validate_range(voice_params.style, "style", 0, 1)
-            if voice_params.speed is not None:
-                body["voice_settings"]["speed"] = self._validate_range(voice_params.speed, "speed", 0.5, 2.0)
+    def stream(
+        self,
+        text: str,
+        voice_data: Optional[Union[Dict, ElevenLabsVoiceParams]] = None,
+        audio_format: Union[str, ElevenLabsAudioFormat] = ElevenLabsAudioFormat.MP3,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[bytes]:
+        """
+        Generate speech via the streaming endpoint, yielding audio bytes as they arrive.
 
-            endpoint = f"{self.API_URL}/text-to-speech/{voice_params.voice_id}"
-            params = {"audio_format": fmt.value.lower()}
+        Cancelling cancel_token closes the response, aborting the HTTP request.
+        """
+        endpoint, params, body = self.build_request(text, voice_data, audio_format)
 
-            response = requests.post(
-                url=endpoint,
-                headers=headers,
+        def open_stream(timeout: float) -> requests.Response:
+            self.rate_limiter.acquire(len(text))
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            response = self.transport.post(
+                f"{endpoint}/stream",
                 params=params,
-                json=body
+                json=body,
+                stream=True,
+                timeout=self.transport.timeout_within(timeout)
             )
-            response.raise_for_status()
-            return response.content
+            if not response.ok:
+                error = ElevenLabsAPIError.from_response(response)
+                response.close()
+                raise error
+            return response
 
-        except requests.RequestException as e:
-            raise RuntimeError(f"ElevenLabs TTS generation failed: {str(e)}") from e
+        unregister = lambda: None
+        try:
+            # Only opening the stream is retried; once audio has been yielded it can't be taken back
+            with self.concurrency.slot(record_latency=False), \
+                    self.retrier.call(lambda timeout, _: open_stream(timeout), hedge=False,
+                                      cancel_token=cancel_token) as response:
+                if cancel_token:
+                    unregister = cancel_token.register(response.close)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if cancel_token:
+                        cancel_token.raise_if_cancelled()
+                    if chunk:
+                        yield chunk
+                # A response closed by cancel() can end quietly instead of raising
+                if cancel_token:
+                    cancel_token.raise_if_cancelled()
+
+        except SynthesisCancelled:
+            raise
+        except Exception as e:
+            if cancel_token and cancel_token.cancelled:
+                raise SynthesisCancelled("ElevenLabs stream was cancelled") from e
+            if isinstance(e, (requests.RequestException, TimeoutError)):
+                raise RuntimeError(f"ElevenLabs TTS streaming failed: {str(e)}") from e
+            raise
+        finally:
+            unregister()
+
+    def _post(
+        self,
+        endpoint: str,
+        params: Dict,
+        body: Dict,
+        chars: int,
+        timeout: float,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> bytes:
+        """
+        One synthesis attempt, paced by the rate limiter and bounded by the concurrency limiter.
+
+        A cancelled token stops the request from being sent, or closes the
+        response once it has started arriving. requests can't abort a request
+        still waiting for its response headers; that one runs to its timeout
+        and its audio is discarded.
+        """
+        self.rate_limiter.acquire(chars)
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        unregister = lambda: None
+        try:
+            with self.concurrency.slot():
+                response = self.transport.post(
+                    endpoint,
+                    params=params,
+                    json=body,
+                    stream=cancel_token is not None,
+                    timeout=self.transport.timeout_within(timeout)
+                )
+                if not response.ok:
+                    raise ElevenLabsAPIError.from_response(response)
+                if cancel_token:
+                    unregister = cancel_token.register(response.close)
+                audio = response.content
+        except Exception as e:
+            if cancel_token and cancel_token.cancelled:
+                raise SynthesisCancelled("ElevenLabs synthesis was cancelled") from e
+            raise
+        finally:
+            unregister()
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        return audio
+
+    def build_request(
+        self,
+        text: str,
+        voice_data: Optional[Union[Dict, ElevenLabsVoiceParams]],
+        audio_format: Union[str, ElevenLabsAudioFormat]
+    ) -> Tuple[str, Dict, Dict]:
+        """Validate parameters and build the (endpoint, query params, JSON body) of a request"""
+        fmt = self._validate_format(audio_format)
+        voice_params = self._prepare_voice_params(voice_data)
+        model = voice_data.get("model", ElevenLabsModel.MULTILINGUAL_V2.value)
+        
+        body = {
+            "text": text,
+            "model_id": model,
+            "voice_settings": {
+                "stability": self._validate_range(voice_params.stability, "stability", 0, 1),
+                "similarity_boost": self._validate_range(voice_params.similarity_boost, "similarity_boost", 0, 1),
+                "speaker_boost": bool(voice_params.speaker_boost),
+            }
+        }
+
+        if voice_params.style is not None:
+            body["voice_settings"]["style"] = self._validate_range(voice_params.style, "style", 0, 1)
+        if voice_params.speed is not None:
+            body["voice_settings"]["speed"] = self._validate_range(voice_params.speed, "speed", 0.5, 2.0)
+
+        endpoint = f"/text-to-speech/{voice_params.voice_id}"
+        params = {"audio_format": fmt.value.lower()}
+        return endpoint, params, body
 
     def _prepare_voice_params(
         self, voice_data: Optional[Union[Dict, ElevenLabsVoiceParams]]
@@ -101,6 +231,14 @@ class ElevenLabsAudioConfig:
         else:
             return ElevenLabsVoiceParams()
         
+    @classmethod
+    def get_char_limit(cls, model: Optional[Union[str, ElevenLabsModel]]) -> int:
+        """Per-request character limit for a model"""
+        try:
+            return cls.MODEL_CHAR_LIMITS[ElevenLabsModel(model)]
+        except ValueError:
+            return cls.DEFAULT_CHAR_LIMIT
+        
     @staticmethod
     def _validate_model(model: Union[str, ElevenLabsModel]) -> ElevenLabsModel:
         """Validate and return normalized model enum"""
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Union, List, Tuple
+from typing import Dict, Iterator, Optional, Union, List, Tuple
 from ..base_tts import BaseTTS
 from ...auth import AuthManager
 from core.tts.service_types import TTSService
@@ -6,15 +6,25 @@ from ...utils import setup_logger
 from .voice import ElevenLabsVoiceManager
 from .audio_config import ElevenLabsAudioConfig
 from .monitor import ElevenLabsUsageMonitor
+from .transport import ElevenLabsTransport
+from ..cache import SynthesisCache
+from ..chunking import ChunkedSynthesizer, FIRST_CHUNK_LIMIT, split_text
+from ..cancellation import CancellationToken
+from ..retry import RetryPolicy
+from ..audio_utils import join_audio
 
 class ElevenLabsTTS(BaseTTS):
     BASE_URL = "https://api.elevenlabs.io/v1"
     
-    def __init__(self, api_key: str, update_callback=None, auth_manager=None):
+    def __init__(self, api_key: str, update_callback=None, auth_manager=None,
+                 cache: Optional[SynthesisCache] = None, transport: Optional[ElevenLabsTransport] = None,
+                 chunker: Optional[ChunkedSynthesizer] = None, retry_policy: Optional[RetryPolicy] = None):
         self.auth_manager = auth_manager or AuthManager() 
         self.service_type = TTSService.ELEVENLABS
         self.logger = setup_logger()
         self.update_callback = update_callback
+        self.cache = cache or SynthesisCache.for_dir()
+        self.chunker = chunker or ChunkedSynthesizer()
         self.character_count = 0
         
         try:
@@ -23,11 +33,18 @@ class ElevenLabsTTS(BaseTTS):
             if not self.api_key:
                 raise RuntimeError("No API key provided for ElevenLabs")
             
-            self.voice_manager = ElevenLabsVoiceManager(self.api_key)
-            self.audio_config = ElevenLabsAudioConfig(self.api_key)
-            self.usage_monitor = ElevenLabsUsageMonitor(self.api_key)
-            
-            self.get_usage_stats()
+            self.transport = transport or ElevenLabsTransport.for_api_key(self.api_key)
+            self.voice_manager = ElevenLabsVoiceManager(self.api_key, transport=self.transport)
+            self.audio_config = ElevenLabsAudioConfig(
+                self.api_key,
+                transport=self.transport,
+                voice_manager=self.voice_manager,
+                retry_policy=retry_policy
+            )
+            # /v1/user is synced in the background; fresh stats reach update_callback when it lands
+            self.usage_monitor = ElevenLabsUsageMonitor(
+                self.api_key, transport=self.transport, on_sync=self._on_usage_synced
+            )
         except Exception as e:
             self.logger.error(f"Initialization failed: {str(e)}")
             raise RuntimeError(f"Could not initialize ElevenLabs TTS: {str(e)}")
@@ -52,30 +69,191 @@ class ElevenLabsTTS(BaseTTS):
         speaker_boost: Optional[bool] = False,
         **kwargs
     ) -> bytes:
-        char_count = len(text)
-        voice_data = {
-            "voice_id": voice_data.get('voice_id' or "21m00Tcm4TlvDq8ikWAM"),
-            "model": voice_data.get("model", "eleven_monolingual_v1"),
-            "stability": stability,
-            "similarity_boost": similarity_boost,
-            "speed": speed,
-            "style": style,
-            "speaker_boost": speaker_boost,
+        parts = list(self.generate_chunks(
+            text,
+            voice_data=voice_data,
+            audio_format=audio_format,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            speed=speed,
+            style=style,
+            speaker_boost=speaker_boost,
             **kwargs
-        }
-        audio_content = self.audio_config.generate_to_memory(
-            text=text,
+        ))
+        return join_audio(parts, str(getattr(audio_format, "value", audio_format)))
+
+    def is_cached(
+        self,
+        text: str,
+        voice_data: Optional[Dict] = None,
+        audio_format: str = "MP3",
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        speed: Optional[float] = 1.0,
+        style: Optional[float] = 0.0,
+        speaker_boost: Optional[bool] = False,
+        **kwargs
+    ) -> bool:
+        voice_data = self._build_voice_data(
+            voice_data,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            speed=speed,
+            style=style,
+            speaker_boost=speaker_boost,
+            **kwargs
+        )
+        return self._cache_key(text, voice_data, str(getattr(audio_format, "value", audio_format))) in self.cache
+
+    def _cache_key(self, text: str, voice_data: Dict, fmt: str) -> str:
+        """Cache key of a generate_chunks request, given the merged voice data"""
+        return self.cache.make_key(self.service_type, text, voice_data=voice_data, audio_format=fmt.upper())
+
+    def generate_chunks(
+        self,
+        text: str,
+        voice_data: Optional[Dict] = None,
+        audio_format: str = "MP3",
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        speed: Optional[float] = 1.0,
+        style: Optional[float] = 0.0,
+        speaker_boost: Optional[bool] = False,
+        cancel_token: Optional[CancellationToken] = None,
+        **kwargs
+    ) -> Iterator[bytes]:
+        """
+        Yield the audio for text one synthesis chunk at a time, in order.
+
+        Text is split into a short first chunk and larger ones after it, up to
+        the model's character limit, and synthesized ahead of the consumer on
+        the chunker's pool. Usage is recorded for the chunks
+        actually delivered. Cancelling cancel_token drops pending chunks and
+        raises SynthesisCancelled.
+        """
+        fmt = str(getattr(audio_format, "value", audio_format))
+        voice_data = self._build_voice_data(
+            voice_data,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            speed=speed,
+            style=style,
+            speaker_boost=speaker_boost,
+            **kwargs
+        )
+        cache_key = self._cache_key(text, voice_data, fmt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Serving ElevenLabs synthesis from cache")
+            yield cached
+            return
+
+        def synthesize_chunk(chunk: str) -> bytes:
+            return self.audio_config.generate_to_memory(
+                text=chunk,
+                voice_data=voice_data,
+                audio_format=audio_format,
+                cancel_token=cancel_token
+            )
+
+        chunks = split_text(text, self.audio_config.get_char_limit(voice_data["model"]), first_limit=FIRST_CHUNK_LIMIT)
+        parts = []
+        delivered_chars = 0
+        try:
+            for chunk, audio in zip(chunks, self.chunker.iter_synthesize(chunks, synthesize_chunk, cancel_token=cancel_token)):
+                parts.append(audio)
+                delivered_chars += len(chunk)
+                yield audio
+            self.cache.put(cache_key, join_audio(parts, fmt))
+        finally:
+            self._record_usage(delivered_chars)
+
+    def stream_audio(
+        self,
+        text: str,
+        voice_data: Optional[Dict] = None,
+        audio_format: str = "MP3",
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        speed: Optional[float] = 1.0,
+        style: Optional[float] = 0.0,
+        speaker_boost: Optional[bool] = False,
+        cancel_token: Optional[CancellationToken] = None,
+        **kwargs
+    ) -> Iterator[bytes]:
+        """
+        Yield audio bytes from the streaming endpoint as they arrive.
+
+        Text over the model's character limit is streamed one chunk after
+        another. Usage is recorded once per request for every chunk whose
+        stream started, and complete results are stored in the cache.
+        Cancelling cancel_token aborts the HTTP request in progress.
+        """
+        fmt = str(getattr(audio_format, "value", audio_format))
+        voice_data = self._build_voice_data(
+            voice_data,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            speed=speed,
+            style=style,
+            speaker_boost=speaker_boost,
+            **kwargs
+        )
+        cache_key = self.cache.make_key(
+            self.service_type,
+            text,
             voice_data=voice_data,
-            audio_format=audio_format
+            audio_format=fmt.upper()
         )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Serving ElevenLabs stream from cache")
+            yield cached
+            return
+
+        parts = []
+        billed_chars = 0
+        try:
+            for chunk in split_text(text, self.audio_config.get_char_limit(voice_data["model"])):
+                chunk_parts = []
+                for data in self.audio_config.stream(
+                    chunk,
+                    voice_data=voice_data,
+                    audio_format=audio_format,
+                    cancel_token=cancel_token
+                ):
+                    if not chunk_parts:
+                        billed_chars += len(chunk)
+                    chunk_parts.append(data)
+                    yield data
+                parts.append(b"".join(chunk_parts))
+            self.cache.put(cache_key, join_audio(parts, fmt))
+        finally:
+            self._record_usage(billed_chars)
+
+    @staticmethod
+    def _build_voice_data(voice_data: Optional[Dict], **settings) -> Dict:
+        """Merge the selected voice with the voice settings sent to the API"""
+        voice_data = voice_data or {}
+        return {
+            "voice_id": voice_data.get('voice_id' or "21m00Tcm4TlvDq8ikWAM"),
+            "model": voice_data.get("model", "eleven_monolingual_v1"),
+            **settings
+        }
+
+    def _on_usage_synced(self, stats) -> None:
+        if self.update_callback:
+            self.update_callback(stats)
+
+    def _record_usage(self, char_count: int) -> None:
+        if not char_count:
+            return
         try:
             self.usage_monitor.update_usage(char_count)
             if self.update_callback:
                 self.update_callback(self.get_usage_stats())
         except Exception as e:
             self.logger.error(f"Failed to update usage: {e}")
-        
-        return audio_content
 
     def get_usage_stats(self):
         return self.usage_monitor.get_usage_stats()
@@ -0,0 +1,159 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from ..async_base import AsyncBaseTTS, DEFAULT_MAX_CONCURRENCY
+from ...auth import AuthManager
+from core.tts.service_types import TTSService
+from ...utils import setup_logger
+from .voice import ElevenLabsVoiceManager
+from .audio_config import ElevenLabsAudioConfig
+from .monitor import ElevenLabsUsageMonitor
+from .transport import ElevenLabsTransport
+from .async_transport import AsyncElevenLabsTransport
+from .elevenlabs import ElevenLabsTTS
+from ..cache import SynthesisCache
+from ..chunking import split_text
+from ..audio_utils import join_audio
+from ...exception import ElevenLabsAPIError
+
+class AsyncElevenLabsTTS(AsyncBaseTTS):
+    """
+    ElevenLabs TTS on an asyncio HTTP transport.
+
+    Synthesis goes through AsyncElevenLabsTransport under the same retry
+    policy (deadline and backoff, without hedging), rate limiter and adaptive
+    concurrency limit as ElevenLabsTTS, and fails with the same RuntimeError
+    wrapping an ElevenLabsAPIError. The voice library and usage monitor keep
+    using the shared blocking transport; they, the cache and usage
+    bookkeeping (update_callback included) run in worker threads so the
+    event loop never blocks on them.
+    """
+
+    def __init__(self, api_key: str, update_callback=None, auth_manager=None,
+                 cache: Optional[SynthesisCache] = None, transport: Optional[AsyncElevenLabsTransport] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        super().__init__(max_concurrency)
+        self.auth_manager = auth_manager or AuthManager()
+        self.service_type = TTSService.ELEVENLABS
+        self.logger = setup_logger()
+        self.update_callback = update_callback
+        self.cache = cache or SynthesisCache.for_dir()
+
+        try:
+            self.api_key = api_key or self.auth_manager.get_api_key(self.service_type)
+
+            if not self.api_key:
+                raise RuntimeError("No API key provided for ElevenLabs")
+
+            self.transport = transport or AsyncElevenLabsTransport(self.api_key, pool_size=max_concurrency)
+            sync_transport = ElevenLabsTransport.for_api_key(self.api_key)
+            self.voice_manager = ElevenLabsVoiceManager(self.api_key, transport=sync_transport)
+            self.audio_config = ElevenLabsAudioConfig(
+                self.api_key,
+                transport=sync_transport,
+                voice_manager=self.voice_manager
+            )
+            self.usage_monitor = ElevenLabsUsageMonitor(
+                self.api_key, transport=sync_transport, on_sync=self._on_usage_synced
+            )
+        except ImportError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Initialization failed: {str(e)}")
+            raise RuntimeError(f"Could not initialize ElevenLabs TTS: {str(e)}")
+
+    async def aget_available_languages(self, model: Optional[str] = None, format: str = "both"):
+        return await asyncio.to_thread(self.voice_manager.get_available_languages, model, format)
+
+    async def aget_available_voices(self, language_code: Optional[str] = None) -> List[Dict]:
+        return await asyncio.to_thread(self.voice_manager.get_voices_for_language, language_code)
+
+    async def aget_usage_stats(self):
+        return await asyncio.to_thread(self.usage_monitor.get_usage_stats)
+
+    async def agenerate(
+        self,
+        text: str,
+        voice_data: Optional[Dict] = None,
+        audio_format: str = "MP3",
+        stability: float = 0.5,
+        similarity_boost: float = 0.75,
+        speed: Optional[float] = 1.0,
+        style: Optional[float] = 0.0,
+        speaker_boost: Optional[bool] = False,
+        **kwargs
+    ) -> bytes:
+        """
+        Synthesize text and return the audio.
+
+        Text over the model's character limit is split and the chunks are sent
+        concurrently, each one counted against the engine's concurrency limit.
+        """
+        fmt = str(getattr(audio_format, "value", audio_format))
+        voice_data = ElevenLabsTTS._build_voice_data(
+            voice_data,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            speed=speed,
+            style=style,
+            speaker_boost=speaker_boost,
+            **kwargs
+        )
+        cache_key = self.cache.make_key(
+            self.service_type,
+            text,
+            voice_data=voice_data,
+            audio_format=fmt.upper()
+        )
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is not None:
+            self.logger.debug("Serving ElevenLabs synthesis from cache")
+            return cached
+
+        chunks = split_text(text, self.audio_config.get_char_limit(voice_data["model"]))
+        requests = [self.audio_config.build_request(chunk, voice_data, audio_format) for chunk in chunks]
+        try:
+            parts = await asyncio.gather(*(
+                self._send(request, len(chunk)) for chunk, request in zip(chunks, requests)
+            ))
+        except (self.transport.httpx.HTTPError, ElevenLabsAPIError, TimeoutError) as e:
+            raise RuntimeError(f"ElevenLabs TTS generation failed: {str(e)}") from e
+
+        audio = join_audio(parts, fmt)
+        await asyncio.to_thread(self.cache.put, cache_key, audio)
+        await asyncio.to_thread(self._record_usage, len(text))
+        return audio
+
+    async def _send(self, request: Tuple[str, Dict, Dict], chars: int) -> bytes:
+        return await self.audio_config.retrier.acall(lambda timeout: self._attempt(request, chars, timeout))
+
+    async def _attempt(self, request: Tuple[str, Dict, Dict], chars: int, timeout: float) -> bytes:
+        """Wait for rate budget first, so throttled requests don't hold a concurrency slot"""
+        await self.audio_config.rate_limiter.aacquire(chars)
+        return await self._bounded(self._synthesize, *request, timeout)
+
+    async def _synthesize(self, endpoint: str, params: Dict, body: Dict, timeout: float) -> bytes:
+        async with self.audio_config.concurrency.aslot():
+            response = await self.transport.post(endpoint, params=params, json=body, timeout=timeout)
+            if response.is_error:
+                raise ElevenLabsAPIError.from_response(response)
+        return response.content
+
+    def _on_usage_synced(self, stats) -> None:
+        if self.update_callback:
+            self.update_callback(stats)
+
+    def _record_usage(self, char_count: int) -> None:
+        if not char_count:
+            return
+        try:
+            self.usage_monitor.update_usage(char_count)
+            if self.update_callback:
+                self.update_callback(self.usage_monitor.get_usage_stats())
+        except Exception as e:
+            self.logger.error(f"Failed to update usage: {e}")
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def get_service_name(self) -> TTSService:
+        return TTSService.ELEVENLABS
@@ -1,75 +1,67 @@
 from datetime import datetime
-from typing import Dict, Union, Optional
-import json
+from typing import Callable, Dict, Union, Optional
 import logging
-import requests
+import threading
+import time
 from pathlib import Path
+from .transport import ElevenLabsTransport
+from ..usage_ledger import UsageLedger, USAGE_FLUSH_INTERVAL
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-ELEVENLABS_USAGE_FILE = "elevenlabs_usage.json"
-ELEVENLABS_API_URL = "https://api.elevenlabs.io/v1/user"
+ELEVENLABS_USAGE_FILE = Path.home() / ".tts_app" / "elevenlabs_usage.json"
+# Where earlier versions kept the ledger, relative to the working directory
+LEGACY_ELEVENLABS_USAGE_FILE = Path("elevenlabs_usage.json")
+ELEVENLABS_USER_PATH = "/user"
+API_SNAPSHOT_TTL = 300.0
+SYNC_COALESCE_DELAY = 2.0
 
 class ElevenLabsUsageMonitor:
-    """Tracks both local and API usage for ElevenLabs"""
+    """
+    Tracks both local and API usage for ElevenLabs.
+
+    API usage is served from a cached /v1/user snapshot. Each synthesis adds its
+    characters to the snapshot locally and asks a background worker to resync;
+    requests arriving within the coalescing window share a single sync. Local
+    counts go to the shared UsageLedger in the app data directory, which writes
+    them behind, so synthesis does no file I/O; a ledger an older version left
+    in the working directory is merged into it once. Nothing here blocks on the
+    network unless asked to: on_sync receives fresh stats after each
+    background sync.
+    """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: Optional[ElevenLabsTransport] = None,
+                 snapshot_ttl: float = API_SNAPSHOT_TTL, coalesce_delay: float = SYNC_COALESCE_DELAY,
+                 usage_file: Optional[Union[str, Path]] = None,
+                 on_sync: Optional[Callable[[Dict[str, Union[int, str]]], None]] = None):
         self.api_key = api_key
-        self.usage_file = Path(ELEVENLABS_USAGE_FILE)
+        self.transport = transport or ElevenLabsTransport.for_api_key(api_key)
+        self.ledger = UsageLedger.for_file(
+            usage_file or ELEVENLABS_USAGE_FILE, USAGE_FLUSH_INTERVAL,
+            legacy_path=None if usage_file else LEGACY_ELEVENLABS_USAGE_FILE
+        )
+        self.usage_file = self.ledger.path
         self.local_char_count = 0
+        self.snapshot_ttl = snapshot_ttl
+        self.coalesce_delay = coalesce_delay
+        self.on_sync = on_sync
+        self._lock = threading.Lock()
+        self._api_snapshot: Optional[Dict[str, int]] = None
+        self._synced_at: Optional[float] = None
+        self._last_sync_iso: Optional[str] = None
+        self._sync_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: Optional[threading.Thread] = None
 
     def _get_current_month(self) -> str:
         """Get current month in YYYY-MM format"""
         return datetime.now().strftime("%Y-%m")
 
-    def _load_usage_data(self) -> Dict[str, Union[str, int]]:
-        """Load or initialize usage data"""
-        if not self.usage_file.exists():
-            return {
-                'month': self._get_current_month(),
-                'used': 0,
-                'api_sync_time': None
-            }
-        
-        try:
-            with open(self.usage_file, 'r') as f:
-                data = json.load(f)
-            
-            if data.get('month') != self._get_current_month():
-                data = {
-                    'month': self._get_current_month(),
-                    'used': 0,
-                    'api_sync_time': None
-                }
-                self._save_usage_data(data)
-                
-            return data
-        except Exception as e:
-            logger.error(f"Error loading usage data: {e}")
-            return {
-                'month': self._get_current_month(),
-                'used': 0,
-                'api_sync_time': None
-            }
-
-    def _save_usage_data(self, data: Dict) -> None:
-        """Save usage data atomically"""
-        try:
-            temp_file = self.usage_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            temp_file.replace(self.usage_file)
-        except Exception as e:
-            logger.error(f"Failed to save usage data: {e}")
-
     def _get_api_usage(self) -> Optional[Dict]:
         """Fetch current usage from ElevenLabs API"""
         try:
-            response = requests.get(
-                ELEVENLABS_API_URL,
-                headers={"xi-api-key": self.api_key}
-            )
+            response = self.transport.get(ELEVENLABS_USER_PATH)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -77,44 +69,98 @@ class ElevenLabsUsageMonitor:
             return None
 
     def update_usage(self, char_count: int) -> None:
-        """Update local usage tracking"""
-        data = self._load_usage_data()
-        data['used'] = data.get('used', 0) + char_count
+        """Update local usage tracking and schedule an API resync off the hot path"""
+        self.ledger.add(char_count)
         self.local_char_count += char_count
+        with self._lock:
+            if self._api_snapshot is not None:
+                self._api_snapshot['api_used'] += char_count
+        self.request_sync()
+
+    def sync(self) -> bool:
+        """Fetch /v1/user now and replace the cached snapshot"""
         api_data = self._get_api_usage()
-        if api_data:
-            subscription = api_data.get('subscription', {})
-            data['api_used'] = subscription.get('character_count', 0)
-            data['api_limit'] = subscription.get('character_limit', 0)
-            data['api_sync_time'] = datetime.now().isoformat()
-        self._save_usage_data(data)
-
-    def get_usage_stats(self) -> Dict[str, Union[int, str]]:
-        """Get combined local + API usage stats"""
-        data = self._load_usage_data()
-        api_data = self._get_api_usage()
-        
+        if not api_data:
+            return False
+
+        subscription = api_data.get('subscription', {})
+        with self._lock:
+            self._api_snapshot = {
+                'api_used': subscription.get('character_count', 0),
+                'api_limit': subscription.get('character_limit', 0)
+            }
+            self._synced_at = time.monotonic()
+            self._last_sync_iso = datetime.now().isoformat()
+        self.ledger.annotate(api_sync_time=self._last_sync_iso)
+        return True
+
+    def request_sync(self) -> None:
+        """Ask the background worker for a sync; bursts collapse into one request"""
+        if self._stopped.is_set():
+            return
+        self._ensure_worker()
+        self._sync_requested.set()
+
+    def close(self) -> None:
+        """Stop the background sync worker"""
+        self._stopped.set()
+        self._sync_requested.set()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._sync_loop,
+                    name="elevenlabs-usage-sync",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _sync_loop(self) -> None:
+        while not self._stopped.is_set():
+            self._sync_requested.wait()
+            if self._stopped.wait(self.coalesce_delay):
+                break
+            self._sync_requested.clear()
+            try:
+                if self.sync() and self.on_sync:
+                    self.on_sync(self.get_usage_stats())
+            except Exception as e:
+                logger.error(f"Background usage sync failed: {e}")
+
+    def _snapshot_is_stale(self) -> bool:
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.snapshot_ttl
+
+    def get_usage_stats(self, refresh: bool = False) -> Dict[str, Union[int, str]]:
+        """
+        Get combined local + API usage stats.
+
+        Only blocks on the network when refresh is set. Otherwise a missing or
+        stale snapshot triggers a background sync and the stats known so far
+        are returned; on_sync gets the fresh ones.
+        """
+        if refresh:
+            self.sync()
+        elif self._snapshot_is_stale():
+            self.request_sync()
+
+        data = self.ledger.data()
         stats = {
-            'month': data.get('month', self._get_current_month()),
-            'used': data.get('used', 0),
+            'month': data['month'],
+            'used': data['used'],
             'source': 'local',
             'last_sync': data.get('api_sync_time')
         }
-        if api_data:
-            subscription = api_data.get('subscription', {})
-            stats.update({
-                'api_used': subscription.get('character_count', 0),
-                'api_limit': subscription.get('character_limit', 0),
-                'source': 'api',
-                'last_sync': datetime.now().isoformat()
-            })
-            data['api_sync_time'] = stats['last_sync']
-            self._save_usage_data(data)
+        with self._lock:
+            if self._api_snapshot is not None:
+                stats.update(self._api_snapshot)
+                stats['source'] = 'api'
+                stats['last_sync'] = self._last_sync_iso
         return stats
 
     def print_usage_report(self) -> None:
         """Print formatted usage summary"""
-        stats = self.get_usage_stats()
+        stats = self.get_usage_stats(refresh=True)
         
         print(f"\n📊 ElevenLabs Usage for {stats['month']}")
         print(f"• Source: {stats['source'].upper()} data")
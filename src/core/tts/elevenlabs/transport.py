@@ -0,0 +1,83 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple, Union
+
+DEFAULT_BASE_URL = "https://api.elevenlabs.io/v1"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+class ElevenLabsTransport:
+    """
+    Pooled keep-alive HTTP session for a single ElevenLabs API key.
+
+    One instance is shared by the audio config, voice manager and usage monitor
+    so every call reuses warm TCP+TLS connections. All requests get a
+    (connect, read) timeout unless the caller passes its own.
+    """
+
+    _instances: Dict[Tuple[str, str], "ElevenLabsTransport"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "xi-api-key": api_key,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+
+    @classmethod
+    def for_api_key(cls, api_key: str, base_url: str = DEFAULT_BASE_URL, **config) -> "ElevenLabsTransport":
+        """Return the shared transport for an API key, creating it on first use"""
+        key = (api_key, base_url.rstrip("/"))
+        with cls._instances_lock:
+            transport = cls._instances.get(key)
+            if transport is None:
+                transport = cls(api_key, base_url=base_url, **config)
+                cls._instances[key] = transport
+            return transport
+
+    def timeout_within(self, remaining: float) -> Tuple[float, float]:
+        """The (connect, read) timeout, neither longer than the remaining seconds of a deadline"""
+        return min(self.timeout[0], remaining), min(self.timeout[1], remaining)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        **kwargs
+    ) -> requests.Response:
+        """Send a request to a path relative to the API base URL"""
+        url = path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+        return self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections and drop this transport from the registry"""
+        with self._instances_lock:
+            if self._instances.get((self.api_key, self.base_url)) is self:
+                del self._instances[(self.api_key, self.base_url)]
+        self.session.close()
@@ -1,8 +1,12 @@
+import threading
+import time
 import requests
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Callable, Dict, List, Optional, Union, Tuple
 from core.tts.base_voice import BaseVoiceManager, BaseVoiceDetails
+from core.tts.language_names import language_name
+from core.utils import setup_logger
 from ...exception.elevenlabs import ElevenLabsAPIError
-from langcodes import Language
+from .transport import ElevenLabsTransport
 
 class ElevenLabsVoiceDetails(BaseVoiceDetails):
     """ElevenLabs-specific voice details formatting"""
@@ -35,26 +39,172 @@ class ElevenLabsVoiceDetails(BaseVoiceDetails):
 
         return " | ".join(parts) if parts else "No voice details available"
     
+class ElevenLabsVoiceLibrary:
+    """
+    In-memory index over the account's ElevenLabs voice list.
+
+    The list is fetched once and indexed by language code, model_id and
+    category (premade/cloned). After the TTL expires the next lookup revalidates
+    through the fetcher, which returns None when the server reports the list as
+    unchanged; in that case the existing index is kept and the TTL restarts.
+    """
+
+    DEFAULT_TTL = 600.0
+    ALL_MODELS = "ALL"
+
+    def __init__(self, fetcher: Callable[[], Optional[List[Dict]]], language_namer: Callable[[str], str],
+                 ttl: float = DEFAULT_TTL):
+        self.fetcher = fetcher
+        self.language_namer = language_namer
+        self.ttl = ttl
+        self.logger = setup_logger()
+        self._lock = threading.Lock()
+        self._fetched_at: Optional[float] = None
+        self._voices_by_id: Dict[str, Dict] = {}
+        self._voices_by_language: Dict[Tuple[str, Optional[str]], List[Dict]] = {}
+        self._voice_ids_by_model: Dict[str, List[str]] = {}
+        self._languages_by_model: Dict[str, List[Tuple[str, str]]] = {}
+
+    def languages(self, model: Optional[str] = None) -> List[Tuple[str, str]]:
+        """(code, name) pairs sorted by name, optionally restricted to one model"""
+        self._ensure_fresh()
+        return list(self._languages_by_model.get(model or self.ALL_MODELS, []))
+
+    def voices_for_language(self, language_code: str, voice_type: Optional[str] = None) -> List[Dict]:
+        """Voices verified for a base language code, optionally 'premade' or 'cloned' only"""
+        self._ensure_fresh()
+        return list(self._voices_by_language.get((language_code.lower(), voice_type), []))
+
+    def voices_for_model(self, model: str) -> List[Dict]:
+        """Raw voice entries with at least one verified language on the model"""
+        self._ensure_fresh()
+        return [self._voices_by_id[voice_id] for voice_id in self._voice_ids_by_model.get(model, [])]
+
+    def get_voice(self, voice_id: str) -> Optional[Dict]:
+        """Raw voice entry by voice_id"""
+        self._ensure_fresh()
+        return self._voices_by_id.get(voice_id)
+
+    def invalidate(self) -> None:
+        """Revalidate through the fetcher on the next lookup"""
+        with self._lock:
+            # Expired rather than forgotten, so a failed revalidation still serves the index
+            if self._fetched_at is not None:
+                self._fetched_at = float("-inf")
+
+    def _is_fresh(self) -> bool:
+        return self._fetched_at is not None and time.monotonic() - self._fetched_at < self.ttl
+
+    def _ensure_fresh(self) -> None:
+        if self._is_fresh():
+            return
+
+        with self._lock:
+            if self._is_fresh():
+                return
+            try:
+                voices = self.fetcher()
+            except ElevenLabsAPIError as e:
+                if self._fetched_at is None:
+                    raise
+                self.logger.warning(f"Voice list refresh failed, serving cached voices: {e}")
+                voices = None
+
+            if voices is not None:
+                self._build(voices)
+            self._fetched_at = time.monotonic()
+
+    def _build(self, voices: List[Dict]) -> None:
+        voices_by_id: Dict[str, Dict] = {}
+        voices_by_language: Dict[Tuple[str, Optional[str]], List[Dict]] = {}
+        voice_ids_by_model: Dict[str, List[str]] = {}
+        codes_by_model: Dict[str, set] = {self.ALL_MODELS: set()}
+        language_names: Dict[str, Optional[str]] = {}
+
+        for voice in voices:
+            voice_id = voice['voice_id']
+            voices_by_id[voice_id] = voice
+            voice_type = 'premade' if voice.get('category') == 'premade' else 'cloned'
+            seen_languages = set()
+
+            for lang_entry in voice.get("verified_languages", []):
+                raw_lang = lang_entry.get("language") or ""
+                lang_code = raw_lang.split("-")[0].lower()
+                voice_model = lang_entry.get("model_id")
+
+                if voice_model:
+                    model_ids = voice_ids_by_model.setdefault(voice_model, [])
+                    if not model_ids or model_ids[-1] != voice_id:
+                        model_ids.append(voice_id)
+
+                if not lang_code:
+                    continue
+
+                if lang_code not in language_names:
+                    try:
+                        language_names[lang_code] = self.language_namer(lang_code)
+                    except Exception:
+                        language_names[lang_code] = None
+                if language_names[lang_code]:
+                    codes_by_model[self.ALL_MODELS].add(lang_code)
+                    if voice_model:
+                        codes_by_model.setdefault(voice_model, set()).add(lang_code)
+
+                if lang_code in seen_languages:
+                    continue
+                seen_languages.add(lang_code)
+
+                voice_data = {
+                    'id': voice_id,
+                    'name': voice['name'],
+                    'gender': voice.get('labels', {}).get('gender', 'unknown'),
+                    'language': lang_code,
+                    'accent': lang_entry.get("accent", 'standard'),
+                    'locale': lang_entry.get("locale", None),
+                    'type': voice_type,
+                    'settings': voice.get('settings', {}),
+                    'preview_url': lang_entry.get("preview_url", voice.get("preview_url"))
+                }
+                voices_by_language.setdefault((lang_code, None), []).append(voice_data)
+                voices_by_language.setdefault((lang_code, voice_type), []).append(voice_data)
+
+        self._voices_by_id = voices_by_id
+        self._voices_by_language = voices_by_language
+        self._voice_ids_by_model = voice_ids_by_model
+        self._languages_by_model = {
+            model: sorted(((code, language_names[code]) for code in codes), key=lambda x: x[1])
+            for model, codes in codes_by_model.items()
+        }
+
 class ElevenLabsVoiceManager(BaseVoiceManager):
     """Handles all voice and language operations for ElevenLabs"""
     
     BASE_URL = "https://api.elevenlabs.io/v1"
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, library: Optional[ElevenLabsVoiceLibrary] = None,
+                 transport: Optional[ElevenLabsTransport] = None):
         super().__init__() 
         self.api_key = api_key
-        self._voices_cache = None
-        self._language_cache = {}
+        self.transport = transport or ElevenLabsTransport.for_api_key(api_key)
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self.library = library or ElevenLabsVoiceLibrary(self._fetch_voices, self.get_language_name)
 
+    def _fetch_voices(self) -> Optional[List[Dict]]:
+        """Fetch voices from API, returning None if unchanged since the last fetch"""
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
 
-    def _fetch_voices(self) -> List[Dict]:
-        """Fetch and cache voices from API"""
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/voices",
-                headers={"xi-api-key": self.api_key}
-            )
+            response = self.transport.get("/voices", headers=headers)
+            if response.status_code == 304:
+                return None
             response.raise_for_status()
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
             return response.json().get("voices", [])
         except requests.exceptions.RequestException as e:
             raise ElevenLabsAPIError(f"Voice fetch failed: {str(e)}")
@@ -66,34 +216,7 @@ class ElevenLabsVoiceManager(BaseVoiceManager):
             model: internal model ID like 'eleven_multilingual_v2'
             format: 'name', 'full', or 'both' (returns tuples of name only)
         """
-        cache_key = model or "ALL"
-        if cache_key in self._language_cache:
-            sorted_langs = self._language_cache[cache_key]
-        else:
-            voices = self._fetch_voices()
-            languages = set()
-            
-            for voice in voices:
-                verified = voice.get("verified_languages", [])
-                for lang_entry in verified:
-                    voice_model = lang_entry.get("model_id")
-                    if model and voice_model != model:
-                        continue
-
-                    raw_lang = lang_entry.get("language")
-                    if not raw_lang:
-                        continue
-
-                    lang_code = raw_lang.split("-")[0]
-                    try:
-                        lang_name = self.get_language_name(lang_code)
-                    except Exception:
-                        continue
-                    
-                    languages.add((lang_code, lang_name))
-                    
-            sorted_langs = sorted(languages, key=lambda x: x[1])
-            self._language_cache[cache_key] = sorted_langs
+        sorted_langs = self.library.languages(model)
             
         if format == "name":
             return [name for (_, name) in sorted_langs]
@@ -111,34 +234,19 @@ class ElevenLabsVoiceManager(BaseVoiceManager):
             language_code: ISO language code (e.g., 'en' for English, 'zh' for Chinese)
             voice_type: 'premade' or 'cloned' (None for all)
         """
-        voices = self._fetch_voices()
-        filtered = []
-        target_code = language_code.lower()
+        return self.library.voices_for_language(language_code, voice_type)
 
-        for voice in voices:
-            verified_languages = voice.get("verified_languages", [])
-            for lang_entry in verified_languages:
-                lang_code = lang_entry.get("language", "").split("-")[0].lower()
-                if lang_code == target_code:
-                    voice_data = {
-                        'id': voice['voice_id'],
-                        'name': voice['name'],
-                        'gender': voice.get('labels', {}).get('gender', 'unknown'),
-                        'language': lang_code,
-                        'accent': lang_entry.get("accent", 'standard'),
-                        'locale': lang_entry.get("locale", None),
-                        'type': 'premade' if voice.get('category') == 'premade' else 'cloned',
-                        'settings': voice.get('settings', {}),
-                        'preview_url': lang_entry.get("preview_url", voice.get("preview_url"))
-                    }
-                    if voice_type is None or voice_data['type'] == voice_type:
-                        filtered.append(voice_data)
-                    break
-        return filtered
+    def refresh(self, force: bool = False) -> None:
+        """Revalidate the voice library now, refetching unconditionally if force is set"""
+        if force:
+            self._etag = None
+            self._last_modified = None
+        self.library.invalidate()
+        self.library.languages()
     
     def get_language_name(self, lang_code: str) -> str:
         """Return a human-readable language name from a code."""
-        return Language.get(lang_code).display_name()
+        return language_name(lang_code)
     
     @staticmethod
     def format_voice_details(voice_data: Dict) -> str:
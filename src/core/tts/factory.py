@@ -1,33 +1,91 @@
-from typing import Type
-from .base_tts import BaseTTS
-from .google.google_cloud import GoogleCloudTTS
-from .elevenlabs.elevenlabs import ElevenLabsTTS
+import importlib
+import threading
+from typing import TYPE_CHECKING, Dict, Type
+from .async_base import DEFAULT_MAX_CONCURRENCY
 from .service_types import TTSService
 
+if TYPE_CHECKING:
+    from .base_tts import BaseTTS
+    from .async_base import AsyncBaseTTS
+
 class TTSFactory:
-    SERVICE_MAPPING: dict[TTSService, Type[BaseTTS]] = {
-        TTSService.GOOGLE: GoogleCloudTTS,
-        TTSService.ELEVENLABS: ElevenLabsTTS 
+    # Backends are named by import path and only imported on first use, so
+    # importing the factory doesn't pull in the Google or ElevenLabs SDKs
+    SERVICE_MAPPING: Dict[TTSService, str] = {
+        TTSService.GOOGLE: ".google.google_cloud:GoogleCloudTTS",
+        TTSService.ELEVENLABS: ".elevenlabs.elevenlabs:ElevenLabsTTS"
     }
-    
-    @staticmethod
-    def create(service_type: TTSService = TTSService.GOOGLE, auth_manager=None, **kwargs) -> BaseTTS:
-        tts_class = TTSFactory.SERVICE_MAPPING.get(service_type)
-        if not tts_class:
+
+    ASYNC_SERVICE_MAPPING: Dict[TTSService, str] = {
+        TTSService.GOOGLE: ".google.google_cloud_async:AsyncGoogleCloudTTS",
+        TTSService.ELEVENLABS: ".elevenlabs.elevenlabs_async:AsyncElevenLabsTTS"
+    }
+
+    _loaded: Dict[str, type] = {}
+    _load_lock = threading.Lock()
+
+    @classmethod
+    def load_class(cls, service_type: TTSService, asynchronous: bool = False) -> type:
+        """Import and return the engine class for a service"""
+        mapping = cls.ASYNC_SERVICE_MAPPING if asynchronous else cls.SERVICE_MAPPING
+        path = mapping.get(service_type)
+        if not path:
             raise ValueError(f"Unsupported TTS service: {service_type}")
-        
+
+        with cls._load_lock:
+            if path not in cls._loaded:
+                module_name, class_name = path.split(":")
+                module = importlib.import_module(module_name, package=__package__)
+                cls._loaded[path] = getattr(module, class_name)
+            return cls._loaded[path]
+
+    @staticmethod
+    def create(service_type: TTSService = TTSService.GOOGLE, auth_manager=None, **kwargs) -> "BaseTTS":
+        tts_class: Type["BaseTTS"] = TTSFactory.load_class(service_type)
+
+        if service_type == TTSService.GOOGLE:
+            return tts_class(
+                credentials_path=auth_manager.get_credentials_path(service_type) if auth_manager else None,
+                update_callback=kwargs.get('update_callback'),
+                auth_manager=auth_manager,
+                cache=kwargs.get('cache'),
+                channels=kwargs.get('channels', 1),
+                retry_policy=kwargs.get('retry_policy')
+            )
+        elif service_type == TTSService.ELEVENLABS:
+            api_key = auth_manager.get_api_key(service_type) if auth_manager else None
+            return tts_class(
+                api_key=api_key,
+                update_callback=kwargs.get('update_callback'),
+                auth_manager=auth_manager,
+                cache=kwargs.get('cache'),
+                transport=kwargs.get('transport'),
+                retry_policy=kwargs.get('retry_policy')
+            )
+
+        return tts_class(**kwargs)
+
+    @staticmethod
+    def create_async(service_type: TTSService = TTSService.GOOGLE, auth_manager=None, **kwargs) -> "AsyncBaseTTS":
+        tts_class: Type["AsyncBaseTTS"] = TTSFactory.load_class(service_type, asynchronous=True)
+
         if service_type == TTSService.GOOGLE:
             return tts_class(
                 credentials_path=auth_manager.get_credentials_path(service_type) if auth_manager else None,
                 update_callback=kwargs.get('update_callback'),
-                auth_manager=auth_manager
+                auth_manager=auth_manager,
+                cache=kwargs.get('cache'),
+                max_concurrency=kwargs.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
             )
         elif service_type == TTSService.ELEVENLABS:
             api_key = auth_manager.get_api_key(service_type) if auth_manager else None
             return tts_class(
                 api_key=api_key,
                 update_callback=kwargs.get('update_callback'),
-                auth_manager=auth_manager
+                auth_manager=auth_manager,
+                cache=kwargs.get('cache'),
+                transport=kwargs.get('transport'),
+                max_concurrency=kwargs.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
             )
-        
-        return tts_class(**kwargs)
\ No newline at end of file
+
+        return tts_class(**kwargs)
@@ -1,9 +1,20 @@
 from google.cloud import texttospeech
-from google.api_core.exceptions import GoogleAPICallError
-from typing import Optional, Dict, Union, List
+from google.api_core.exceptions import GoogleAPICallError, from_grpc_error
+import grpc
+from typing import Iterator, Optional, Dict, Union, List
+from contextlib import nullcontext
 from enum import Enum
 from dataclasses import dataclass
 from .voice import GoogleVoiceManager
+from .client_pool import GoogleClientPool
+from ..audio_utils import pcm_to_wav, utf8_len
+from ..chunking import split_text
+from ..rate_limit import RateLimiter
+from ..concurrency import AdaptiveConcurrencyLimiter
+from ..retry import Retrier, RetryPolicy
+from ..cancellation import CancellationToken
+from ...exception import SynthesisCancelled
+from ..service_types import TTSService
 
 class GoogleAudioFormat(str, Enum):
     """Supported Google TTS audio formats"""
@@ -25,7 +36,12 @@ class GoogleVoiceParams:
     gender: GoogleVoiceGender = GoogleVoiceGender.MALE
 
 class GoogleAudioConfig:
-    """Handle Google Cloud TTS audio generation with validation"""
+    """
+    Handle Google Cloud TTS audio generation with validation.
+
+    Synthesis calls go through client_pool when one is given, each call
+    leasing one of its clients; otherwise they all share client.
+    """
     
     FORMAT_MAPPING = {
         GoogleAudioFormat.MP3: texttospeech.AudioEncoding.MP3,
@@ -33,9 +49,30 @@ class GoogleAudioConfig:
         GoogleAudioFormat.OGG: texttospeech.AudioEncoding.OGG_OPUS
     }
     
-    def __init__(self, client):
+    # streaming_synthesize only accepts PCM, ALAW, MULAW and OGG_OPUS, so MP3 can't be streamed
+    STREAMING_FORMAT_MAPPING = {
+        GoogleAudioFormat.WAV: texttospeech.AudioEncoding.PCM,
+        GoogleAudioFormat.OGG: texttospeech.AudioEncoding.OGG_OPUS
+    }
+    STREAMING_SPEAKING_RATE = (0.25, 2.0)
+    
+    # Voice families served by the streaming_synthesize RPC
+    STREAMING_VOICE_TYPES = ("Chirp3-HD", "Chirp-HD", "Journey")
+    STREAMING_SAMPLE_RATE = 24000
+    
+    MAX_INPUT_BYTES = 5000
+    
+    def __init__(self, client, voice_manager: Optional[GoogleVoiceManager] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 client_pool: Optional[GoogleClientPool] = None):
         self.client = client
-        self.voice_manager = GoogleVoiceManager(client)
+        self.client_pool = client_pool
+        self.voice_manager = voice_manager or GoogleVoiceManager(client)
+        self.rate_limiter = rate_limiter or RateLimiter.for_service(TTSService.GOOGLE)
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter.for_service(TTSService.GOOGLE)
+        self.retrier = Retrier(retry_policy)
         
     def generate_to_memory(
         self,
@@ -46,7 +83,8 @@ class GoogleAudioConfig:
         speaking_rate: float = 1.0,
         pitch: float = 0.0,
         is_ssml: bool = False,
-        effects_profile_id: Optional[list[str]] = None
+        effects_profile_id: Optional[list[str]] = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> bytes:
         """
         Generate speech and return audio binary data
@@ -60,32 +98,214 @@ class GoogleAudioConfig:
             pitch: -20.0-20.0 (pitch adjustment)
             is_ssml: Whether input is SSML
             effects_profile_id: Audio effects profiles
+            cancel_token: Stops the request from being sent, or cancels the call in progress
         """
         try:
-            fmt = self._validate_format(audio_format)
-            voice = self._prepare_voice_params(voice_name, voice_data)
-            audio_config = self._prepare_audio_config(
-                fmt, speaking_rate, pitch, effects_profile_id
+            request = self.build_request(
+                text, voice_name, voice_data, audio_format,
+                speaking_rate, pitch, is_ssml, effects_profile_id
             )
-
-            synthesis_input = (
-                texttospeech.SynthesisInput(ssml=text) if is_ssml
-                else texttospeech.SynthesisInput(text=text)
-            )
-
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
+            response = self.retrier.call(
+                lambda timeout, token: self._synthesize(request, len(text), timeout, token),
+                cancel_token=cancel_token
             )
             
             return response.audio_content
 
+        except SynthesisCancelled:
+            raise
         except GoogleAPICallError as e:
             raise RuntimeError(f"Google TTS API error: {e.message}") from e
         except Exception as e:
             raise RuntimeError(f"Speech generation failed: {str(e)}") from e
 
+    def _synthesize(
+        self,
+        request: Dict,
+        chars: int,
+        timeout: float,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> texttospeech.SynthesizeSpeechResponse:
+        """One synthesis attempt, paced by the rate limiter and bounded by the concurrency limiter"""
+        self.rate_limiter.acquire(chars)
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        with self.concurrency.slot(), self._lease() as client:
+            response = self._call(client, request, timeout, cancel_token)
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        return response
+
+    @staticmethod
+    def _call(client, request: Dict, timeout: float,
+              cancel_token: Optional[CancellationToken]) -> texttospeech.SynthesizeSpeechResponse:
+        """
+        synthesize_speech, made through the gRPC stub's future when there is a
+        token, so cancelling the token cancels the call on the wire.
+        """
+        stub = getattr(getattr(client, "transport", None), "synthesize_speech", None)
+        if cancel_token is None or not hasattr(stub, "future"):
+            return client.synthesize_speech(**request, timeout=timeout)
+
+        call = stub.future(texttospeech.SynthesizeSpeechRequest(**request), timeout=timeout)
+        unregister = cancel_token.register(call.cancel)
+        try:
+            return call.result()
+        except grpc.FutureCancelledError:
+            cancel_token.raise_if_cancelled()
+            raise
+        except grpc.RpcError as e:
+            if cancel_token.cancelled:
+                raise SynthesisCancelled("Google synthesis was cancelled") from e
+            raise from_grpc_error(e) from e
+        finally:
+            unregister()
+
+    def _lease(self):
+        """The client for one call: a pooled one if there is a pool"""
+        return self.client_pool.lease() if self.client_pool else nullcontext(self.client)
+
+    def build_request(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[Union[Dict, GoogleVoiceParams]] = None,
+        audio_format: Union[str, GoogleAudioFormat] = GoogleAudioFormat.MP3,
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        is_ssml: bool = False,
+        effects_profile_id: Optional[list[str]] = None
+    ) -> Dict:
+        """Validate parameters and build the input/voice/audio_config of a synthesize_speech call"""
+        fmt = self._validate_format(audio_format)
+        return {
+            "input": (
+                texttospeech.SynthesisInput(ssml=text) if is_ssml
+                else texttospeech.SynthesisInput(text=text)
+            ),
+            "voice": self._prepare_voice_params(voice_name, voice_data),
+            "audio_config": self._prepare_audio_config(fmt, speaking_rate, pitch, effects_profile_id)
+        }
+
+    def supports_streaming(
+        self,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[Union[Dict, GoogleVoiceParams]] = None
+    ) -> bool:
+        """Whether the selected voice can be synthesized with streaming_synthesize"""
+        if isinstance(voice_data, GoogleVoiceParams):
+            name = voice_data.name
+        elif voice_data:
+            name = voice_data.get("name")
+        else:
+            name = voice_name
+        return bool(name) and any(voice_type in name for voice_type in self.STREAMING_VOICE_TYPES)
+
+    def can_stream(
+        self,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[Union[Dict, GoogleVoiceParams]] = None,
+        audio_format: Union[str, GoogleAudioFormat] = GoogleAudioFormat.MP3,
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        effects_profile_id: Optional[list[str]] = None
+    ) -> bool:
+        """
+        Whether a request can go through stream() as given: a streaming voice,
+        a streamable encoding, a rate within the streaming range, and no pitch
+        or effects profile, which the streaming config has no fields for.
+        """
+        try:
+            fmt = self._validate_format(audio_format)
+        except ValueError:
+            return False
+        low, high = self.STREAMING_SPEAKING_RATE
+        return (
+            self.supports_streaming(voice_name, voice_data)
+            and fmt in self.STREAMING_FORMAT_MAPPING
+            and low <= speaking_rate <= high
+            and not pitch
+            and not effects_profile_id
+        )
+
+    def stream(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[Union[Dict, GoogleVoiceParams]] = None,
+        audio_format: Union[str, GoogleAudioFormat] = GoogleAudioFormat.OGG,
+        speaking_rate: float = 1.0,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream speech for plain text, yielding audio as the server produces it.
+
+        The text is sent over one streaming_synthesize call, split under the
+        per-request input limit. Only WAV and OGG can be streamed; WAV output
+        arrives as raw PCM and each piece is wrapped in its own WAV header.
+        Closing the generator or cancelling cancel_token cancels the call.
+        """
+        fmt = self._validate_format(audio_format)
+        if fmt not in self.STREAMING_FORMAT_MAPPING:
+            raise ValueError(
+                f"Streaming synthesis doesn't support {fmt.value}. "
+                f"Supported: {[f.value for f in self.STREAMING_FORMAT_MAPPING]}"
+            )
+        voice = self._prepare_voice_params(voice_name, voice_data)
+        streaming_config = texttospeech.StreamingSynthesizeConfig(
+            voice=voice,
+            streaming_audio_config=texttospeech.StreamingAudioConfig(
+                audio_encoding=self.STREAMING_FORMAT_MAPPING[fmt],
+                sample_rate_hertz=self.STREAMING_SAMPLE_RATE,
+                speaking_rate=self._validate_range(speaking_rate, "speaking_rate", *self.STREAMING_SPEAKING_RATE)
+            )
+        )
+
+        def request_stream():
+            yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+            for chunk in split_text(text, self.MAX_INPUT_BYTES, utf8_len):
+                if cancel_token and cancel_token.cancelled:
+                    return
+                yield texttospeech.StreamingSynthesizeRequest(
+                    input=texttospeech.StreamingSynthesisInput(text=chunk)
+                )
+
+        responses = None
+        completed = False
+        unregister = lambda: None
+        try:
+            self.rate_limiter.acquire(len(text))
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            with self.concurrency.slot(record_latency=False), self._lease() as client:
+                responses = client.streaming_synthesize(
+                    requests=request_stream(),
+                    timeout=self.retrier.policy.deadline
+                )
+                if cancel_token and hasattr(responses, "cancel"):
+                    unregister = cancel_token.register(responses.cancel)
+                for response in responses:
+                    if cancel_token:
+                        cancel_token.raise_if_cancelled()
+                    if not response.audio_content:
+                        continue
+                    if fmt == GoogleAudioFormat.WAV:
+                        yield pcm_to_wav(response.audio_content, self.STREAMING_SAMPLE_RATE)
+                    else:
+                        yield response.audio_content
+                if cancel_token:
+                    cancel_token.raise_if_cancelled()
+                completed = True
+
+        except GoogleAPICallError as e:
+            if cancel_token and cancel_token.cancelled:
+                raise SynthesisCancelled("Google stream was cancelled") from e
+            raise RuntimeError(f"Google TTS streaming error: {e.message}") from e
+        finally:
+            unregister()
+            if not completed and hasattr(responses, "cancel"):
+                responses.cancel()
+
     def _prepare_voice_params(
         self,
         voice_name: Optional[str],
@@ -105,18 +325,20 @@ class GoogleAudioConfig:
             return texttospeech.VoiceSelectionParams(**voice_data)
         
         if voice_name:
-            for lang_code in self.voice_manager.get_language_codes():
-                voices = self.voice_manager.get_voices_for_language(lang_code)
-                for voice in voices:
-                    if voice['name'] == voice_name:
-                        return texttospeech.VoiceSelectionParams(
-                            language_code=voice['language'],
-                            name=voice['name'],
-                            ssml_gender=getattr(
-                                texttospeech.SsmlVoiceGender, 
-                                voice['gender']
-                            )
-                        )
+            voice = self.voice_manager.get_voice_by_name(voice_name)
+            if voice is None:
+                raise ValueError(
+                    f"Unknown Google voice: {voice_name}. "
+                    f"Use get_available_voices() to list valid voice names"
+                )
+            return texttospeech.VoiceSelectionParams(
+                language_code=voice['language'],
+                name=voice['name'],
+                ssml_gender=getattr(
+                    texttospeech.SsmlVoiceGender, 
+                    voice['gender']
+                )
+            )
         
         return texttospeech.VoiceSelectionParams(
             language_code="en-US",
@@ -0,0 +1,129 @@
+import itertools
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from google.cloud import texttospeech
+from google.cloud.texttospeech_v1.services.text_to_speech.transports.grpc import TextToSpeechGrpcTransport
+
+ROUND_ROBIN = "round_robin"
+LEAST_IN_FLIGHT = "least_in_flight"
+STRATEGIES = (ROUND_ROBIN, LEAST_IN_FLIGHT)
+
+# Ping idle connections so a long batch doesn't stall on a connection the network silently dropped
+DEFAULT_KEEPALIVE_MS = 30000
+DEFAULT_KEEPALIVE_TIMEOUT_MS = 10000
+
+def channel_options(keepalive_ms: int = DEFAULT_KEEPALIVE_MS,
+                    keepalive_timeout_ms: int = DEFAULT_KEEPALIVE_TIMEOUT_MS) -> List[Tuple[str, Any]]:
+    """gRPC options for one pooled channel"""
+    return [
+        # Without a local subchannel pool, channels with identical arguments share one connection
+        ("grpc.use_local_subchannel_pool", 1),
+        ("grpc.keepalive_time_ms", keepalive_ms),
+        ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.max_receive_message_length", -1),
+    ]
+
+def create_client(credentials, keepalive_ms: int = DEFAULT_KEEPALIVE_MS,
+                  keepalive_timeout_ms: int = DEFAULT_KEEPALIVE_TIMEOUT_MS) -> texttospeech.TextToSpeechClient:
+    """A TextToSpeechClient on its own gRPC channel with keepalive enabled"""
+    channel = TextToSpeechGrpcTransport.create_channel(
+        credentials=credentials,
+        options=channel_options(keepalive_ms, keepalive_timeout_ms)
+    )
+    return texttospeech.TextToSpeechClient(transport=TextToSpeechGrpcTransport(channel=channel))
+
+class GoogleClientPool:
+    """
+    Several TextToSpeechClients, each on its own HTTP/2 connection.
+
+    A single channel multiplexes every request over one connection, which
+    caps throughput under heavy concurrent load. lease() hands out one of
+    the pooled clients for the duration of a call, picked round-robin or by
+    the fewest calls currently in flight (ties rotate so idle clients are
+    used evenly). Pools are shared per credentials file through
+    for_credentials, and rebuilt when the file changes.
+    """
+
+    _instances: Dict[Tuple[str, int, str], Tuple[Optional[Tuple[int, int]], "GoogleClientPool"]] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, clients: List[Any], strategy: str = LEAST_IN_FLIGHT):
+        if not clients:
+            raise ValueError("A client pool needs at least one client")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown pool strategy: {strategy}. Supported: {list(STRATEGIES)}")
+        self.clients = list(clients)
+        self.strategy = strategy
+        self._in_flight = [0] * len(self.clients)
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls,
+        credentials,
+        size: int,
+        strategy: str = LEAST_IN_FLIGHT,
+        client_factory: Optional[Callable[[Any], Any]] = None
+    ) -> "GoogleClientPool":
+        """Build a pool of size clients on separate channels"""
+        client_factory = client_factory or create_client
+        return cls([client_factory(credentials) for _ in range(max(1, size))], strategy)
+
+    @classmethod
+    def for_credentials(cls, path: str, credentials, size: int, strategy: str = LEAST_IN_FLIGHT) -> "GoogleClientPool":
+        """
+        Return the shared pool for a credentials file, creating it on first use.
+
+        The file's (mtime_ns, size) fingerprint is checked on every call, so
+        rotated credentials get a new pool instead of the one built from the
+        old key. Engines holding the old pool keep using it.
+        """
+        key = (path, size, strategy)
+        fingerprint = cls._fingerprint(path)
+        with cls._instances_lock:
+            entry = cls._instances.get(key)
+            if entry is None or entry[0] != fingerprint:
+                entry = cls._instances[key] = (fingerprint, cls.create(credentials, size, strategy))
+            return entry[1]
+
+    @staticmethod
+    def _fingerprint(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    @property
+    def in_flight(self) -> List[int]:
+        with self._lock:
+            return list(self._in_flight)
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """Use one pooled client for the duration of the block"""
+        index = self._pick()
+        try:
+            yield self.clients[index]
+        finally:
+            with self._lock:
+                self._in_flight[index] -= 1
+
+    def _pick(self) -> int:
+        with self._lock:
+            start = next(self._turns) % len(self.clients)
+            if self.strategy == ROUND_ROBIN:
+                index = start
+            else:
+                order = self._in_flight[start:] + self._in_flight[:start]
+                index = (start + order.index(min(order))) % len(self.clients)
+            self._in_flight[index] += 1
+            return index
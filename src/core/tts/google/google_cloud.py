@@ -1,20 +1,37 @@
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from ..base_tts import BaseTTS
 from ...auth import AuthManager
 from core.tts.service_types import TTSService
 from ...utils import setup_logger
 from .voice import GoogleVoiceManager
 from .audio_config import GoogleAudioConfig
+from .client_pool import GoogleClientPool, LEAST_IN_FLIGHT
 from .monitor import GoogleUsageMonitor
+from ..cache import SynthesisCache
+from ..rate_limit import RateLimiter
+from ..concurrency import AdaptiveConcurrencyLimiter
+from ..retry import RetryPolicy
+from ..chunking import ChunkedSynthesizer, FIRST_CHUNK_LIMIT, split_text
+from ..cancellation import CancellationToken
+from ..audio_utils import join_audio, utf8_len
 
 class GoogleCloudTTS(BaseTTS):
-    def __init__(self, credentials_path: Optional[Path] = None, update_callback=None, auth_manager=None):
+    def __init__(self, credentials_path: Optional[Path] = None, update_callback=None, auth_manager=None,
+                 cache: Optional[SynthesisCache] = None, chunker: Optional[ChunkedSynthesizer] = None,
+                 channels: int = 1, channel_strategy: str = LEAST_IN_FLIGHT,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        channels above 1 spreads synthesis over a pool of that many gRPC
+        connections; retry_policy overrides the default RetryPolicy.
+        """
         self.auth_manager = auth_manager or AuthManager()  
         self.service_type = TTSService.GOOGLE
         self.logger = setup_logger()
         self.update_callback = update_callback
+        self.cache = cache or SynthesisCache.for_dir()
+        self.chunker = chunker or ChunkedSynthesizer()
         
         try:
             self.credentials_path = credentials_path or self.auth_manager.get_credentials_path(self.service_type)
@@ -28,7 +45,19 @@ class GoogleCloudTTS(BaseTTS):
                 raise RuntimeError("Failed to initialize Gogole Cloud TTS client. Check credentials.")
             
             self.voice_manager = GoogleVoiceManager(self.client)
-            self.audio_config = GoogleAudioConfig(self.client)
+            client_pool = None
+            if channels > 1:
+                client_pool = GoogleClientPool.for_credentials(
+                    str(self.credentials_path), self.credentials, channels, channel_strategy
+                )
+            self.audio_config = GoogleAudioConfig(
+                self.client,
+                voice_manager=self.voice_manager,
+                rate_limiter=RateLimiter.for_service(self.service_type, str(self.credentials_path)),
+                concurrency=AdaptiveConcurrencyLimiter.for_service(self.service_type, str(self.credentials_path)),
+                retry_policy=retry_policy,
+                client_pool=client_pool
+            )
             self.usage_monitor = GoogleUsageMonitor(self.client)
             
         except Exception as e:
@@ -52,10 +81,8 @@ class GoogleCloudTTS(BaseTTS):
         is_ssml: bool = False,
         effects_profile_id: Optional[list[str]] = None
     ) -> bytes:
-        char_count = self.count_ssml_characters(text) if is_ssml else len(text)
-        
-        audio_content = self.audio_config.generate_to_memory(
-            text=text,
+        parts = list(self.generate_chunks(
+            text,
             voice_name=voice_name,
             voice_data=voice_data,
             audio_format=audio_format,
@@ -63,7 +90,165 @@ class GoogleCloudTTS(BaseTTS):
             pitch=pitch,
             is_ssml=is_ssml,
             effects_profile_id=effects_profile_id
+        ))
+        return join_audio(parts, str(getattr(audio_format, "value", audio_format)))
+
+    def is_cached(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[dict] = None,
+        audio_format: str = "MP3",
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        is_ssml: bool = False,
+        effects_profile_id: Optional[list[str]] = None
+    ) -> bool:
+        return self._cache_key(text, voice_name, voice_data, audio_format, speaking_rate, pitch, is_ssml, effects_profile_id) in self.cache
+
+    def _cache_key(self, text, voice_name, voice_data, audio_format, speaking_rate, pitch, is_ssml, effects_profile_id) -> str:
+        """Cache key of a generate_chunks request"""
+        return self.cache.make_key(
+            self.service_type,
+            text,
+            voice_name=voice_name,
+            voice_data=voice_data,
+            audio_format=str(getattr(audio_format, "value", audio_format)).upper(),
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            is_ssml=is_ssml,
+            effects_profile_id=effects_profile_id
+        )
+
+    def generate_chunks(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[dict] = None,
+        audio_format: str = "MP3",
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        is_ssml: bool = False,
+        effects_profile_id: Optional[list[str]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[bytes]:
+        """
+        Yield the audio for text one synthesis chunk at a time, in order.
+
+        Plain text is split into a short first chunk and larger ones after it,
+        up to the request limit, and synthesized ahead of the consumer on the
+        chunker's pool; SSML goes out as one request.
+        Usage is recorded for the chunks actually delivered. Cancelling
+        cancel_token drops pending chunks and raises SynthesisCancelled.
+        """
+        fmt = str(getattr(audio_format, "value", audio_format))
+        cache_key = self._cache_key(text, voice_name, voice_data, audio_format, speaking_rate, pitch, is_ssml, effects_profile_id)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Serving Google synthesis from cache")
+            yield cached
+            return
+
+        def synthesize_chunk(chunk: str) -> bytes:
+            return self.audio_config.generate_to_memory(
+                text=chunk,
+                voice_name=voice_name,
+                voice_data=voice_data,
+                audio_format=audio_format,
+                speaking_rate=speaking_rate,
+                pitch=pitch,
+                is_ssml=is_ssml,
+                effects_profile_id=effects_profile_id,
+                cancel_token=cancel_token
+            )
+
+        # SSML can't be cut without breaking its markup, so it goes out whole
+        chunks = [text] if is_ssml else split_text(
+            text, self.audio_config.MAX_INPUT_BYTES, utf8_len, first_limit=FIRST_CHUNK_LIMIT
+        )
+        parts = []
+        delivered_chars = 0
+        try:
+            for chunk, audio in zip(chunks, self.chunker.iter_synthesize(chunks, synthesize_chunk, cancel_token=cancel_token)):
+                parts.append(audio)
+                delivered_chars += self.count_ssml_characters(chunk) if is_ssml else len(chunk)
+                yield audio
+            self.cache.put(cache_key, join_audio(parts, fmt))
+        finally:
+            self._record_usage(delivered_chars)
+
+    def stream_audio(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[dict] = None,
+        audio_format: str = "MP3",
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        is_ssml: bool = False,
+        effects_profile_id: Optional[list[str]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[bytes]:
+        """
+        Yield audio bytes from streaming_synthesize as they arrive.
+
+        Only plain WAV or OGG text for streaming-capable voices, without pitch
+        or effects, is streamed; anything else (MP3 included) falls back to
+        generate_chunks. Usage is recorded once for the request
+        as soon as the stream has started, and complete results are cached.
+        Cancelling cancel_token cancels the gRPC call.
+        """
+        if is_ssml or not self.audio_config.can_stream(
+            voice_name, voice_data, audio_format, speaking_rate, pitch, effects_profile_id
+        ):
+            yield from self.generate_chunks(
+                text,
+                voice_name=voice_name,
+                voice_data=voice_data,
+                audio_format=audio_format,
+                speaking_rate=speaking_rate,
+                pitch=pitch,
+                is_ssml=is_ssml,
+                effects_profile_id=effects_profile_id,
+                cancel_token=cancel_token
+            )
+            return
+
+        fmt = str(getattr(audio_format, "value", audio_format))
+        cache_key = self.cache.make_key(
+            self.service_type,
+            text,
+            voice_name=voice_name,
+            voice_data=voice_data,
+            audio_format=fmt.upper(),
+            speaking_rate=speaking_rate,
+            streaming=True
         )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Serving Google stream from cache")
+            yield cached
+            return
+
+        parts = []
+        try:
+            for audio in self.audio_config.stream(
+                text,
+                voice_name=voice_name,
+                voice_data=voice_data,
+                audio_format=audio_format,
+                speaking_rate=speaking_rate,
+                cancel_token=cancel_token
+            ):
+                parts.append(audio)
+                yield audio
+            self.cache.put(cache_key, join_audio(parts, fmt))
+        finally:
+            self._record_usage(len(text) if parts else 0)
+
+    def _record_usage(self, char_count: int) -> None:
+        if not char_count:
+            return
         try:
             self.usage_monitor.update_usage(char_count)
             if self.update_callback:
@@ -71,12 +256,11 @@ class GoogleCloudTTS(BaseTTS):
         except Exception as e:
             self.logger.error(f"Failed to update usage: {e}")
         
-        return audio_content
-        
     def get_usage_stats(self):
         return self.usage_monitor.get_character_stats()
     
-    def count_ssml_characters(self, text: str) -> int:
+    @staticmethod
+    def count_ssml_characters(text: str) -> int:
         """
         Count characters in SSML text, ignoring all XML tags and attributes.
         Only counts text that will actually be spoken.
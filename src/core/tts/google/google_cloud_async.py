@@ -0,0 +1,172 @@
+import asyncio
+from pathlib import Path
+from typing import Dict, List, Optional
+from google.cloud import texttospeech
+from google.api_core.exceptions import GoogleAPICallError
+from ..async_base import AsyncBaseTTS, DEFAULT_MAX_CONCURRENCY
+from ...auth import AuthManager
+from core.tts.service_types import TTSService
+from ...utils import setup_logger
+from .voice import GoogleVoiceManager
+from .audio_config import GoogleAudioConfig
+from .monitor import GoogleUsageMonitor
+from .google_cloud import GoogleCloudTTS
+from ..cache import SynthesisCache
+from ..rate_limit import RateLimiter
+from ..concurrency import AdaptiveConcurrencyLimiter
+from ..chunking import split_text
+from ..audio_utils import join_audio, utf8_len
+
+class AsyncGoogleCloudTTS(AsyncBaseTTS):
+    """
+    Google Cloud TTS on TextToSpeechAsyncClient.
+
+    Synthesis requests run on the gRPC asyncio channel under the same retry
+    policy (deadline and backoff, without hedging), rate limiter and adaptive
+    concurrency limit as GoogleCloudTTS. The voice catalog still comes from
+    the blocking client; it, the cache and usage bookkeeping (update_callback
+    included) run in worker threads so the event loop never blocks on them.
+    """
+
+    def __init__(self, credentials_path: Optional[Path] = None, update_callback=None, auth_manager=None,
+                 cache: Optional[SynthesisCache] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 async_client: Optional[texttospeech.TextToSpeechAsyncClient] = None):
+        super().__init__(max_concurrency)
+        self.auth_manager = auth_manager or AuthManager()
+        self.service_type = TTSService.GOOGLE
+        self.logger = setup_logger()
+        self.update_callback = update_callback
+        self.cache = cache or SynthesisCache.for_dir()
+        self._async_client = async_client
+
+        try:
+            self.credentials_path = credentials_path or self.auth_manager.get_credentials_path(self.service_type)
+            self.auth_manager.validate_credentials(self.service_type, self.credentials_path)
+            self.client, self.credentials = self.auth_manager.initialize_client(
+                self.service_type,
+                self.credentials_path
+            )
+
+            if not self.client:
+                raise RuntimeError("Failed to initialize Google Cloud TTS client. Check credentials.")
+
+            self.voice_manager = GoogleVoiceManager(self.client)
+            self.audio_config = GoogleAudioConfig(
+                self.client,
+                voice_manager=self.voice_manager,
+                rate_limiter=RateLimiter.for_service(self.service_type, str(self.credentials_path)),
+                concurrency=AdaptiveConcurrencyLimiter.for_service(self.service_type, str(self.credentials_path))
+            )
+            self.usage_monitor = GoogleUsageMonitor(self.client)
+
+        except Exception as e:
+            self.logger.error(f"Initialization failed: {str(e)}")
+            raise RuntimeError(f"Could not initialize Google Cloud TTS: {str(e)}")
+
+    @property
+    def async_client(self) -> texttospeech.TextToSpeechAsyncClient:
+        """The asyncio client, created on first use so it binds to the running loop"""
+        if self._async_client is None:
+            self._async_client = texttospeech.TextToSpeechAsyncClient(credentials=self.credentials)
+        return self._async_client
+
+    async def aget_available_languages(self, format: str = "both"):
+        return await asyncio.to_thread(self.voice_manager.get_available_languages, format=format)
+
+    async def aget_available_voices(self, language_code: Optional[str] = None) -> List[Dict]:
+        return await asyncio.to_thread(self.voice_manager.get_voices_for_language, language_code)
+
+    async def aget_usage_stats(self):
+        return await asyncio.to_thread(self.usage_monitor.get_character_stats)
+
+    async def agenerate(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        voice_data: Optional[dict] = None,
+        audio_format: str = "MP3",
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        is_ssml: bool = False,
+        effects_profile_id: Optional[list[str]] = None
+    ) -> bytes:
+        """
+        Synthesize text and return the audio.
+
+        Long plain text is split under the request limit and its chunks are sent
+        concurrently, each one counted against the engine's concurrency limit.
+        """
+        fmt = str(getattr(audio_format, "value", audio_format))
+        cache_key = self.cache.make_key(
+            self.service_type,
+            text,
+            voice_name=voice_name,
+            voice_data=voice_data,
+            audio_format=fmt.upper(),
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            is_ssml=is_ssml,
+            effects_profile_id=effects_profile_id
+        )
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is not None:
+            self.logger.debug("Serving Google synthesis from cache")
+            return cached
+
+        chunks = [text] if is_ssml else split_text(text, self.audio_config.MAX_INPUT_BYTES, utf8_len)
+        # Voice names resolve through the catalog, which may have to refresh over the network
+        requests = await asyncio.to_thread(lambda: [
+            self.audio_config.build_request(
+                chunk, voice_name, voice_data, audio_format,
+                speaking_rate, pitch, is_ssml, effects_profile_id
+            )
+            for chunk in chunks
+        ])
+
+        try:
+            parts = await asyncio.gather(*(
+                self._send(request, len(chunk)) for chunk, request in zip(chunks, requests)
+            ))
+        except GoogleAPICallError as e:
+            raise RuntimeError(f"Google TTS API error: {e.message}") from e
+        except Exception as e:
+            raise RuntimeError(f"Speech generation failed: {str(e)}") from e
+
+        audio = join_audio(parts, fmt)
+        await asyncio.to_thread(self.cache.put, cache_key, audio)
+        await asyncio.to_thread(
+            self._record_usage,
+            GoogleCloudTTS.count_ssml_characters(text) if is_ssml else len(text)
+        )
+        return audio
+
+    async def _send(self, request: Dict, chars: int) -> bytes:
+        return await self.audio_config.retrier.acall(lambda timeout: self._attempt(request, chars, timeout))
+
+    async def _attempt(self, request: Dict, chars: int, timeout: float) -> bytes:
+        """Wait for rate budget first, so throttled requests don't hold a concurrency slot"""
+        await self.audio_config.rate_limiter.aacquire(chars)
+        return await self._bounded(self._synthesize, request, timeout)
+
+    async def _synthesize(self, request: Dict, timeout: float) -> bytes:
+        async with self.audio_config.concurrency.aslot():
+            response = await self.async_client.synthesize_speech(**request, timeout=timeout)
+        return response.audio_content
+
+    def _record_usage(self, char_count: int) -> None:
+        if not char_count:
+            return
+        try:
+            self.usage_monitor.update_usage(char_count)
+            if self.update_callback:
+                self.update_callback(self.usage_monitor.get_character_stats())
+        except Exception as e:
+            self.logger.error(f"Failed to update usage: {e}")
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.transport.close()
+            self._async_client = None
+
+    def get_service_name(self) -> TTSService:
+        return TTSService.GOOGLE
@@ -1,22 +1,37 @@
 from datetime import datetime
-from typing import Dict, Union
-import json
-import os
+from typing import Dict, Optional, Union
 import logging
 from pathlib import Path
+from ..usage_ledger import UsageLedger, USAGE_FLUSH_INTERVAL
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 FREE_TIER_CHAR_LIMIT = 1000000
-GOOGLE_USAGE_FILE = "google_usage.json"
+GOOGLE_USAGE_FILE = Path.home() / ".tts_app" / "google_usage.json"
+# Where earlier versions kept the ledger, relative to the working directory
+LEGACY_GOOGLE_USAGE_FILE = Path("google_usage.json")
 
 class GoogleUsageMonitor:
-    """Tracks local usage for Google CLoud tts"""
+    """
+    Tracks local usage for Google CLoud tts.
+
+    Usage is counted in the shared UsageLedger for the usage file, which
+    writes it behind on an interval and at interpreter exit. All monitors on
+    the same file share one ledger and its flusher, so rebuilding an engine
+    costs no extra thread. The default file sits in the app data directory
+    next to the ElevenLabs ledger; one an older version left in the working
+    directory is merged into it once.
+    """
     
-    def __init__(self, client):
+    def __init__(self, client, usage_file: Optional[Union[str, Path]] = None,
+                 flush_interval: float = USAGE_FLUSH_INTERVAL):
         self.client = client
-        self.usage_file = Path(GOOGLE_USAGE_FILE)
+        self.ledger = UsageLedger.for_file(
+            usage_file or GOOGLE_USAGE_FILE, flush_interval,
+            legacy_path=None if usage_file else LEGACY_GOOGLE_USAGE_FILE
+        )
+        self.usage_file = self.ledger.path
         self.local_char_count = 0
         
     def safe_get_month(self) -> str:
@@ -24,63 +39,22 @@ class GoogleUsageMonitor:
         return datetime.now().strftime("%Y-%m")
 
     def load_or_create_data(self) -> Dict[str, Union[str, int]]:
-        """Atomic load or create of usage data"""
-        current_month = self.safe_get_month()
-        default_data = {'month': current_month, 'used': 0}
-        
-        if not os.path.exists(GOOGLE_USAGE_FILE):
-            try:
-                with open(GOOGLE_USAGE_FILE, 'w') as f:
-                    json.dump(default_data, f)
-                return default_data
-            except Exception as e:
-                logger.error(f"Failed to create usage file: {e}")
-                return default_data
-        
-        try:
-            with open(GOOGLE_USAGE_FILE, 'r') as f:
-                data = json.load(f)
-                
-            if not isinstance(data, dict):
-                raise ValueError("Data is not a dictionary")
-            if 'month' not in data or 'used' not in data:
-                raise ValueError("Missing required fields")
-            
-            if data['month'] != current_month:
-                data = default_data
-                with open(GOOGLE_USAGE_FILE, 'w') as f:
-                    json.dump(data, f)
-                    
-            return data
-        except Exception as e:
-            logger.error(f"Error loading usage data: {e}")
-            return default_data
+        """Ledger totals for the current month, including usage not yet flushed"""
+        data = self.ledger.data()
+        return {'month': data['month'], 'used': data['used']}
 
     def update_usage(self, char_count: int):
-        """Thread-safe usage update"""
-        try:
-            current_month = self.safe_get_month()
-            with open(GOOGLE_USAGE_FILE, 'r+') as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {'month': current_month, 'used': 0}
-                    logger.warning("Created new usage file - invalid JSON")
-                except FileNotFoundError:
-                    data = {'month': current_month, 'used': 0}
-                    logger.warning("Created new usage file - didn't exist")
-                    
-                if data.get('month') != current_month:
-                    data = {'month': current_month, 'used': 0}
-                    logger.info("Month changed - reset usage counter")
-                    
-                data['used'] = data.get('used', 0) + char_count
-                f.seek(0)
-                json.dump(data, f, indent=2)
-                f.truncate()
-                logger.debug(f"Updated usage: {data}")
-        except Exception as e:
-            logger.error(f"Failed to update usage: {e}")
+        """Record usage in memory; the ledger's flusher persists it"""
+        self.ledger.add(char_count)
+        self.local_char_count += char_count
+
+    def flush(self) -> None:
+        """Write pending usage to the ledger file now"""
+        self.ledger.flush()
+
+    def close(self) -> None:
+        """Write out pending usage; the shared flusher keeps running for other monitors"""
+        self.ledger.flush()
 
     def get_character_stats(self):
         """Completely safe stats retrieval"""
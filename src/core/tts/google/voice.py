@@ -1,7 +1,12 @@
-from google.api_core.exceptions import GoogleAPICallError
-from langcodes import Language
-from typing import Optional, Dict, List, Union, Tuple
+import threading
+import time
+import grpc
+from google.api_core.exceptions import GoogleAPICallError, RetryError
+from google.auth.exceptions import GoogleAuthError
+from typing import Callable, Optional, Dict, List, Union, Tuple
 from core.tts.base_voice import BaseVoiceManager, BaseVoiceDetails
+from core.tts.language_names import language_name
+from core.utils import setup_logger
 
 class GoogleVoiceDetails(BaseVoiceDetails):
     """Google-specific voice details formatting"""
@@ -17,22 +22,130 @@ class GoogleVoiceDetails(BaseVoiceDetails):
             details.append(f"{voice_data['sample_rate']//1000}kHz")
         return " | ".join(details)
     
+class GoogleVoiceCatalog:
+    """
+    Snapshot of the full Google voice list, fetched with a single list_voices call.
+
+    The language set, language code list and per-language voice buckets are all
+    derived from the same response and rebuilt once the TTL expires. If a refresh
+    fails while an older snapshot exists, the stale snapshot keeps being served
+    and the refresh is tried again after retry_delay.
+    """
+
+    DEFAULT_TTL = 3600.0
+    REFRESH_RETRY_DELAY = 30.0
+    # What a failed list_voices can raise besides an API error: exhausted
+    # retries, credential refresh failures and raw transport errors
+    REFRESH_ERRORS = (GoogleAPICallError, RetryError, GoogleAuthError, grpc.RpcError, OSError)
+
+    def __init__(self, client, language_namer: Callable[[str], str], ttl: float = DEFAULT_TTL,
+                 retry_delay: float = REFRESH_RETRY_DELAY):
+        self.client = client
+        self.language_namer = language_namer
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+        self.logger = setup_logger()
+        self._lock = threading.Lock()
+        self._expires_at: Optional[float] = None
+        self._languages: List[Tuple[str, str]] = []
+        self._language_codes: List[str] = []
+        self._voices_by_language: Dict[str, List[Dict]] = {}
+        self._voices_by_name: Dict[str, Dict] = {}
+
+    def languages(self) -> List[Tuple[str, str]]:
+        """(code, name) pairs sorted by name"""
+        self._ensure_fresh()
+        return list(self._languages)
+
+    def language_codes(self) -> List[str]:
+        """Sorted base language codes"""
+        self._ensure_fresh()
+        return list(self._language_codes)
+
+    def voices_for_language(self, language_code: str) -> List[Dict]:
+        """Voices for a base ('en') or regional ('en-US') language code"""
+        self._ensure_fresh()
+        return list(self._voices_by_language.get(language_code.lower(), []))
+
+    def voice_by_name(self, name: str) -> Optional[Dict]:
+        """Exact voice name lookup, e.g. 'en-US-Wavenet-D'"""
+        self._ensure_fresh()
+        return self._voices_by_name.get(name)
+
+    def invalidate(self) -> None:
+        """Force the next lookup to refetch the voice list"""
+        with self._lock:
+            # Expired rather than forgotten, so a failed refetch still serves the old snapshot
+            if self._expires_at is not None:
+                self._expires_at = float("-inf")
+
+    def _is_fresh(self) -> bool:
+        return self._expires_at is not None and time.monotonic() < self._expires_at
+
+    def _ensure_fresh(self) -> None:
+        if self._is_fresh():
+            return
+
+        with self._lock:
+            if self._is_fresh():
+                return
+            try:
+                response = self.client.list_voices()
+            except self.REFRESH_ERRORS as e:
+                if self._expires_at is None:
+                    raise
+                self.logger.warning(
+                    f"Voice list refresh failed, serving cached catalog; retrying in {self.retry_delay:.0f}s: {e}"
+                )
+                self._expires_at = time.monotonic() + self.retry_delay
+                return
+            self._build(response.voices)
+            self._expires_at = time.monotonic() + self.ttl
+
+    def _build(self, raw_voices) -> None:
+        languages = set()
+        voices_by_language: Dict[str, List[Dict]] = {}
+        voices_by_name: Dict[str, Dict] = {}
+
+        for voice in raw_voices:
+            primary = voice.language_codes[0]
+            base_code = primary.split('-')[0]
+            languages.add(base_code)
+
+            voice_data = {
+                'name': voice.name,
+                'gender': voice.ssml_gender.name,
+                'language': primary,
+                'sample_rate': voice.natural_sample_rate_hertz,
+                'voice_type': 'Neural' if 'Neural' in voice.name else 'WaveNet'
+            }
+            voices_by_name[voice.name] = voice_data
+            bucket_keys = set()
+            for code in voice.language_codes:
+                bucket_keys.add(code.lower())
+                bucket_keys.add(code.split('-')[0].lower())
+            for key in bucket_keys:
+                voices_by_language.setdefault(key, []).append(voice_data)
+
+        self._languages = sorted(
+            ((code, self.language_namer(code)) for code in languages),
+            key=lambda x: x[1]
+        )
+        self._language_codes = sorted(languages)
+        self._voices_by_language = voices_by_language
+        self._voices_by_name = voices_by_name
+
 class GoogleVoiceManager(BaseVoiceManager):
     """Handles Google Cloud TTS voice operations"""
     
-    def __init__(self, client):
+    def __init__(self, client, catalog: Optional[GoogleVoiceCatalog] = None):
         super().__init__()
         self.client = client
+        self.catalog = catalog or GoogleVoiceCatalog(client, self.get_language_name)
         
     def get_available_languages(self, model: Optional[str] = None, format: str = "both") -> List[Union[str, Tuple[str, str]]]:
         try:
-            response = self.client.list_voices()
-            languages = set()
-            for voice in response.voices:
-                lang_code = voice.language_codes[0].split('-')[0]
-                languages.add((lang_code, self.get_language_name(lang_code)))
-            
-            sorted_langs = sorted(languages, key=lambda x: x[1])
+            sorted_langs = self.catalog.languages()
             
             if format == "name":
                 return [name for (_, name) in sorted_langs]
@@ -47,14 +160,7 @@ class GoogleVoiceManager(BaseVoiceManager):
     
     def get_voices_for_language(self, language_code: str, voice_type: Optional[str] = None) -> List[Dict]:
         try:
-            response = self.client.list_voices(language_code=language_code)
-            voices = [{
-                'name': voice.name,
-                'gender': voice.ssml_gender.name,
-                'language': voice.language_codes[0],
-                'sample_rate': voice.natural_sample_rate_hertz,
-                'voice_type': 'Neural' if 'Neural' in voice.name else 'WaveNet'
-            } for voice in response.voices]
+            voices = self.catalog.voices_for_language(language_code)
             
             if voice_type:
                 return [v for v in voices if v['voice_type'] == voice_type]
@@ -65,18 +171,22 @@ class GoogleVoiceManager(BaseVoiceManager):
     
     def get_language_codes(self) -> List[str]:
         try:
-            response = self.client.list_voices()
-            return sorted({voice.language_codes[0].split('-')[0] 
-                        for voice in response.voices})
+            return self.catalog.language_codes()
         except GoogleAPICallError as e:
             raise RuntimeError(f"Couldn't retrieve language codes: {e.message}")
     
+    def get_voice_by_name(self, voice_name: str) -> Optional[Dict]:
+        try:
+            return self.catalog.voice_by_name(voice_name)
+        except GoogleAPICallError as e:
+            raise RuntimeError(f"Couldn't retrieve voices: {e.message}")
+    
     def validate_language_code(self, code: str) -> bool:
-        return code in [lang[0] for lang in self.get_available_languages("both")]
+        return code in self.get_language_codes()
     
     def get_language_name(self, lang_code: str) -> str:
         """Get language name"""
-        return Language.get(lang_code).display_name()
+        return language_name(lang_code)
     
     @staticmethod
     def format_voice_details(voice_data: Dict) -> str:
@@ -0,0 +1,59 @@
+"""
+English display names for language codes.
+
+Names come from a precomputed table, so listing languages is a dict lookup
+and langcodes (whose name data is slow to import) is only loaded for codes
+the table doesn't know. Regenerate the table after upgrading langcodes with:
+
+    python -m core.tts.language_names
+"""
+import itertools
+import string
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+TABLE_MODULE = Path(__file__).with_name("language_table.py")
+# Three-letter codes the services report besides the ISO 639-1 ones
+EXTRA_CODES = ("cmn", "yue", "fil", "nan", "wuu", "hak", "haw", "ceb", "gsw", "ast")
+
+_table: Optional[Dict[str, str]] = None
+
+def language_name(code: str) -> str:
+    """Display name for a language code, e.g. "fr" -> "French" """
+    global _table
+    if _table is None:
+        from .language_table import LANGUAGE_NAMES
+        _table = LANGUAGE_NAMES
+    name = _table.get(code) or _table.get(code.lower())
+    return name if name is not None else _fallback_name(code)
+
+@lru_cache(maxsize=256)
+def _fallback_name(code: str) -> str:
+    from langcodes import Language
+    return Language.get(code).display_name()
+
+def generate_table() -> Dict[str, str]:
+    """Build the code -> name table from langcodes"""
+    from langcodes import Language
+
+    table = {}
+    codes = ("".join(pair) for pair in itertools.product(string.ascii_lowercase, repeat=2))
+    for code in itertools.chain(codes, EXTRA_CODES):
+        name = Language.get(code).display_name()
+        if name != code and not name.startswith("Unknown language"):
+            table[code] = name
+    return table
+
+def write_table(path: Path = TABLE_MODULE) -> None:
+    lines = [
+        "# Generated by `python -m core.tts.language_names`; do not edit by hand.",
+        "LANGUAGE_NAMES = {"
+    ]
+    lines += [f"    {code!r}: {name!r}," for code, name in sorted(generate_table().items())]
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+if __name__ == "__main__":
+    write_table()
+    print(f"Wrote {TABLE_MODULE}")
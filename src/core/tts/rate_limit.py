@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from .service_types import TTSService
+
+# (requests per minute, characters per minute); None leaves a dimension unlimited
+DEFAULT_LIMITS: Dict[TTSService, Tuple[Optional[float], Optional[float]]] = {
+    TTSService.GOOGLE: (1000, 500_000),
+    TTSService.ELEVENLABS: (None, None)
+}
+DEFAULT_BURST_SECONDS = 5.0
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at rate_per_minute.
+
+    reserve() takes tokens immediately, going into debt if the bucket is short,
+    and returns how long the caller must wait before its reservation is
+    covered. Waiting is left to the caller, so the same bucket serves
+    blocking threads and asyncio tasks, and callers are served in the order
+    they reserved.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate * DEFAULT_BURST_SECONDS)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate_per_minute: float, capacity: Optional[float] = None) -> None:
+        """Change the refill rate and capacity, keeping the tokens (or debt) built up so far"""
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate_per_minute / 60.0
+            self.capacity = capacity if capacity is not None else max(1.0, self.rate * DEFAULT_BURST_SECONDS)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take amount tokens and return the seconds to wait until they are available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+class RateLimiter:
+    """
+    Request and character budgets for one provider account.
+
+    Every synthesis call acquires one request and its character count before
+    going out. Limiters come from a process-wide registry keyed by service and
+    credential, so the GUI, batch workers and async engines using the same
+    account all draw from one budget.
+    """
+
+    _instances: Dict[Tuple[TTSService, Optional[str]], "RateLimiter"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, requests_per_minute: Optional[float] = None, chars_per_minute: Optional[float] = None):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.chars = TokenBucket(chars_per_minute) if chars_per_minute else None
+
+    @classmethod
+    def for_service(cls, service: TTSService, key: Optional[str] = None) -> "RateLimiter":
+        """Return the shared limiter for a service account, creating it with the defaults on first use"""
+        with cls._instances_lock:
+            limiter = cls._instances.get((service, key))
+            if limiter is None:
+                limiter = cls(*DEFAULT_LIMITS.get(service, (None, None)))
+                cls._instances[(service, key)] = limiter
+            return limiter
+
+    @classmethod
+    def configure(
+        cls,
+        service: TTSService,
+        key: Optional[str] = None,
+        requests_per_minute: Optional[float] = None,
+        chars_per_minute: Optional[float] = None
+    ) -> "RateLimiter":
+        """
+        Set the shared limiter's budgets for a service account, e.g. to match a paid plan's quota.
+
+        The registered limiter is changed in place, so engines already holding
+        it follow the new limits.
+        """
+        with cls._instances_lock:
+            limiter = cls._instances.get((service, key))
+            if limiter is None:
+                limiter = cls._instances[(service, key)] = cls()
+        limiter.set_limits(requests_per_minute, chars_per_minute)
+        return limiter
+
+    def set_limits(self, requests_per_minute: Optional[float] = None, chars_per_minute: Optional[float] = None) -> None:
+        """Change both budgets; None makes a dimension unlimited"""
+        self.requests = self._rebucket(self.requests, requests_per_minute)
+        self.chars = self._rebucket(self.chars, chars_per_minute)
+
+    @staticmethod
+    def _rebucket(bucket: Optional[TokenBucket], rate_per_minute: Optional[float]) -> Optional[TokenBucket]:
+        if not rate_per_minute:
+            return None
+        if bucket is None:
+            return TokenBucket(rate_per_minute)
+        bucket.set_rate(rate_per_minute)
+        return bucket
+
+    def _reserve(self, chars: int) -> float:
+        wait = 0.0
+        if self.requests:
+            wait = self.requests.reserve(1)
+        if self.chars and chars:
+            wait = max(wait, self.chars.reserve(chars))
+        return wait
+
+    def acquire(self, chars: int = 0) -> float:
+        """Block until one request of chars characters fits the budget; returns the time waited"""
+        wait = self._reserve(chars)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, chars: int = 0) -> float:
+        """Asyncio counterpart of acquire that sleeps without blocking the loop"""
+        wait = self._reserve(chars)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
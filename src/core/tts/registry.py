@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+from .base_tts import BaseTTS
+from .factory import TTSFactory
+from .service_types import TTSService
+from ..utils import setup_logger
+
+class ProviderRegistry:
+    """
+    Creates TTS engines on first use instead of all at startup.
+
+    get() builds a service's engine the first time it is asked for, importing
+    its backend only then. warm() does the same on a background thread, for
+    a service that is likely to be needed soon; a get() during warm-up waits
+    for it instead of building a second engine. A failed build is forgotten,
+    so the next get() tries again.
+    """
+
+    def __init__(self, auth_manager=None, create: Optional[Callable[[TTSService], BaseTTS]] = None):
+        self.auth_manager = auth_manager
+        self._create = create or (lambda service: TTSFactory.create(service, auth_manager=self.auth_manager))
+        self._engines: Dict[TTSService, Future] = {}
+        self._lock = threading.Lock()
+        self.logger = setup_logger()
+
+    def get(self, service: TTSService) -> BaseTTS:
+        """Return the engine for service, building it on this thread if nobody has started it"""
+        future, owner = self._claim(service)
+        if owner:
+            self._build(service, future)
+        return future.result()
+
+    def warm(self, service: TTSService) -> Future:
+        """Start building the engine for service in the background, if it isn't built or building"""
+        future, owner = self._claim(service)
+        if owner:
+            threading.Thread(
+                target=self._build,
+                args=(service, future),
+                name=f"tts-warm-{service.value}",
+                daemon=True
+            ).start()
+        return future
+
+    def is_ready(self, service: TTSService) -> bool:
+        future = self._engines.get(service)
+        return future is not None and future.done() and future.exception() is None
+
+    def peek(self, service: TTSService) -> Optional[BaseTTS]:
+        """The engine for service if it has already been built, without building it"""
+        return self._engines[service].result() if self.is_ready(service) else None
+
+    def _claim(self, service: TTSService):
+        with self._lock:
+            future = self._engines.get(service)
+            if future is not None:
+                return future, False
+            future = self._engines[service] = Future()
+            return future, True
+
+    def _build(self, service: TTSService, future: Future) -> None:
+        try:
+            engine = self._create(service)
+        except Exception as e:
+            self.logger.error(f"Failed to initialize {service.name} engine: {e}")
+            with self._lock:
+                if self._engines.get(service) is future:
+                    del self._engines[service]
+            future.set_exception(e)
+        else:
+            future.set_result(engine)
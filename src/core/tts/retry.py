@@ -0,0 +1,223 @@
+import asyncio
+import math
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+import requests
+from ..exception import ElevenLabsAPIError
+from ..utils import setup_logger
+from .cancellation import CancellationToken
+
+T = TypeVar("T")
+
+RETRYABLE_GOOGLE_ERRORS = ("ServiceUnavailable", "ResourceExhausted", "InternalServerError", "DeadlineExceeded")
+
+def google_errors(*names: str) -> tuple:
+    """
+    google.api_core exception classes by name, without importing the Google stack.
+
+    If google.api_core.exceptions hasn't been imported, no Google error can
+    have been raised, so an empty tuple (which isinstance never matches) is right.
+    """
+    module = sys.modules.get("google.api_core.exceptions")
+    return tuple(getattr(module, name) for name in names) if module else ()
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error, or anything it wraps, is transient: 5xx, 429, UNAVAILABLE or a dropped connection"""
+    while error is not None:
+        if isinstance(error, ElevenLabsAPIError):
+            return error.status_code is not None and (error.status_code == 429 or error.status_code >= 500)
+        if isinstance(error, google_errors(*RETRYABLE_GOOGLE_ERRORS)):
+            return True
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        # Connection failures of the async transports; httpx is optional, so look it up the same way
+        httpx = sys.modules.get("httpx")
+        if httpx is not None and isinstance(error, httpx.TransportError):
+            return True
+        error = error.__cause__
+    return False
+
+@dataclass
+class RetryPolicy:
+    """
+    How hard to try a single synthesis request.
+
+    deadline bounds the whole call, retries and backoff included, and each
+    attempt gets the remaining time as its timeout. Hedging is off by default
+    and should stay off unless latency matters more than cost: the losing
+    copy is cancelled, but a request the service already accepted is billed
+    anyway, so a hedged call can cost twice.
+    """
+    max_attempts: int = 4
+    deadline: float = 120.0
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+
+class LatencyTracker:
+    """Sliding window of recent call latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+class Retrier:
+    """
+    Runs a request under a RetryPolicy: a deadline, jittered exponential
+    backoff between retryable failures and, optionally, hedging.
+
+    The request is a callable taking the seconds left before the deadline,
+    to be used as its timeout, and a CancellationToken that aborts it. With
+    hedging on, an attempt still running after the observed p95 latency gets
+    a duplicate, whichever finishes first wins, and the other copy's token is
+    cancelled. acall() is the asyncio counterpart of call(), with the same
+    deadline and backoff but no hedging.
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, tracker: Optional[LatencyTracker] = None):
+        self.policy = policy or RetryPolicy()
+        self.tracker = tracker or LatencyTracker()
+        self.logger = setup_logger()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def call(
+        self,
+        request: Callable[[float, Optional[CancellationToken]], T],
+        hedge: bool = True,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> T:
+        """Run request until it succeeds, fails for good, the deadline passes or cancel_token is cancelled"""
+        deadline = time.monotonic() + self.policy.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Request deadline of {self.policy.deadline}s exceeded")
+            try:
+                return self._attempt(request, remaining, hedge, cancel_token)
+            except Exception as e:
+                if attempt >= self.policy.max_attempts or not is_retryable(e):
+                    raise
+                delay = random.uniform(0, min(self.policy.max_delay, self.policy.base_delay * 2 ** (attempt - 1)))
+                if time.monotonic() + delay >= deadline:
+                    raise
+                self.logger.warning(f"Attempt {attempt} failed ({e}); retrying in {delay:.2f}s")
+                if cancel_token:
+                    cancel_token.wait(delay)
+                else:
+                    time.sleep(delay)
+
+    async def acall(self, request: Callable[[float], Awaitable[T]]) -> T:
+        """Await request until it succeeds, fails for good or the deadline passes"""
+        deadline = time.monotonic() + self.policy.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Request deadline of {self.policy.deadline}s exceeded")
+            started = time.monotonic()
+            try:
+                result = await request(remaining)
+            except Exception as e:
+                if attempt >= self.policy.max_attempts or not is_retryable(e):
+                    raise
+                delay = random.uniform(0, min(self.policy.max_delay, self.policy.base_delay * 2 ** (attempt - 1)))
+                if time.monotonic() + delay >= deadline:
+                    raise
+                self.logger.warning(f"Attempt {attempt} failed ({e}); retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            else:
+                self.tracker.record(time.monotonic() - started)
+                return result
+
+    def _attempt(
+        self,
+        request: Callable[[float, Optional[CancellationToken]], T],
+        timeout: float,
+        hedge: bool,
+        cancel_token: Optional[CancellationToken]
+    ) -> T:
+        hedge_after = self._hedge_delay() if hedge else None
+        if hedge_after is None or hedge_after >= timeout:
+            return self._timed(request, timeout, cancel_token)
+
+        executor = self._hedge_executor()
+        started = time.monotonic()
+        copies = {}
+
+        def launch(remaining: float) -> None:
+            token = CancellationToken()
+            unlink = cancel_token.register(token.cancel) if cancel_token else (lambda: None)
+            future = executor.submit(self._timed, request, remaining, token)
+            future.add_done_callback(lambda _: unlink())
+            copies[future] = token
+
+        launch(timeout)
+        try:
+            done, pending = wait(set(copies), timeout=hedge_after)
+            if not done:
+                self.logger.debug(f"Hedging request still running after {hedge_after:.2f}s")
+                launch(timeout - (time.monotonic() - started))
+                done, pending = wait(set(copies), timeout=timeout - (time.monotonic() - started), return_when=FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError(f"Request timed out after {timeout:.1f}s")
+
+            first = done.pop()
+            if first.exception() is None or not pending:
+                return first.result()
+            # The first finisher failed; give the other copy the rest of the time
+            done, _ = wait(pending, timeout=timeout - (time.monotonic() - started))
+            if not done:
+                return first.result()
+            return done.pop().result()
+        finally:
+            # Abort whichever copy lost (or both, on timeout) so it stops using a slot and a connection
+            for future, token in copies.items():
+                if not future.done():
+                    future.cancel()
+                    token.cancel()
+
+    def _timed(self, request: Callable[[float, Optional[CancellationToken]], T], timeout: float,
+               cancel_token: Optional[CancellationToken]) -> T:
+        started = time.monotonic()
+        result = request(timeout, cancel_token)
+        self.tracker.record(time.monotonic() - started)
+        return result
+
+    def _hedge_delay(self) -> Optional[float]:
+        if not self.policy.hedge or len(self.tracker) < self.policy.hedge_min_samples:
+            return None
+        return self.tracker.quantile(self.policy.hedge_quantile)
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="tts-hedge")
+            return self._executor
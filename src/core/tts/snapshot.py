@@ -0,0 +1,102 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from ..utils import setup_logger, atomic_write_bytes
+from .service_types import TTSService
+
+DEFAULT_SNAPSHOT_PATH = Path.home() / ".tts_app" / "warm_start.json"
+SNAPSHOT_VERSION = 1
+# Voice lists are kept for this many recently used languages per service
+MAX_VOICE_LANGUAGES = 8
+
+class WarmStartSnapshot:
+    """
+    Last known languages, voices and usage per service, persisted between runs.
+
+    The GUI paints its dropdowns and quota panel from the snapshot straight
+    away and reconciles them with fresh data fetched in the background. Each
+    put_* call stores the fresh data and rewrites the file atomically, but
+    only when something actually changed. An unreadable file or a snapshot
+    from another version is treated as empty.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else DEFAULT_SNAPSHOT_PATH
+        self.logger = setup_logger()
+        self._lock = threading.Lock()
+        self._services: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable warm-start snapshot {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return {}
+        services = data.get("services")
+        return services if isinstance(services, dict) else {}
+
+    def _section(self, service: TTSService, name: str) -> Dict[str, Any]:
+        return self._services.setdefault(service.value, {}).setdefault(name, {})
+
+    def languages(self, service: TTSService, model: Optional[str] = None) -> Optional[List[Tuple[str, str]]]:
+        """Last known (code, name) pairs for a service and model, if any"""
+        with self._lock:
+            languages = self._services.get(service.value, {}).get("languages", {}).get(model or "")
+        return [tuple(pair) for pair in languages] if languages else None
+
+    def voices(self, service: TTSService, language: str) -> Optional[List[Dict]]:
+        """Last known voices of a service for a language, if any"""
+        with self._lock:
+            voices = self._services.get(service.value, {}).get("voices", {}).get(language)
+        return list(voices) if voices else None
+
+    def usage(self, service: TTSService) -> Optional[Dict]:
+        """Last known usage stats of a service, if any"""
+        with self._lock:
+            usage = self._services.get(service.value, {}).get("usage")
+        return dict(usage) if usage else None
+
+    def put_languages(self, service: TTSService, model: Optional[str], languages: List[Tuple[str, str]]) -> None:
+        self._put(service, "languages", model or "", [list(pair) for pair in languages])
+
+    def put_voices(self, service: TTSService, language: str, voices: List[Dict]) -> None:
+        self._put(service, "voices", language, voices, keep=MAX_VOICE_LANGUAGES)
+
+    def put_usage(self, service: TTSService, stats: Dict) -> None:
+        with self._lock:
+            entry = self._services.setdefault(service.value, {})
+            stats = json.loads(json.dumps(stats, default=str))
+            if entry.get("usage") == stats:
+                return
+            entry["usage"] = stats
+        self.save()
+
+    def _put(self, service: TTSService, section: str, key: str, value: Any, keep: Optional[int] = None) -> None:
+        value = json.loads(json.dumps(value, default=str))
+        with self._lock:
+            entries = self._section(service, section)
+            if entries.get(key) == value:
+                return
+            # Re-insert so the most recently stored keys sort last
+            entries.pop(key, None)
+            entries[key] = value
+            if keep is not None:
+                for stale in list(entries)[:-keep]:
+                    del entries[stale]
+        self.save()
+
+    def save(self) -> None:
+        """Write the snapshot; failures are logged, never raised, since it is only a cache"""
+        with self._lock:
+            payload = {"version": SNAPSHOT_VERSION, "saved_at": time.time(), "services": self._services}
+            data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        try:
+            atomic_write_bytes(self.path, data)
+        except OSError as e:
+            self.logger.warning(f"Failed to write warm-start snapshot {self.path}: {e}")
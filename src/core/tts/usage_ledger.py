@@ -0,0 +1,199 @@
+import atexit
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from ..utils import atomic_write_bytes, file_lock, setup_logger
+
+USAGE_FLUSH_INTERVAL = 10.0
+# Closed months kept in the ledger's history
+HISTORY_MONTHS = 12
+
+def current_month() -> str:
+    return datetime.now().strftime("%Y-%m")
+
+class UsageLedger:
+    """
+    Monthly character counts in a JSON file shared between processes.
+
+    Counts are added in memory, tagged with the month they were spent in, and
+    written behind by one flusher thread per file, on an interval and at
+    interpreter exit. Each flush merges the pending counts into the file
+    under an advisory lock and replaces it atomically, so several app or batch
+    processes can share one ledger. A count from a month that has since ended
+    goes to that month's entry in the history rather than the new month.
+
+    The file holds the current month and its total plus a history of recent
+    closed months: {"month": "2026-10", "used": 1200, "history": {"2026-09": 800}}.
+    A ledger left at legacy_path by an older version is merged in once, when
+    the flusher starts, and renamed so it isn't counted twice.
+    Use for_file() to get the shared ledger for a path.
+    """
+
+    _instances: Dict[Path, "UsageLedger"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Union[str, Path], flush_interval: float = USAGE_FLUSH_INTERVAL,
+                 legacy_path: Optional[Union[str, Path]] = None):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path).expanduser().resolve() if legacy_path else None
+        self.lock_file = self.path.with_name(self.path.name + ".lock")
+        self.flush_interval = flush_interval
+        self.logger = setup_logger()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, int] = {}
+        self._extra: Dict[str, Any] = {}
+        self._extra_dirty = False
+        self._data: Optional[Dict[str, Any]] = None
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_file(cls, path: Union[str, Path], flush_interval: float = USAGE_FLUSH_INTERVAL,
+                 legacy_path: Optional[Union[str, Path]] = None) -> "UsageLedger":
+        """Return the shared ledger for path, starting its flusher on first use"""
+        key = Path(path).expanduser().resolve()
+        with cls._instances_lock:
+            ledger = cls._instances.get(key)
+            if ledger is None:
+                ledger = cls._instances[key] = cls(key, flush_interval, legacy_path)
+                ledger.start()
+            return ledger
+
+    def start(self) -> None:
+        """Flush on an interval from a daemon thread, and once more at exit"""
+        if self._flusher is not None:
+            return
+        self.migrate()
+        self._flusher = threading.Thread(target=self._flush_loop, name=f"usage-flush-{self.path.stem}", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def add(self, char_count: int, month: Optional[str] = None) -> None:
+        """Count characters against month (default: now); written out by the next flush"""
+        if not char_count:
+            return
+        month = month or current_month()
+        with self._lock:
+            self._pending[month] = self._pending.get(month, 0) + char_count
+
+    def annotate(self, **fields) -> None:
+        """Extra top-level fields to store with the next flush"""
+        with self._lock:
+            if any(self._extra.get(k) != v for k, v in fields.items()):
+                self._extra.update(fields)
+                self._extra_dirty = True
+
+    def data(self) -> Dict[str, Any]:
+        """The ledger as last read or written, plus this process's unflushed counts"""
+        with self._lock:
+            if self._data is None or self._data.get("month") != current_month():
+                self._data = self._rolled(self._read())
+            data = dict(self._data)
+            data["history"] = dict(data.get("history", {}))
+            data.update(self._extra)
+            for month, count in self._pending.items():
+                self._apply(data, month, count)
+            return data
+
+    def used(self, month: Optional[str] = None) -> int:
+        data = self.data()
+        month = month or data["month"]
+        return data["used"] if month == data["month"] else data["history"].get(month, 0)
+
+    def flush(self) -> None:
+        """Merge pending counts into the file and refresh the cached totals"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            extra, dirty = dict(self._extra), self._extra_dirty
+            self._extra_dirty = False
+        if not pending and not dirty:
+            # Nothing to write; still pick up what other processes have flushed
+            data = self._rolled(self._read())
+            with self._lock:
+                self._data = data
+            return
+
+        try:
+            with file_lock(self.lock_file):
+                data = self._rolled(self._read())
+                for month, count in pending.items():
+                    self._apply(data, month, count)
+                data.update(extra)
+                atomic_write_bytes(self.path, json.dumps(data, indent=2).encode("utf-8"))
+        except Exception as e:
+            self.logger.error(f"Failed to write usage ledger {self.path}: {e}")
+            with self._lock:
+                for month, count in pending.items():
+                    self._pending[month] = self._pending.get(month, 0) + count
+                self._extra_dirty = self._extra_dirty or dirty
+            return
+
+        with self._lock:
+            self._data = data
+
+    def migrate(self) -> None:
+        """Merge the ledger at legacy_path into this one and rename it to *.migrated"""
+        legacy_path = self.legacy_path
+        if legacy_path is None or legacy_path == self.path.resolve() or not legacy_path.exists():
+            return
+        try:
+            with file_lock(self.lock_file):
+                legacy = self._read(legacy_path)
+                if legacy:
+                    data, legacy = self._rolled(self._read()), self._rolled(legacy)
+                    data["used"] += legacy["used"]
+                    for month, count in legacy["history"].items():
+                        data["history"][month] = data["history"].get(month, 0) + count
+                    for field, value in legacy.items():
+                        data.setdefault(field, value)
+                    atomic_write_bytes(self.path, json.dumps(self._rolled(data), indent=2).encode("utf-8"))
+                legacy_path.replace(legacy_path.with_name(legacy_path.name + ".migrated"))
+        except OSError as e:
+            self.logger.error(f"Failed to migrate usage ledger {legacy_path}: {e}")
+            return
+        self.logger.info(f"Merged usage ledger {legacy_path} into {self.path}")
+
+    def close(self) -> None:
+        """Stop the flusher and write out anything pending"""
+        self._stopped.set()
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _read(self, path: Optional[Path] = None) -> Dict[str, Any]:
+        path = path or self.path
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error loading usage data from {path}: {e}")
+            return {}
+        if not isinstance(data, dict) or "month" not in data or "used" not in data:
+            self.logger.error(f"Ignoring malformed usage data in {path}")
+            return {}
+        return data
+
+    @staticmethod
+    def _rolled(data: Dict[str, Any]) -> Dict[str, Any]:
+        """data with the current month open, an ended month moved to the history"""
+        data = dict(data)
+        history = dict(data.get("history", {}))
+        month = current_month()
+        if data.get("month") != month:
+            if data.get("month") and data.get("used"):
+                history[data["month"]] = history.get(data["month"], 0) + data["used"]
+            data["month"], data["used"] = month, 0
+        data["history"] = {m: history[m] for m in sorted(history)[-HISTORY_MONTHS:]}
+        return data
+
+    @staticmethod
+    def _apply(data: Dict[str, Any], month: str, count: int) -> None:
+        if month == data["month"]:
+            data["used"] = data.get("used", 0) + count
+        else:
+            data["history"][month] = data["history"].get(month, 0) + count
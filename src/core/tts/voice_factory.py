@@ -1,5 +1,3 @@
-from core.tts.google.voice import GoogleVoiceManager
-from core.tts.elevenlabs.voice import ElevenLabsVoiceManager
 from core.tts.base_voice import BaseVoiceManager
 from typing import Union
 
@@ -14,9 +12,12 @@ class VoiceManagerFactory:
             service_type: 'google' or 'elevenlabs'
             config: For Google - client object, for ElevenLabs - {'api_key': str}
         """
+        # Imported here so only the requested backend's SDK gets loaded
         if service_type == 'google':
+            from core.tts.google.voice import GoogleVoiceManager
             return GoogleVoiceManager(client=config)
         elif service_type == 'elevenlabs':
+            from core.tts.elevenlabs.voice import ElevenLabsVoiceManager
             if not isinstance(config, dict) or 'api_key' not in config:
                 raise ValueError("ElevenLabs config must be a dict with 'api_key'")
             return ElevenLabsVoiceManager(api_key=config['api_key'])
@@ -1,4 +1,14 @@
 import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
 
 def setup_logger(name=__name__):
     logger = logging.getLogger(name)
@@ -8,4 +18,42 @@ def setup_logger(name=__name__):
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
-    return logger
\ No newline at end of file
+    return logger
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Write bytes to path via a temp file in the same directory and an atomic rename"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+@contextmanager
+def file_lock(lock_path: Union[str, Path]) -> Iterator[None]:
+    """Hold an exclusive advisory lock on lock_path shared with other processes"""
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a+b') as f:
+        if os.name == 'nt':
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -1,9 +1,9 @@
-import io
 import platform
 import sys
 import pygame
 import tkinter as tk
-from threading import Thread
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
 from tkinter import ttk, messagebox, filedialog
 from ttkbootstrap import Style
 from ttkbootstrap.widgets import Progressbar
@@ -13,14 +13,29 @@ from .components.voice_controls import VoiceControls
 from .components.language_controls import LanguageControls
 from .components.quota_usage import QuotaPanel
 from .components.service_switcher import ServiceSwitcher
+from .player import ProgressivePlayer
+from .tasks import BackgroundTasks
 from core.auth import AuthManager
 from core.tts.factory import TTSFactory, TTSService
+from core.tts.registry import ProviderRegistry
+from core.tts.snapshot import WarmStartSnapshot
 from core.tts.voice_factory import VoiceManagerFactory
 from core.tts.service_types import TTSService
+from core.tts.audio_utils import join_audio, regroup_mp3_frames
 from core.utils import setup_logger
 from gui.layouts.google import GoogleTTSLayout
 from gui.layouts.elevenlabs import ElevenLabsLayout
 
+@dataclass
+class ServiceView:
+    """The top controls built for one service, kept alive while another service is shown"""
+    frame: ttk.Frame
+    service_controls: Any
+    language_dropdown: LanguageControls
+    voice_dropdown: VoiceControls
+    format_dropdown: AudioFormatDropdown
+    download_button: ttk.Button
+
 class TTSApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -28,16 +43,20 @@ class TTSApp(tk.Tk):
         self.auth_manager = AuthManager()
         self._set_platform_specifics()
         self._init_audio()
+        self.player = ProgressivePlayer(self)
+        self.tasks = BackgroundTasks(self)
+        self.snapshot = WarmStartSnapshot()
         self.logger = setup_logger()
         self.is_playing = False
         self.is_paused = False
+        self.synthesis = None
         
         # Service management
-        self.services = {}
         self.voice_manager_factory = VoiceManagerFactory()
         self._initialize_tts_service()
         self._activate_service(TTSService.GOOGLE)
         self._setup_ui()
+        self.after_idle(self._warm_other_services)
 
     def _set_platform_specifics(self):
         """Platform-specific adjustments"""
@@ -63,27 +82,33 @@ class TTSApp(tk.Tk):
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=buffer_size)
             
     def _initialize_tts_service(self):
-        """Initialize all TTS services"""
+        """Set up on-demand engines; only the default service is built before the window appears"""
+        self.providers = ProviderRegistry(self.auth_manager, create=self._create_engine)
         try:
-            self.services[TTSService.GOOGLE] = TTSFactory.create(
-                service_type=TTSService.GOOGLE,
-                auth_manager=self.auth_manager,
-                update_callback=lambda stats: self.update_quota(stats)
-            )
-            self.services[TTSService.ELEVENLABS] = TTSFactory.create(
-                service_type=TTSService.ELEVENLABS,
-                auth_manager=self.auth_manager,
-                update_callback=lambda stats: self.update_quota(stats)
-            )
+            self.providers.get(TTSService.GOOGLE)
         except Exception as e:
             messagebox.showerror("Initialization Error", 
-                f"Failed to initialize {self.current_service.name} TTS engine: {str(e)}")
+                f"Failed to initialize {TTSService.GOOGLE.name} TTS engine: {str(e)}")
             raise
+
+    def _create_engine(self, service: TTSService):
+        # Usage callbacks fire on synthesis threads; hop to the Tk thread before touching widgets
+        return TTSFactory.create(
+            service_type=service,
+            auth_manager=self.auth_manager,
+            update_callback=lambda stats: self.tasks.post(self._on_usage_update, service, stats)
+        )
+
+    def _warm_other_services(self):
+        """Build the services that aren't active yet in the background, so switching to them is instant"""
+        for service in TTSService:
+            if service != self.current_service:
+                self.providers.warm(service)
     
-    def _activate_service(self, service: TTSService):
-        """Activate a pre-initialized service"""
+    def _activate_service(self, service: TTSService, engine=None):
+        """Activate a service, building its engine if that hasn't happened yet"""
         self.current_service = service
-        self.tts_engine = self.services[service]
+        self.tts_engine = engine or self.providers.get(service)
         self.current_voice_manager = self.tts_engine.voice_manager
     
     def _setup_ui(self):
@@ -159,36 +184,54 @@ class TTSApp(tk.Tk):
             self.update_status_meter(0, "Working...")
         else:
             self.update_status_meter(100, "Ready")
-        self.update_idletasks()
         
     def switch_service(self, service: TTSService):
-        """Thread-safe service switching with cursor guarantees"""
+        """Switch to another service, swapping in its controls as they were left"""
         if service == self.current_service:
             return
-        
-        def _execute_switch():
-            try:
-                self.service_switcher.disable()
-                self.update_status_meter(0, f"Switching to {service.name}...")
-                self.update()
-                
-                if hasattr(self, 'service_controls_frame'):
-                    for widget in self.service_controls_frame.winfo_children():
-                        widget.destroy()
-                
-                try:
-                    self._perform_service_switch(service)
-                    self.after(0, self._finalize_successful_switch, service)
-                except Exception as e:
-                    self.after(0, self._handle_switch_failure, service, str(e))
-                    
-            except Exception as e:
-                self._safe_set_cursor("")
-                self.service_switcher.enable()
-                self.update_status_meter(0, f"Failed to switch to {service.name}")
-                messagebox.showerror("Error", f"Failed to switch to {service.name}: {str(e)}")
-        
-        self.after(0, _execute_switch)
+
+        engine = self.providers.peek(service)
+        if engine is not None:
+            self._apply_switch(service, engine)
+            return
+
+        # The engine may still be warming up, or not started at all; wait for it off the Tk thread
+        self.service_switcher.disable()
+        self.update_status_meter(0, f"Switching to {service.name}...")
+        self.tasks.submit(
+            self.providers.get,
+            service,
+            on_done=lambda engine: self._apply_switch(service, engine),
+            on_error=lambda e: self._handle_switch_failure(service, str(e)),
+            key="switch"
+        )
+
+    def _apply_switch(self, service, engine):
+        """Activate an engine and show its controls; no network calls once both have been built"""
+        if not self.winfo_exists():
+            return
+
+        # Audio from the old engine must not finish into the new service's view
+        self._halt_playback()
+        previous_service, previous_engine = self.current_service, self.tts_engine
+        try:
+            self._activate_service(service, engine)
+            self._show_service_view(service)
+        except Exception as e:
+            self._activate_service(previous_service, previous_engine)
+            self._show_service_view(previous_service)
+            self._handle_switch_failure(service, str(e))
+            return
+
+        self.current_audio_content = None
+        self.download_button.config(state=tk.DISABLED)
+
+        cached_usage = self.snapshot.usage(service)
+        if cached_usage:
+            self.quota_panel.update_stats(cached_usage)
+        else:
+            self.update_quota()
+        self._finalize_successful_switch(service)
     
     def _finalize_successful_switch(self, service):
         """Cleanup after successful switch"""
@@ -210,6 +253,7 @@ class TTSApp(tk.Tk):
             
         try:
             self._safe_set_cursor("")
+            self.service_switcher.set_service(self.current_service)
             self.service_switcher.enable()
             self.update_status_meter(0, f"Failed to switch to {service.name}")
             
@@ -221,39 +265,6 @@ class TTSApp(tk.Tk):
                     pass
         except:
             pass
-    
-    def _perform_service_switch(self, service):
-        """Perform the actual service switch in background"""
-        try:
-            self._activate_service(service)
-            self.after(0, self._update_ui_after_switch, service)
-            
-        except Exception as e:
-            self.after(0, self._handle_switch_error, service, str(e))
-
-    def _update_ui_after_switch(self, service):
-        """Update UI after successful switch"""
-        if hasattr(self, "top_controls_frame"):
-            self._populate_top_controls(self.top_controls_frame)
-
-        self.update_quota()
-        self.is_playing = False
-        self.is_paused = False
-        self.current_audio_content = None
-        
-        if hasattr(self, 'download_button'):
-            self.download_button.config(state=tk.DISABLED)
-        
-        self.service_switcher.enable()
-
-        self.update_status_meter(100, f"Switched to {service.name}")
-        messagebox.showinfo("Service Changed", f"Switched to {service.name} service")
-
-    def _handle_switch_error(self, service, error):
-        """Handle errors during service switch"""
-        self.service_switcher.enable()
-        self.update_status_meter(0, f"Failed to switch to {service.name}")
-        messagebox.showerror("Error", f"Failed to switch to {service.name}: {error}")
         
     def _setup_text_editor(self, parent):
         """Create and pack the main text editor for input."""
@@ -265,12 +276,34 @@ class TTSApp(tk.Tk):
         """Create the top controls section."""  
         self.top_controls_frame = ttk.Frame(parent)
         self.top_controls_frame.pack(fill=tk.X, pady=(0, 10))
-        self._populate_top_controls(self.top_controls_frame)
-    
-    def _populate_top_controls(self, frame): 
-        for widget in frame.winfo_children():
-            widget.destroy()
-            
+        self.service_views: Dict[TTSService, ServiceView] = {}
+        self.current_view: Optional[ServiceView] = None
+        self._show_service_view(self.current_service)
+
+    def _show_service_view(self, service: TTSService):
+        """
+        Show the controls of a service, building them on first use.
+
+        Each service keeps its own frame, so its selections and loaded lists
+        survive a switch; switching back only swaps the packed frame.
+        """
+        view = self.service_views.get(service)
+        if view is None:
+            view = self.service_views[service] = self._build_service_view()
+
+        if self.current_view is not None and self.current_view is not view:
+            self.current_view.frame.pack_forget()
+        view.frame.pack(fill=tk.X)
+        self.current_view = view
+
+        self.service_controls = view.service_controls
+        self.language_dropdown = view.language_dropdown
+        self.voice_dropdown = view.voice_dropdown
+        self.format_dropdown = view.format_dropdown
+        self.download_button = view.download_button
+
+    def _build_service_view(self) -> "ServiceView":
+        frame = ttk.Frame(self.top_controls_frame)
         frame.columnconfigure(0, weight=2)
         frame.columnconfigure(1, weight=3)
 
@@ -291,26 +324,37 @@ class TTSApp(tk.Tk):
 
         if self.current_service == TTSService.ELEVENLABS:
             self.service_controls._setup_model_dropdown(left_frame, self.language_dropdown, self.voice_dropdown)
+
+        return ServiceView(
+            frame=frame,
+            service_controls=self.service_controls,
+            language_dropdown=self.language_dropdown,
+            voice_dropdown=self.voice_dropdown,
+            format_dropdown=self.format_dropdown,
+            download_button=self.download_button
+        )
     
     def _setup_language_voice_dropdowns(self, parent, model=None):
         """Initialize and pack the language and voice selection dropdowns."""
         dropdown_frame = ttk.LabelFrame(parent, text="Language & Voice", padding=(10, 5))
         dropdown_frame.pack(fill=tk.X, pady=(0, 5))
 
-        self.language_dropdown = LanguageControls(dropdown_frame, self.tts_engine)
+        self.language_dropdown = LanguageControls(
+            dropdown_frame, self.tts_engine, tasks=self.tasks, snapshot=self.snapshot
+        )
         self.language_dropdown.pack(fill=tk.X, pady=(0, 5))
 
-        self.voice_dropdown = VoiceControls(dropdown_frame, self.tts_engine)
+        self.voice_dropdown = VoiceControls(
+            dropdown_frame, self.tts_engine, tasks=self.tasks, snapshot=self.snapshot
+        )
         self.voice_dropdown.pack(fill=tk.X)
+        self.voice_dropdown.set_voice_manager(self.current_voice_manager)
 
-        self.language_dropdown.load_languages(model=model)
         self.language_dropdown.dropdown.bind("<<ComboboxSelected>>", self._update_voices)
-        
-        self.voice_dropdown.set_voice_manager(self.current_voice_manager)
-        
-        first_lang = self.language_dropdown.get_first_language()
-        if first_lang:
-            self.voice_dropdown.load_voices_for_language(first_lang)
+        self.language_dropdown.load_languages(
+            model=model,
+            on_loaded=self.voice_dropdown.load_voices_for_language
+        )
 
     def _setup_format_selector(self, parent):
         """Setup audio format selection below language/voice dropdowns"""
@@ -335,23 +379,11 @@ class TTSApp(tk.Tk):
         
     def _setup_service_controls(self):
         """Setup service-specific controls"""
-        for widget in self.service_controls_frame.winfo_children():
-            widget.destroy()
-            
-        if not hasattr(self, 'service_controls_cache'):
-            self.service_controls_cache = {}
-        
-        if (self.current_service not in self.service_controls_cache or 
-            not self.service_controls_cache[self.current_service].winfo_exists()):
-            
-            if self.current_service == TTSService.GOOGLE:
-                self.service_controls_cache[self.current_service] = GoogleTTSLayout(self.service_controls_frame)
-            elif self.current_service == TTSService.ELEVENLABS:
-                self.service_controls_cache[self.current_service] = ElevenLabsLayout(self.service_controls_frame)
-
-        
-        self.service_controls_cache[self.current_service].pack(fill=tk.BOTH, expand=True)
-        self.service_controls = self.service_controls_cache[self.current_service]
+        if self.current_service == TTSService.GOOGLE:
+            self.service_controls = GoogleTTSLayout(self.service_controls_frame)
+        elif self.current_service == TTSService.ELEVENLABS:
+            self.service_controls = ElevenLabsLayout(self.service_controls_frame)
+        self.service_controls.pack(fill=tk.BOTH, expand=True)
     
     def _setup_control_buttons(self, parent):
         """Create and pack audio control buttons""" 
@@ -393,13 +425,11 @@ class TTSApp(tk.Tk):
 
         self.quota_panel = QuotaPanel(parent)
         self.quota_panel.pack(fill=tk.X, pady=10)
-        self.update_quota()
+        self._refresh_quota_periodically()
     
     def update_status_meter(self, progress, status_text):
         self.progress_var.set(progress)
         self.status_label.config(text=status_text)
-        self.update_idletasks()
-        self.update()
     
     def _update_voices(self, event=None):
         """Update available voices when language changes"""    
@@ -407,19 +437,39 @@ class TTSApp(tk.Tk):
         self.voice_dropdown.load_voices_for_language(selected_language)   
     
     def update_quota(self, stats=None):
-        """Update quota display"""    
-        try:
-            stats = stats or self.tts_engine.get_usage_stats()
+        """
+        Update quota display. Without stats, the last known usage is painted
+        from the snapshot while fresh stats are fetched in the background.
+        """
+        service = self.current_service
+        if stats:
+            self._on_usage_update(service, stats)
+            return
+
+        cached = self.snapshot.usage(service)
+        if cached:
+            self.quota_panel.update_stats(cached)
+        self.tasks.submit(
+            self.tts_engine.get_usage_stats,
+            on_done=lambda fresh: self._on_usage_update(service, fresh),
+            on_error=lambda e: self.logger.error(f"Failed to update quota: {str(e)}"),
+            key="quota"
+        )
+
+    def _refresh_quota_periodically(self):
+        self.update_quota()
+        self.after(300000, self._refresh_quota_periodically)
+
+    def _on_usage_update(self, service, stats):
+        """Remember fresh usage for the next launch; only the active service is shown"""
+        self.snapshot.put_usage(service, stats)
+        if service == self.current_service:
             self.quota_panel.update_stats(stats)
-        except Exception as e:
-            self.logger.error(f"Failed to update quota: {str(e)}")
-        
-        self.after(300000, self.update_quota)
         
     def play_audio(self):
         """Generate and play audio directly"""
         self.stop_audio()
-        self.update_status_meter(10, "Generating...")
+        self.update_status_meter(10, "Preparing...")
 
         text = self.text_editor.get_text()
         if not text:
@@ -440,31 +490,54 @@ class TTSApp(tk.Tk):
             self.update_status_meter(0, "Invalid parameters")
             return
         
-        self.update_status_meter(30, "Generating...")
+        self.update_status_meter(30, "Requesting audio...")
+        self.current_audio_format = self.format_dropdown.get_selected_format()
+        streaming = self.current_audio_format.upper() == "MP3"
+        self.synthesis = self.tts_engine.start_synthesis(
+            text,
+            stream=streaming,
+            voice_data=voice_params,
+            audio_format=self.current_audio_format,
+            **tts_params
+        )
+        segments = regroup_mp3_frames(self.synthesis) if streaming else self.synthesis
+        self.player.start(
+            segments,
+            on_first_audio=self._on_first_audio,
+            on_audio_ready=self._on_audio_ready,
+            on_playback_end=self._on_playback_end,
+            on_error=lambda e: self._on_generation_error(e, tts_params),
+            on_segment=self._on_segment,
+            handle=self.synthesis
+        )
 
-        try:
-            self.update_status_meter(50, "Generating...")
-            self.current_audio_format = self.format_dropdown.get_selected_format()
-            audio_content = self.tts_engine.generate_to_memory(
-                text=text,
-                voice_data=voice_params,
-                audio_format=self.current_audio_format,
-                **tts_params
-            )
-
-            self.update_status_meter(80, "Generating...")
-            self._play_audio_content(audio_content)
-
-        except RuntimeError as e:
-            if "does not support SSML" in str(e) and tts_params.get('is_ssml', False):
-                messagebox.showerror("Generation Error", f"Voice doesn't support SSML - using plain text")
-                self.update_status_meter(0, "Generation Error")
-            else:
-                messagebox.showerror("Generation Error", f"Failed to generate speech:\n{str(e)}")
-                self.update_status_meter(0, "Generation Error")
-        except Exception as e:
-            messagebox.showerror("Generation Error", f"Failed to generate speech:\n{str(e)}")
-            self.update_status_meter(0, "Generation Error")
+    def _on_first_audio(self):
+        """Playback of the first synthesized chunk has started"""
+        self.is_playing = True
+        self.is_paused = False
+        self.pause_button.config(text="Pause")
+
+    def _on_segment(self, count, received):
+        """Another segment arrived while synthesis is still running"""
+        self.update_status_meter(60, f"Playing audio... {received // 1024:,} KB received")
+
+    def _on_audio_ready(self, parts):
+        """All chunks have been synthesized; keep the joined audio for download"""
+        self.current_audio_content = join_audio(parts, self.current_audio_format)
+        self.download_button.config(state=tk.NORMAL)
+        self.update_status_meter(100, "Playing audio...")
+
+    def _on_playback_end(self):
+        self.is_playing = False
+        self.update_status_meter(0, "Ready")
+
+    def _on_generation_error(self, error, tts_params):
+        self.is_playing = False
+        if isinstance(error, RuntimeError) and "does not support SSML" in str(error) and tts_params.get('is_ssml', False):
+            messagebox.showerror("Generation Error", f"Voice doesn't support SSML - using plain text")
+        else:
+            messagebox.showerror("Generation Error", f"Failed to generate speech:\n{str(error)}")
+        self.update_status_meter(0, "Generation Error")
     
     def _get_voice_parameters(self, voice_data):
         """Get service-specific voice parameters"""
@@ -480,28 +553,6 @@ class TTSApp(tk.Tk):
                 "model": self.service_controls.get_voice_parameters().get("model")
             }  
             
-    def _play_audio_content(self, audio_content):
-        """Play audio from binary content"""
-        self.current_audio_content = audio_content
-        self.download_button.config(state=tk.NORMAL)
-        try:
-            audio_file = io.BytesIO(audio_content)
-            
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(audio_file)
-            pygame.mixer.music.play()
-            self.is_playing = True
-            self.is_paused = False
-            self.pause_button.config(text="Pause")
-            self.update_status_meter(100, "Playing audio...")
-            self.after(100, self._check_playback_status)
-
-        except Exception as e:
-            self.is_playing = False
-            messagebox.showerror("Playback Error", f"Could not play audio: {str(e)}")
-            self.update_status_meter(0, "Playback Error")
-            raise
-    
     def toggle_pause(self):
         """Toggle between pause and resume"""
         if not self.is_playing:
@@ -509,39 +560,35 @@ class TTSApp(tk.Tk):
             return
     
         if self.is_paused:
-            pygame.mixer.music.unpause()
+            self.player.unpause()
             self.is_paused = False
             self.pause_button.config(text="Pause")
             self.update_status_meter(100, "Playing audio...")
         else:
-            pygame.mixer.music.pause()
+            self.player.pause()
             self.is_paused = True
             self.pause_button.config(text="Resume")
             self.update_status_meter(50, "Paused")
                 
-    def _check_playback_status(self):
-        """Check if audio is still playing"""
-        if self.is_paused:
-            return
-
-        if pygame.mixer.music.get_busy():
-            self.after(100, self._check_playback_status)
-        else:
-            self.is_playing = False
-            self.update_status_meter(0, "Ready")
-
     def stop_audio(self):
-        """Stop currently playing audio"""
+        """Stop currently playing audio and cancel any synthesis still running"""
         try:
-            pygame.mixer.music.stop()
-            self.is_playing = False
-            self.is_paused = False
-            self.pause_button.config(text="Pause")
+            self._halt_playback()
             self.update_status_meter(100, "Playback stopped.")
             self.after(3000, lambda: self.update_status_meter(0, "Ready"))
         except Exception as e:
             messagebox.showerror("Stop Error", f"Could not stop audio: {str(e)}")
     
+    def _halt_playback(self):
+        """Cancel the running synthesis and stop the player; its callbacks no longer fire"""
+        if self.synthesis is not None:
+            self.synthesis.cancel()
+            self.synthesis = None
+        self.player.stop()
+        self.is_playing = False
+        self.is_paused = False
+        self.pause_button.config(text="Pause")
+
     def _on_download_clicked(self):
         """Wrapper method for download button click"""
         if hasattr(self, 'format_dropdown'):
@@ -580,6 +627,12 @@ class TTSApp(tk.Tk):
 
     def on_close(self):
         """Cleanup when closing the app"""
+        if self.synthesis is not None:
+            self.synthesis.cancel()
+        self.player.stop()
+        # Let the producer close the synthesis so its usage is recorded before exit
+        self.player.join(timeout=1.0)
+        self.tasks.shutdown()
         pygame.mixer.quit()
         self.destroy()
         
@@ -1,11 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, List, Tuple, Dict
+from typing import Callable, Optional, List, Tuple, Dict
 
 class LanguageControls(ttk.Frame):
-    def __init__(self, master, tts_engine=None, **kwargs):
+    def __init__(self, master, tts_engine=None, tasks=None, snapshot=None, **kwargs):
         super().__init__(master, **kwargs)
         self.tts_engine = tts_engine
+        self.tasks = tasks
+        self.snapshot = snapshot
         self.languages: List[Tuple[str, str]] = []
         self.name_to_code: Dict[str, str] = {} 
         self._setup_ui()
@@ -21,22 +23,70 @@ class LanguageControls(ttk.Frame):
         )
         self.dropdown.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-    def load_languages(self, model):
-        """Load all available languages from TTS engine"""
-        try:
-            if not self.tts_engine:
-                raise ValueError("TTS engine not initialized")
-            
-            self.languages = self.tts_engine.get_available_languages(model, format="both")
-            self.name_to_code = {name: code for code, name in self.languages}
-            display_names = [name for (code, name) in self.languages]
-            self.dropdown['values'] = display_names
-            
-            if display_names:
-                self.language_var.set(display_names[0])
-        except Exception as e:
-            messagebox.showerror("Language Error", f"Failed to load languages:\n{str(e)}")
-            raise
+    def load_languages(self, model, on_loaded: Optional[Callable[[str], None]] = None):
+        """
+        Load all available languages from TTS engine.
+
+        Runs in the background when a task runner is set. With a warm-start
+        snapshot the last known list is shown immediately and replaced only if
+        the fresh one differs. on_loaded gets the selected language code
+        whenever it is first set or changes.
+        """
+        if not self.tts_engine:
+            messagebox.showerror("Language Error", "Failed to load languages:\nTTS engine not initialized")
+            return
+
+        service = self.tts_engine.get_service_name()
+        cached = self.snapshot.languages(service, model) if self.snapshot else None
+
+        def fetch():
+            return self.tts_engine.get_available_languages(model, format="both")
+
+        def reconcile(languages):
+            if not self.winfo_exists():
+                return
+            languages = [tuple(pair) for pair in languages]
+            if self.snapshot:
+                self.snapshot.put_languages(service, model, languages)
+            if languages != cached:
+                self._populate(languages, on_loaded)
+
+        def on_error(e):
+            # A cached list stays usable; only complain when there is nothing to show
+            if self.winfo_exists() and not cached:
+                messagebox.showerror("Language Error", f"Failed to load languages:\n{str(e)}")
+
+        if cached:
+            self._populate(cached, on_loaded)
+
+        if self.tasks is None:
+            try:
+                languages = fetch()
+            except Exception as e:
+                on_error(e)
+                return
+            reconcile(languages)
+            return
+
+        if not cached and not self.languages:
+            self.language_var.set("Loading...")
+        self.tasks.submit(fetch, on_done=reconcile, on_error=on_error, key=f"languages-{id(self)}")
+
+    def _populate(self, languages: List[Tuple[str, str]], on_loaded: Optional[Callable[[str], None]]):
+        """Fill the dropdown, keeping the current language if it is still offered"""
+        previous = self.get_selected_language()
+        self.languages = languages
+        self.name_to_code = {name: code for code, name in self.languages}
+        self.dropdown['values'] = [name for (code, name) in self.languages]
+        if not self.languages:
+            self.language_var.set("")
+            return
+
+        codes = [code for code, name in self.languages]
+        selected = previous if previous in codes else codes[0]
+        self.language_var.set(dict(self.languages)[selected])
+        if on_loaded and selected != previous:
+            on_loaded(selected)
             
     def get_selected_language(self) -> Optional[str]:
         """Get the currently selected language code"""
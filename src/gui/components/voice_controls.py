@@ -4,10 +4,12 @@ from typing import List, Dict, Optional
 from core.tts.base_voice import BaseVoiceManager
 
 class VoiceControls(ttk.Frame):
-    def __init__(self, master, tts_engine=None, **kwargs):
+    def __init__(self, master, tts_engine=None, tasks=None, snapshot=None, **kwargs):
         super().__init__(master, **kwargs)
         self.voices: List[Dict] = []
         self.tts_engine= tts_engine
+        self.tasks = tasks
+        self.snapshot = snapshot
         self.voice_manager = None
         self._setup_ui()
     
@@ -30,28 +32,75 @@ class VoiceControls(ttk.Frame):
         self.columnconfigure(1, weight=1)
 
     def load_voices_for_language(self, language: str):
-        """Load voices for a specific language."""
-        try:
-            if not self.tts_engine:
-                raise ValueError("TTS engine not initialized")
-                
+        """
+        Load voices for a specific language, in the background when a task runner is set.
+
+        Voices remembered in the warm-start snapshot are shown immediately and
+        replaced only if the fresh list differs.
+        """
+        if not self.tts_engine:
+            messagebox.showerror("Voice Error", "Failed to load voices:\nTTS engine not initialized")
+            return
+
+        service = self.tts_engine.get_service_name()
+        cached = self.snapshot.voices(service, language) if self.snapshot else None
+
+        def reconcile(voices):
+            if not self.winfo_exists():
+                return
+            if self.snapshot and voices:
+                self.snapshot.put_voices(service, language, voices)
+            if voices != cached:
+                self._populate_voices(voices)
+
+        def on_error(e):
+            if not cached:
+                self._on_load_error(e)
+
+        if cached:
+            self._populate_voices(cached, keep_selection=False)
+        else:
             self.voice_var.set("")
+            self.dropdown['values'] = []
+            self.voices = []
             self.details_var.set("Loading voices...")
-            self.update_idletasks()
-            self.voices = self.tts_engine.get_available_voices(language)
-            voice_names = [v['name'] for v in self.voices]
-            
-            if not voice_names:
-                raise ValueError("No voices available for selected language")
-                
-            self.dropdown['values'] = voice_names
-            self.voice_var.set(voice_names[0])
-            self._update_details()
-            
-        except Exception as e:
-            messagebox.showerror("Voice Error", f"Failed to load voices:\n{str(e)}")
-            self.details_var.set("Error loading voices")
-            raise
+
+        if self.tasks is None:
+            try:
+                voices = self.tts_engine.get_available_voices(language)
+            except Exception as e:
+                on_error(e)
+                return
+            reconcile(voices)
+            return
+
+        self.tasks.submit(
+            self.tts_engine.get_available_voices,
+            language,
+            on_done=reconcile,
+            on_error=on_error,
+            key=f"voices-{id(self)}"
+        )
+
+    def _populate_voices(self, voices: List[Dict], keep_selection: bool = True):
+        if not self.winfo_exists():
+            return
+        if not voices:
+            self._on_load_error(ValueError("No voices available for selected language"))
+            return
+
+        previous = self.voice_var.get() if keep_selection else None
+        self.voices = voices
+        voice_names = [v['name'] for v in self.voices]
+        self.dropdown['values'] = voice_names
+        self.voice_var.set(previous if previous in voice_names else voice_names[0])
+        self._update_details()
+
+    def _on_load_error(self, error: Exception):
+        if not self.winfo_exists():
+            return
+        self.details_var.set("Error loading voices")
+        messagebox.showerror("Voice Error", f"Failed to load voices:\n{str(error)}")
 
     def get_selected_voice(self) -> Optional[Dict]:
         """Get complete details of the currently selected voice."""
@@ -155,7 +155,10 @@ class ElevenLabsLayout(ttk.Frame):
         try:
             # Update language dropdown
             if hasattr(self, 'language_dropdown') and self.language_dropdown:
-                self.language_dropdown.load_languages(model=selected_model_key)
+                self.language_dropdown.load_languages(
+                    model=selected_model_key,
+                    on_loaded=self.voice_dropdown.load_voices_for_language
+                )
 
         except Exception as e:
             messagebox.showerror("Model Change Error", f"Failed to update UI after model change:\n{e}")
@@ -0,0 +1,206 @@
+import io
+import queue
+import threading
+import pygame
+from typing import Callable, Iterator, List, Optional
+from core.utils import setup_logger
+
+_END = object()
+
+class ProgressivePlayer:
+    """
+    Plays audio segments back to back while later segments are still being produced.
+
+    A producer thread pulls segments from an iterator, decodes them and puts
+    them on a bounded queue. The Tk main loop polls the queue and hands the
+    next segment to the playback channel as soon as the channel's queue slot
+    frees up, so segments play without gaps and playback starts with the first.
+    When production ends, however it ends, the producer closes the iterator
+    and the synthesis handle it came from.
+    """
+
+    def __init__(self, root, max_buffered: int = 4, poll_ms: int = 50):
+        self.root = root
+        self.max_buffered = max_buffered
+        self.poll_ms = poll_ms
+        self.logger = setup_logger()
+        self.channel: Optional[pygame.mixer.Channel] = None
+        self.is_paused = False
+        self._segments: Optional[queue.Queue] = None
+        self._stop = threading.Event()
+        self._producer: Optional[threading.Thread] = None
+        self._generation = 0
+        self._parts: List[bytes] = []
+        self._received = 0
+        self._producer_done = False
+        self._on_first_audio: Optional[Callable[[], None]] = None
+        self._on_audio_ready: Optional[Callable[[List[bytes]], None]] = None
+        self._on_playback_end: Optional[Callable[[], None]] = None
+        self._on_error: Optional[Callable[[Exception], None]] = None
+        self._on_segment: Optional[Callable[[int, int], None]] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._segments is not None
+
+    def start(
+        self,
+        segments: Iterator[bytes],
+        on_first_audio: Optional[Callable[[], None]] = None,
+        on_audio_ready: Optional[Callable[[List[bytes]], None]] = None,
+        on_playback_end: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_segment: Optional[Callable[[int, int], None]] = None,
+        handle=None
+    ) -> None:
+        """
+        Begin producing and playing segments.
+
+        handle is the SynthesisHandle segments reads from, when segments wraps
+        it (e.g. regroup_mp3_frames); it is closed with segments so usage is
+        recorded and the synthesis released on finish, error or stop rather
+        than at garbage collection.
+
+        Callbacks run on the Tk thread: on_first_audio when playback starts,
+        on_segment with the segment count and bytes received so far as each
+        segment arrives, on_audio_ready with every segment once production
+        finishes, and on_playback_end when the last segment has played. A
+        callback that raises is logged and playback carries on.
+        """
+        self.stop()
+        self._generation += 1
+        self._stop = threading.Event()
+        self._segments = queue.Queue(maxsize=self.max_buffered)
+        self._parts = []
+        self._received = 0
+        self._producer_done = False
+        self._on_first_audio = on_first_audio
+        self._on_audio_ready = on_audio_ready
+        self._on_playback_end = on_playback_end
+        self._on_error = on_error
+        self._on_segment = on_segment
+        self.is_paused = False
+
+        self._producer = threading.Thread(
+            target=self._produce,
+            args=(segments, handle, self._segments, self._stop),
+            name="tts-progressive-producer",
+            daemon=True
+        )
+        self._producer.start()
+        self.root.after(self.poll_ms, self._poll, self._generation)
+
+    def _produce(self, segments: Iterator[bytes], handle, buffer: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for data in segments:
+                sound = pygame.mixer.Sound(file=io.BytesIO(data))
+                if not self._put(buffer, (data, sound), stop):
+                    break
+            else:
+                self._put(buffer, _END, stop)
+        except Exception as e:
+            self._put(buffer, e, stop)
+        finally:
+            # Closed here, on the thread iterating them; closing a running generator from another thread fails
+            for source in (segments, handle):
+                if hasattr(source, "close"):
+                    try:
+                        source.close()
+                    except Exception as e:
+                        self.logger.error(f"Failed to close synthesis: {e}")
+
+    @staticmethod
+    def _put(buffer: queue.Queue, item, stop: threading.Event) -> bool:
+        """Blocking put that gives up once playback is stopped"""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _poll(self, generation: int) -> None:
+        if not self._is_current(generation):
+            return
+        try:
+            self._advance(generation)
+        except Exception as e:
+            self.logger.error(f"Progressive playback poll failed: {e}")
+        finally:
+            # Keep polling until playback finishes, is stopped or is replaced by a new start()
+            if self._is_current(generation):
+                self.root.after(self.poll_ms, self._poll, generation)
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation and self._segments is not None
+
+    def _advance(self, generation: int) -> None:
+        """Hand buffered segments to the channel and detect the end of playback"""
+        # Callbacks may stop playback or start another, so recheck after each one
+        while (self._is_current(generation) and not self._producer_done
+               and (self.channel is None or self.channel.get_queue() is None)):
+            try:
+                item = self._segments.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is _END:
+                self._producer_done = True
+                self._call(self._on_audio_ready, list(self._parts))
+            elif isinstance(item, Exception):
+                self._finish()
+                self._call(self._on_error, item)
+                return
+            else:
+                data, sound = item
+                self._parts.append(data)
+                self._received += len(data)
+                if self.channel is None or not self.channel.get_busy():
+                    self.channel = sound.play()
+                else:
+                    self.channel.queue(sound)
+                self._call(self._on_segment, len(self._parts), self._received)
+                if len(self._parts) == 1 and self._is_current(generation):
+                    self._call(self._on_first_audio)
+
+        if not self._is_current(generation):
+            return
+        if self._producer_done and not self.is_paused and (self.channel is None or not self.channel.get_busy()):
+            self._finish()
+            self._call(self._on_playback_end)
+
+    def _call(self, callback: Optional[Callable], *args) -> None:
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            self.logger.error(f"Playback callback {getattr(callback, '__name__', callback)} failed: {e}")
+
+    def pause(self) -> None:
+        if self.channel:
+            self.channel.pause()
+        self.is_paused = True
+
+    def unpause(self) -> None:
+        if self.channel:
+            self.channel.unpause()
+        self.is_paused = False
+
+    def stop(self) -> None:
+        """Stop playback and abandon any segments still being produced"""
+        self._stop.set()
+        if self.channel:
+            self.channel.stop()
+        self._finish()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the producer to close its segments, e.g. after stop() before the app exits"""
+        if self._producer is not None:
+            self._producer.join(timeout)
+
+    def _finish(self) -> None:
+        self._segments = None
+        self.channel = None
+        self.is_paused = False
@@ -0,0 +1,95 @@
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from core.utils import setup_logger
+
+class BackgroundTasks:
+    """
+    Runs blocking work off the Tk thread and hands results back to it.
+
+    submit() runs a function on a small thread pool; its on_done/on_error
+    callbacks run on the Tk thread, picked up by a poll loop on after().
+    Submitting under a key that is already running supersedes the older
+    task, whose callbacks are dropped, so only the latest request wins. post()
+    lets any thread schedule a call on the Tk thread. A callback that raises
+    is logged and skipped; it never stops the poll loop.
+    """
+
+    def __init__(self, root, max_workers: int = 4, poll_ms: int = 50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-gui")
+        self._pending: List[Tuple[Future, Optional[Callable], Optional[Callable], Optional[str]]] = []
+        self._latest: Dict[str, Future] = {}
+        self._posted: "queue.SimpleQueue[Tuple[Callable, tuple]]" = queue.SimpleQueue()
+        self._closed = False
+        self.logger = setup_logger()
+        self.root.after(self.poll_ms, self._poll)
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        on_done: Optional[Callable] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        key: Optional[str] = None,
+        **kwargs
+    ) -> Future:
+        """Run fn(*args, **kwargs) in the background; callbacks run on the Tk thread"""
+        future = self._executor.submit(fn, *args, **kwargs)
+        if key is not None:
+            self._latest[key] = future
+        self._pending.append((future, on_done, on_error, key))
+        return future
+
+    def post(self, fn: Callable, *args) -> None:
+        """Schedule fn(*args) on the Tk thread; safe to call from any thread"""
+        self._posted.put((fn, args))
+
+    def _poll(self) -> None:
+        if self._closed:
+            return
+        try:
+            self._run_posted()
+            self._run_finished()
+        finally:
+            self.root.after(self.poll_ms, self._poll)
+
+    def _call(self, fn: Callable, *args) -> None:
+        try:
+            fn(*args)
+        except Exception:
+            self.logger.exception(f"Background callback {getattr(fn, '__qualname__', fn)} failed")
+
+    def _run_posted(self) -> None:
+        while True:
+            try:
+                fn, args = self._posted.get_nowait()
+            except queue.Empty:
+                break
+            self._call(fn, *args)
+
+    def _run_finished(self) -> None:
+        still_pending = []
+        for task in self._pending:
+            future, on_done, on_error, key = task
+            if not future.done():
+                still_pending.append(task)
+                continue
+            if key is not None:
+                if self._latest.get(key) is not future:
+                    continue
+                del self._latest[key]
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                if on_error:
+                    self._call(on_error, error)
+            elif on_done:
+                self._call(on_done, future.result())
+        self._pending = still_pending
+
+    def shutdown(self) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,126 @@
+"""
+Throughput benchmark for the Google client pool.
+
+Run from the repository root:
+
+    python tests/bench_channels.py [--requests N] [--workers N] [--latency SECONDS]
+                                   [--streams N] [--channels 1 2 4 8]
+
+A local gRPC server stands in for SynthesizeSpeech, answering every call
+after the given latency and serving at most --streams calls at a time per
+client connection, like a frontend's per-connection stream limit; calls
+over the limit wait their turn. Each pool size sends the same requests
+through GoogleAudioConfig from --workers threads and reports requests per
+second.
+
+The ceiling is min(workers, channels * streams) / latency: 160, 320, 640
+and 640 req/s for 1, 2, 4 and 8 channels with the defaults (8 streams, 32
+workers, 50 ms). Client and stub share one process, so past a few hundred
+req/s the Python and gRPC overhead, not the stream limit, sets the pace;
+on one core, three runs gave about 157, 310, 520-550 and 450-515 req/s.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("GRPC_VERBOSITY", "ERROR")
+import grpc
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from google.cloud import texttospeech
+from google.cloud.texttospeech_v1.services.text_to_speech.transports.grpc import TextToSpeechGrpcTransport
+from core.tts.concurrency import AdaptiveConcurrencyLimiter
+from core.tts.google.audio_config import GoogleAudioConfig
+from core.tts.google.client_pool import GoogleClientPool, channel_options
+from core.tts.rate_limit import RateLimiter
+
+VOICE = {"language_code": "en-US", "name": "en-US-Wavenet-D"}
+AUDIO = b"\xff" * 4096
+
+def stub_server(latency: float, streams: int, workers: int) -> tuple:
+    # context.peer() names the client connection; each one gets its own stream budget
+    slots = defaultdict(lambda: threading.BoundedSemaphore(streams))
+    slots_lock = threading.Lock()
+
+    def synthesize(request, context):
+        with slots_lock:
+            slot = slots[context.peer()]
+        with slot:
+            time.sleep(latency)
+        return texttospeech.SynthesizeSpeechResponse(audio_content=AUDIO)
+
+    handler = grpc.method_handlers_generic_handler(
+        "google.cloud.texttospeech.v1.TextToSpeech",
+        {
+            "SynthesizeSpeech": grpc.unary_unary_rpc_method_handler(
+                synthesize,
+                request_deserializer=texttospeech.SynthesizeSpeechRequest.deserialize,
+                response_serializer=texttospeech.SynthesizeSpeechResponse.serialize
+            )
+        }
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=workers * 2),
+        handlers=[handler]
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, f"127.0.0.1:{port}"
+
+def insecure_client(address: str) -> texttospeech.TextToSpeechClient:
+    channel = grpc.insecure_channel(address, options=channel_options())
+    return texttospeech.TextToSpeechClient(transport=TextToSpeechGrpcTransport(channel=channel))
+
+def run(address: str, channels: int, requests: int, workers: int) -> float:
+    pool = GoogleClientPool.create(None, channels, client_factory=lambda credentials: insecure_client(address))
+    config = GoogleAudioConfig(
+        pool.clients[0],
+        voice_manager=object(),
+        rate_limiter=RateLimiter(),
+        concurrency=AdaptiveConcurrencyLimiter(initial=workers, max_limit=workers),
+        client_pool=pool
+    )
+    # Connect every channel before timing
+    for client in pool.clients:
+        client.synthesize_speech(input=texttospeech.SynthesisInput(text="warm"), voice=VOICE,
+                                 audio_config=texttospeech.AudioConfig(audio_encoding="MP3"))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda i: config.generate_to_memory(f"Request {i}", voice_data=VOICE),
+            range(requests)
+        ))
+    elapsed = time.perf_counter() - started
+    assert all(result == AUDIO for result in results)
+    return requests / elapsed
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds each stubbed call takes")
+    parser.add_argument("--streams", type=int, default=8, help="concurrent streams the server allows per connection")
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    server, address = stub_server(args.latency, args.streams, args.workers)
+    try:
+        baseline = None
+        for channels in args.channels:
+            throughput = run(address, channels, args.requests, args.workers)
+            baseline = baseline or throughput
+            print(f"{channels:>2} channel(s)   {throughput:8.1f} req/s   {throughput / baseline:5.2f}x")
+    finally:
+        server.stop(None)
+
+if __name__ == "__main__":
+    main()
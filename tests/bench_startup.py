@@ -0,0 +1,194 @@
+"""
+Cold-start benchmark for the engine setup TTSApp does before its window appears.
+
+Run from the repository root:
+
+    python tests/bench_startup.py [--runs N] [--user-latency SECONDS] [--baseline REV]
+
+Each run is a fresh interpreter that imports what gui/app.py imports from
+core and then builds engines the way TTSApp.__init__ does:
+
+  baseline  the tree at REV (git archive): TTSFactory.create for Google and
+            ElevenLabs, ElevenLabs blocking on /v1/user in its constructor
+  current   this tree: ProviderRegistry.get(GOOGLE) with the same create
+            callback as TTSApp._create_engine; ElevenLabs is warmed after
+            the window is up, so "all ready" additionally waits for that
+
+Both trees see the same fake service-account key and ElevenLabs key under a
+temporary HOME, and every ElevenLabs request is answered by a local stub
+that waits --user-latency seconds. Tk, ttkbootstrap and pygame setup are
+left out; they are the same in both trees. Figures from a Linux container,
+Python 3.11, grpcio 1.84, median of 7 runs, three invocations each:
+
+    --user-latency 0      baseline 547-569 ms   current 440-487 ms (all ready 448-493 ms)
+    --user-latency 0.3    baseline 868 ms       current 470 ms     (all ready 476 ms)
+
+Without a network round trip the window comes up about 80-110 ms sooner,
+mostly from not importing the ElevenLabs backend. The rest is the Google
+client, which is still built before the window because it is the default
+service. With a real /v1/user round trip the baseline also waits for that;
+the current ElevenLabs engine syncs usage on first use, so neither column
+of the current tree includes it.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = "e5667c8"
+
+# Sends every ElevenLabs request to the local stub once requests.adapters is
+# imported, so neither tree pays for importing requests before the timer starts
+REDIRECT = """
+import importlib.abc, importlib.machinery, sys
+class _Redirect(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name != "requests.adapters":
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        exec_module = spec.loader.exec_module
+        def patched(module):
+            exec_module(module)
+            send = module.HTTPAdapter.send
+            def redirect(self, request, **kwargs):
+                request.url = request.url.replace("https://api.elevenlabs.io", STUB)
+                return send(self, request, **kwargs)
+            module.HTTPAdapter.send = redirect
+        spec.loader.exec_module = patched
+        return spec
+sys.meta_path.insert(0, _Redirect())
+"""
+
+STARTUP = {
+    "baseline": """
+services = {
+    service: TTSFactory.create(service_type=service, auth_manager=auth, update_callback=lambda stats: None)
+    for service in (TTSService.GOOGLE, TTSService.ELEVENLABS)
+}
+services[TTSService.GOOGLE].voice_manager
+window = all_ready = time.perf_counter() - started
+""",
+    "current": """
+from core.tts.registry import ProviderRegistry
+providers = ProviderRegistry(auth, create=lambda service: TTSFactory.create(
+    service_type=service, auth_manager=auth, update_callback=lambda stats: None))
+providers.get(TTSService.GOOGLE).voice_manager
+window = time.perf_counter() - started
+providers.warm(TTSService.ELEVENLABS).result()
+all_ready = time.perf_counter() - started
+"""
+}
+
+def child_script(src: Path, stub_url: str, mode: str) -> str:
+    return (
+        f"STUB = {stub_url!r}\n" + REDIRECT +
+        "import time\nstarted = time.perf_counter()\n"
+        f"sys.path.insert(0, {str(src)!r})\n"
+        "from core.auth import AuthManager\n"
+        "from core.tts.factory import TTSFactory\n"
+        "from core.tts.service_types import TTSService\n"
+        "auth = AuthManager()\n" + STARTUP[mode] +
+        "print(window, all_ready)\n"
+    )
+
+def fake_home(path: Path) -> None:
+    """Credentials the engines accept without ever reaching Google or ElevenLabs"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    config = path / ".tts_app"
+    config.mkdir()
+    (config / "google.json").write_text(json.dumps({
+        "type": "service_account",
+        "project_id": "bench",
+        "private_key_id": "bench",
+        "private_key": pem,
+        "client_email": "bench@bench.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token"
+    }))
+    (config / "elevenlabs.json").write_text(json.dumps({"api_key": "bench-key"}))
+
+def elevenlabs_stub(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps({
+                "subscription": {"character_count": 0, "character_limit": 10000},
+                "voices": []
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def export_tree(rev: str, dest: Path) -> Path:
+    archive = subprocess.run(["git", "-C", str(ROOT), "archive", rev, "src"], capture_output=True, check=True)
+    subprocess.run(["tar", "-x", "-C", str(dest)], input=archive.stdout, check=True)
+    return dest / "src"
+
+def time_startup(src: Path, mode: str, stub_url: str, home: Path):
+    with tempfile.TemporaryDirectory() as cwd:
+        # A fresh HOME per run, so no cache, snapshot or usage ledger carries over
+        run_home = Path(cwd) / "home"
+        run_home.mkdir()
+        (run_home / ".tts_app").mkdir()
+        for name in ("google.json", "elevenlabs.json"):
+            (run_home / ".tts_app" / name).write_bytes((home / ".tts_app" / name).read_bytes())
+        output = subprocess.run(
+            [sys.executable, "-c", child_script(src, stub_url, mode)],
+            capture_output=True, text=True, cwd=cwd, env={"HOME": str(run_home), "PATH": ""}
+        )
+    if output.returncode:
+        raise RuntimeError(f"{mode} startup failed:\n{output.stderr}")
+    window, all_ready = output.stdout.split()[-2:]
+    return float(window), float(all_ready)
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--user-latency", type=float, default=0.0,
+                        help="seconds every stubbed ElevenLabs request takes")
+    parser.add_argument("--baseline", default=BASELINE, help="git revision to compare against")
+    args = parser.parse_args(argv)
+
+    server = elevenlabs_stub(args.user_latency)
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            workdir = Path(workdir)
+            (workdir / "home").mkdir()
+            fake_home(workdir / "home")
+            trees = {"baseline": export_tree(args.baseline, workdir), "current": ROOT / "src"}
+            for mode, src in trees.items():
+                # The first run writes bytecode caches; don't count it
+                time_startup(src, mode, stub_url, workdir / "home")
+                runs = [time_startup(src, mode, stub_url, workdir / "home") for _ in range(args.runs)]
+                window = statistics.median(run[0] for run in runs) * 1000
+                all_ready = statistics.median(run[1] for run in runs) * 1000
+                print(f"{mode:<10} window {window:8.1f} ms   all services ready {all_ready:8.1f} ms")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+collect_ignore = ["test-api.py"]
+
+class FakeAuthManager:
+    """Hands the engine a prebuilt client instead of reading credentials"""
+
+    def __init__(self, client=None):
+        self.client = client if client is not None else object()
+
+    def get_credentials_path(self, service):
+        return None
+
+    def validate_credentials(self, service, path):
+        return True
+
+    def initialize_client(self, service, path):
+        return self.client, None
+
+class FakeUsageMonitor:
+    """Records usage updates in memory"""
+
+    def __init__(self, *args, **kwargs):
+        self.updates = []
+
+    def update_usage(self, char_count):
+        self.updates.append(char_count)
+
+    def get_character_stats(self):
+        return {"total_characters": sum(self.updates)}
+
+    get_usage_stats = get_character_stats
+
+@pytest.fixture
+def fake_usage_monitor():
+    return FakeUsageMonitor
+
+@pytest.fixture
+def engine_factory(monkeypatch, tmp_path):
+    """Builds GoogleCloudTTS engines around a fake client, with usage kept in memory"""
+    from core.tts.cache import SynthesisCache
+    from core.tts.google import google_cloud
+
+    monkeypatch.setattr(google_cloud, "GoogleUsageMonitor", FakeUsageMonitor)
+
+    def make(client, **kwargs):
+        kwargs.setdefault("cache", SynthesisCache(tmp_path))
+        return google_cloud.GoogleCloudTTS(auth_manager=FakeAuthManager(client), **kwargs)
+    return make
+
+@pytest.fixture
+def async_engine_factory(monkeypatch, tmp_path):
+    """Builds AsyncGoogleCloudTTS engines around a fake async client, each with its own rate limiter"""
+    from core.tts.cache import SynthesisCache
+    from core.tts.google import google_cloud_async
+    from core.tts.rate_limit import RateLimiter
+
+    monkeypatch.setattr(google_cloud_async, "GoogleUsageMonitor", FakeUsageMonitor)
+    monkeypatch.setattr(RateLimiter, "for_service", classmethod(lambda cls, service, key=None: RateLimiter()))
+
+    def make(client, max_concurrency):
+        return google_cloud_async.AsyncGoogleCloudTTS(
+            auth_manager=FakeAuthManager(),
+            cache=SynthesisCache(tmp_path),
+            max_concurrency=max_concurrency,
+            async_client=client
+        )
+    return make
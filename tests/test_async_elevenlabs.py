@@ -0,0 +1,113 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from core.exception import ElevenLabsAPIError
+from core.tts.cache import SynthesisCache
+from core.tts.elevenlabs import elevenlabs_async
+from core.tts.elevenlabs.async_transport import AsyncElevenLabsTransport
+from core.tts.elevenlabs.elevenlabs_async import AsyncElevenLabsTTS
+
+VOICE = {"voice_id": "voice123", "model": "eleven_multilingual_v2"}
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", body=None):
+        self.status_code = status_code
+        self.content = content
+        self.body = body or {}
+        self.text = str(self.body)
+
+    @property
+    def is_error(self):
+        return self.status_code >= 400
+
+    def json(self):
+        return self.body
+
+class FakeAsyncClient:
+    """Stands in for httpx.AsyncClient, answering each request with the next scripted response"""
+
+    def __init__(self, **config):
+        self.config = config
+        self.responses = []
+        self.requests = []
+        self.closed = False
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def aclose(self):
+        self.closed = True
+
+class Timeout:
+    def __init__(self, timeout, connect=None):
+        self.read, self.connect = timeout, connect
+
+@pytest.fixture
+def httpx(monkeypatch):
+    """A stub httpx module, so the async engine can be tested without the optional dependency"""
+    module = types.ModuleType("httpx")
+    module.AsyncClient = FakeAsyncClient
+    module.Timeout = Timeout
+    module.Limits = lambda **limits: limits
+    module.HTTPError = type("HTTPError", (Exception,), {})
+    module.TransportError = type("TransportError", (module.HTTPError,), {})
+    monkeypatch.setitem(sys.modules, "httpx", module)
+    return module
+
+@pytest.fixture
+def engine(httpx, monkeypatch, tmp_path, fake_usage_monitor):
+    monkeypatch.setattr(elevenlabs_async, "ElevenLabsUsageMonitor", fake_usage_monitor)
+    return AsyncElevenLabsTTS("test-key", cache=SynthesisCache(tmp_path), max_concurrency=4)
+
+def test_agenerate_posts_through_httpx_and_caches(engine):
+    client = engine.transport.client
+    client.responses = [FakeResponse(content=b"audio")]
+
+    async def run():
+        first = await engine.agenerate("Hello there.", voice_data=VOICE)
+        second = await engine.agenerate("Hello there.", voice_data=VOICE)
+        await engine.aclose()
+        return first, second
+
+    assert asyncio.run(run()) == (b"audio", b"audio")
+    (method, url, kwargs), = client.requests
+    assert (method, url) == ("POST", "https://api.elevenlabs.io/v1/text-to-speech/voice123")
+    assert kwargs["json"]["text"] == "Hello there."
+    # The retry deadline caps the transport's timeouts instead of replacing them
+    assert (kwargs["timeout"].connect, kwargs["timeout"].read) == (5.0, 60.0)
+    assert client.config["headers"]["xi-api-key"] == "test-key"
+    assert engine.usage_monitor.updates == [len("Hello there.")]
+    assert client.closed
+
+def test_agenerate_retries_transient_failures(engine, httpx):
+    client = engine.transport.client
+    client.responses = [
+        FakeResponse(503, body={"detail": "busy"}),
+        httpx.TransportError("connection reset"),
+        FakeResponse(content=b"audio")
+    ]
+
+    assert asyncio.run(engine.agenerate("Hello there.", voice_data=VOICE)) == b"audio"
+    assert len(client.requests) == 3
+
+def test_agenerate_wraps_api_errors(engine):
+    engine.transport.client.responses = [FakeResponse(401, body={"detail": "invalid key"})]
+
+    with pytest.raises(RuntimeError, match="ElevenLabs TTS generation failed") as excinfo:
+        asyncio.run(engine.agenerate("Hello there.", voice_data=VOICE))
+    assert isinstance(excinfo.value.__cause__, ElevenLabsAPIError)
+    assert excinfo.value.__cause__.status_code == 401
+    assert engine.usage_monitor.updates == []
+
+def test_missing_httpx_names_the_package(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", None)
+
+    with pytest.raises(ImportError, match="pip install httpx"):
+        AsyncElevenLabsTransport("test-key")
@@ -0,0 +1,62 @@
+import asyncio
+
+VOICE = {"language_code": "en-US", "name": "en-US-Wavenet-D"}
+
+class FakeAsyncClient:
+    """Stands in for TextToSpeechAsyncClient and tracks how many calls overlap"""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def synthesize_speech(self, input, voice, audio_config, timeout=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return type("Response", (), {"audio_content": input.text.encode()})()
+        finally:
+            self.in_flight -= 1
+
+def test_agenerate_many_bounds_concurrency(async_engine_factory):
+    client = FakeAsyncClient()
+    engine = async_engine_factory(client, max_concurrency=8)
+    texts = [f"Sentence number {i}." for i in range(200)]
+
+    results = asyncio.run(engine.agenerate_many(texts, voice_data=VOICE))
+
+    assert results == [text.encode() for text in texts]
+    assert client.calls == 200
+    assert client.max_in_flight == 8
+    assert sum(engine.usage_monitor.updates) == sum(len(text) for text in texts)
+
+def test_agenerate_serves_repeats_from_cache(async_engine_factory):
+    client = FakeAsyncClient(delay=0)
+    engine = async_engine_factory(client, max_concurrency=4)
+
+    async def run():
+        first = await engine.agenerate("Hello there.", voice_data=VOICE)
+        second = await engine.agenerate("Hello there.", voice_data=VOICE)
+        return first, second
+
+    assert asyncio.run(run()) == (b"Hello there.", b"Hello there.")
+    assert client.calls == 1
+
+def test_agenerate_retries_transient_errors(async_engine_factory):
+    from google.api_core.exceptions import ServiceUnavailable
+
+    class FlakyClient(FakeAsyncClient):
+        async def synthesize_speech(self, input, voice, audio_config, timeout=None):
+            self.calls += 1
+            if self.calls == 1:
+                raise ServiceUnavailable("try again")
+            return type("Response", (), {"audio_content": input.text.encode()})()
+
+    client = FlakyClient()
+    engine = async_engine_factory(client, max_concurrency=2)
+
+    assert asyncio.run(engine.agenerate("Second time lucky.", voice_data=VOICE)) == b"Second time lucky."
+    assert client.calls == 2
@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+
+import pytest
+
+from core.auth import AuthManager
+from core.tts.service_types import TTSService
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    AuthManager.clear_cache()
+    yield
+    AuthManager.clear_cache()
+
+def write_creds(path, api_key, mtime=None):
+    path.write_text(json.dumps({"api_key": api_key}))
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+def counting_initializer(auth, service, built):
+    def initializer(path):
+        built.append(path)
+        return object(), None
+    auth.service_configs[service]['initializer'] = initializer
+
+def test_credentials_are_parsed_once_until_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "elevenlabs.json"
+    write_creds(path, "first", mtime=1_000_000_000)
+    auth = AuthManager()
+    monkeypatch.setattr(auth, "get_credentials_path", lambda service: path)
+    reads = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda *a, **kw: reads.append(a[0]) or real_open(*a, **kw))
+
+    assert auth.get_api_key(TTSService.ELEVENLABS) == "first"
+    assert auth.get_api_key(TTSService.ELEVENLABS) == "first"
+    assert len(reads) == 1
+
+    write_creds(path, "second", mtime=2_000_000_000)
+    assert auth.get_api_key(TTSService.ELEVENLABS) == "second"
+    assert len(reads) == 2
+
+def test_clients_are_shared_between_managers(tmp_path):
+    path = tmp_path / "google.json"
+    write_creds(path, "unused", mtime=1_000_000_000)
+    built = []
+    first, second = AuthManager(), AuthManager()
+    counting_initializer(first, TTSService.GOOGLE, built)
+    counting_initializer(second, TTSService.GOOGLE, built)
+
+    client, _ = first.initialize_client(TTSService.GOOGLE, path)
+
+    assert second.initialize_client(TTSService.GOOGLE, path)[0] is client
+    assert len(built) == 1
+
+    write_creds(path, "rotated", mtime=2_000_000_000)
+    assert first.initialize_client(TTSService.GOOGLE, path)[0] is not client
+    assert len(built) == 2
+
+def test_concurrent_callers_build_one_client(tmp_path):
+    path = tmp_path / "google.json"
+    write_creds(path, "unused")
+    auth = AuthManager()
+    built = []
+    release = threading.Event()
+
+    def initializer(path):
+        release.wait(2)
+        built.append(path)
+        return object(), None
+    auth.service_configs[TTSService.GOOGLE]['initializer'] = initializer
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(auth.initialize_client(TTSService.GOOGLE, path)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert len({id(client) for client, _ in results}) == 1
+
+def test_invalid_json_is_still_rejected(tmp_path):
+    path = tmp_path / "google.json"
+    path.write_text("{not json")
+
+    with pytest.raises(ValueError):
+        AuthManager().validate_credentials(TTSService.GOOGLE, path)
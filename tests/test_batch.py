@@ -0,0 +1,92 @@
+import io
+import json
+
+from core.batch import BatchRunner, JobManifest, read_items
+from core.tts.service_types import TTSService
+
+class FakeEngine:
+    def __init__(self, fail_on=(), cached=()):
+        self.fail_on = set(fail_on)
+        self.cached = set(cached)
+        self.calls = []
+
+    def is_cached(self, text, **kwargs):
+        return text in self.cached
+
+    def generate_to_memory(self, text, **kwargs):
+        self.calls.append((text, kwargs))
+        if text in self.fail_on:
+            raise RuntimeError("synthesis failed")
+        return f"{kwargs.get('audio_format')}:{text}".encode()
+
+def test_read_items_from_jsonl_and_csv():
+    jsonl = io.StringIO(
+        json.dumps({"text": "Hi.", "output": "a.wav", "voice": "en-US-Wavenet-D"}) + "\n\n" +
+        json.dumps({"text": "Yo.", "output": "b.mp3", "service": "elevenlabs", "params": {"stability": 0.3}}) + "\n"
+    )
+    first, second = read_items(jsonl)
+    assert (first.service, first.audio_format, first.voice) == (TTSService.GOOGLE, "WAV", "en-US-Wavenet-D")
+    assert (second.service, second.params, second.line) == (TTSService.ELEVENLABS, {"stability": 0.3}, 3)
+
+    csv_source = io.StringIO('text,output,voice,params\nHello,c.ogg,,"{""speaking_rate"": 1.2}"\n')
+    (item,) = read_items(csv_source, "csv")
+    assert (item.voice, item.params, item.audio_format) == (None, {"speaking_rate": 1.2}, "OGG")
+
+def test_runner_writes_outputs_and_reports_failures(tmp_path):
+    engine = FakeEngine(fail_on={"bad"})
+    runner = BatchRunner(output_dir=tmp_path, workers=3, engine_factory=lambda service: engine)
+    rows = [{"text": f"line {i}", "output": f"out/{i}.mp3"} for i in range(20)]
+    rows.append({"text": "bad", "output": "out/bad.mp3"})
+
+    stats = runner.run(read_items(io.StringIO("\n".join(json.dumps(r) for r in rows))))
+
+    assert (stats.succeeded, stats.failed) == (20, 1)
+    assert (tmp_path / "out" / "7.mp3").read_bytes() == b"MP3:line 7"
+    assert not (tmp_path / "out" / "bad.mp3").exists()
+    assert 0 < stats.percentile(50) <= stats.percentile(99)
+    assert "p99" in stats.summary()
+
+def test_manifest_resume_skips_finished_items(tmp_path):
+    rows = [{"text": f"line {i}", "output": f"{i}.mp3"} for i in range(10)]
+    source = "\n".join(json.dumps(r) for r in rows)
+    manifest_path = tmp_path / "job.manifest"
+
+    first_engine = FakeEngine(fail_on={"line 3", "line 8"})
+    runner = BatchRunner(output_dir=tmp_path, engine_factory=lambda service: first_engine)
+    with JobManifest(manifest_path) as manifest:
+        stats = runner.run(read_items(io.StringIO(source)), manifest=manifest)
+    assert (stats.succeeded, stats.failed) == (8, 2)
+
+    # A crash mid-append leaves a torn line behind; it must not break the resume
+    with open(manifest_path, "a") as f:
+        f.write('{"key": "trunc')
+    (tmp_path / "5.mp3").unlink()
+
+    second_engine = FakeEngine()
+    runner = BatchRunner(output_dir=tmp_path, engine_factory=lambda service: second_engine)
+    with JobManifest(manifest_path) as manifest:
+        stats = runner.run(read_items(io.StringIO(source)), manifest=manifest)
+        assert manifest.billed_chars == sum(len(r["text"]) for r in rows)
+
+    assert (stats.succeeded, stats.failed, stats.skipped) == (3, 0, 7)
+    assert sorted(text for text, _ in second_engine.calls) == ["line 3", "line 5", "line 8"]
+
+def test_manifest_bills_nothing_for_cache_hits(tmp_path):
+    rows = [{"text": f"line {i}", "output": f"{i}.mp3"} for i in range(4)]
+    engine = FakeEngine(cached={"line 1", "line 2"})
+    runner = BatchRunner(output_dir=tmp_path, engine_factory=lambda service: engine)
+
+    with JobManifest(tmp_path / "job.manifest") as manifest:
+        stats = runner.run(read_items(io.StringIO("\n".join(json.dumps(r) for r in rows))), manifest=manifest)
+        assert manifest.billed_chars == len("line 0") + len("line 3")
+    assert stats.succeeded == 4
+
+def test_hedge_is_passed_to_engines_as_a_policy(monkeypatch, tmp_path):
+    created = []
+    monkeypatch.setattr("core.batch.runner.TTSFactory.create", lambda service, **kwargs: created.append(kwargs) or FakeEngine())
+
+    BatchRunner(output_dir=tmp_path, hedge=True, auth_manager=object()).get_engine(TTSService.GOOGLE)
+    BatchRunner(output_dir=tmp_path, auth_manager=object()).get_engine(TTSService.GOOGLE)
+
+    assert created[0]["retry_policy"].hedge
+    assert created[1]["retry_policy"] is None
@@ -0,0 +1,66 @@
+import os
+
+from core.tts.cache import SynthesisCache
+from core.tts.service_types import TTSService
+
+def test_key_ignores_whitespace_and_unicode_form_but_not_params():
+    key = SynthesisCache.make_key(TTSService.GOOGLE, "Café  au\nlait", voice_name="en-US-Wavenet-D", pitch=0.0)
+    assert key == SynthesisCache.make_key(TTSService.GOOGLE, " Café au lait ", pitch=0.0, voice_name="en-US-Wavenet-D")
+    assert key != SynthesisCache.make_key(TTSService.GOOGLE, "Café au lait", voice_name="en-US-Wavenet-D", pitch=1.0)
+    assert key != SynthesisCache.make_key(TTSService.ELEVENLABS, "Café au lait", voice_name="en-US-Wavenet-D", pitch=0.0)
+
+def test_hit_and_miss_survive_a_restart(tmp_path):
+    cache = SynthesisCache(tmp_path)
+    key = SynthesisCache.make_key(TTSService.GOOGLE, "Hello")
+    assert cache.get(key) is None and key not in cache
+
+    cache.put(key, b"audio")
+    assert key in cache
+    assert cache.get(key) == b"audio"
+    assert SynthesisCache(tmp_path).get(key) == b"audio"
+    assert SynthesisCache(tmp_path, max_bytes=0).get(key) is None
+
+def test_evicts_least_recently_used_beyond_the_byte_cap(tmp_path):
+    cache = SynthesisCache(tmp_path, max_bytes=10)
+    cache.put("a" * 64, b"aaaa")
+    cache.put("b" * 64, b"bbbb")
+    cache.get("a" * 64)
+    cache.put("c" * 64, b"cccc")
+
+    assert cache.get("b" * 64) is None
+    assert cache.get("a" * 64) == b"aaaa" and cache.get("c" * 64) == b"cccc"
+    assert not list(tmp_path.glob("bb/*"))
+
+    # Entries larger than the whole cache are never stored
+    cache.put("d" * 64, b"d" * 11)
+    assert "d" * 64 not in cache
+
+def test_corrupt_and_missing_entries_are_dropped(tmp_path):
+    cache = SynthesisCache(tmp_path)
+    truncated, deleted = "e" * 64, "f" * 64
+    cache.put(truncated, b"full audio")
+    cache.put(deleted, b"more audio")
+    cache._path_for(truncated).write_bytes(b"full")
+    os.unlink(cache._path_for(deleted))
+
+    assert cache.get(truncated) is None and truncated not in cache
+    assert not cache._path_for(truncated).exists()
+    assert cache.get(deleted) is None and deleted not in cache
+
+    # An empty file found on disk at startup is not served either
+    cache._path_for(truncated).write_bytes(b"")
+    assert SynthesisCache(tmp_path).get(truncated) is None
+
+    cache.put(truncated, b"full audio")
+    assert cache.get(truncated) == b"full audio"
+
+def test_engines_share_one_cache_per_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr(SynthesisCache, "_instances", {})
+    first = SynthesisCache.for_dir(tmp_path, max_bytes=10)
+    second = SynthesisCache.for_dir(str(tmp_path / "." ), max_bytes=10)
+    assert second is first
+    assert SynthesisCache.for_dir(tmp_path / "other") is not first
+
+    first.put("a" * 64, b"aaaaaa")
+    second.put("b" * 64, b"bbbbbb")
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.audio")) <= 10
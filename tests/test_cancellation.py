@@ -0,0 +1,209 @@
+import threading
+import time
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import grpc
+import pytest
+from google.api_core import exceptions as google_exceptions
+from google.cloud import texttospeech
+from google.cloud.texttospeech_v1.services.text_to_speech.transports.grpc import TextToSpeechGrpcTransport
+
+from core.exception import SynthesisCancelled
+from core.tts.cancellation import CancellationToken
+from core.tts.chunking import ChunkedSynthesizer
+from core.tts.elevenlabs.audio_config import ElevenLabsAudioConfig
+from core.tts.elevenlabs.transport import ElevenLabsTransport
+from core.tts.google.audio_config import GoogleAudioConfig
+from core.tts.rate_limit import RateLimiter
+
+STREAMING_VOICE = {"language_code": "en-US", "name": "en-US-Chirp3-HD-Charon"}
+
+def test_token_runs_callbacks_once():
+    token = CancellationToken()
+    calls = []
+    token.register(lambda: calls.append("a"))
+    unregister = token.register(lambda: calls.append("b"))
+    unregister()
+
+    token.cancel()
+    token.cancel()
+    token.register(lambda: calls.append("late"))
+
+    assert calls == ["a", "late"]
+    with pytest.raises(SynthesisCancelled):
+        token.raise_if_cancelled()
+
+def test_chunker_drops_pending_chunks_on_cancel():
+    token = CancellationToken()
+    started = []
+    release = threading.Event()
+
+    def synth(chunk):
+        started.append(chunk)
+        release.wait(2)
+        return chunk.encode()
+
+    results = ChunkedSynthesizer(max_workers=1).iter_synthesize(["a", "b", "c"], synth, cancel_token=token)
+    threading.Timer(0.05, token.cancel).start()
+    began = time.monotonic()
+    with pytest.raises(SynthesisCancelled):
+        next(results)
+    release.set()
+
+    assert time.monotonic() - began < 1
+    assert started == ["a"]
+
+class SlowStreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for _ in range(50):
+                self.wfile.write(b"4\r\naudi\r\n")
+                self.wfile.flush()
+                time.sleep(0.1)
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def test_elevenlabs_stream_aborts_on_cancel():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        transport = ElevenLabsTransport("test-key", base_url=f"http://127.0.0.1:{server.server_address[1]}/v1")
+        config = ElevenLabsAudioConfig("test-key", transport=transport, rate_limiter=RateLimiter())
+        token = CancellationToken()
+        voice_data = {"voice_id": "voice123", "model": "eleven_multilingual_v2"}
+
+        stream = config.stream("Hello there.", voice_data, "MP3", chunk_size=4, cancel_token=token)
+        assert next(stream) == b"audi"
+        token.cancel()
+        began = time.monotonic()
+        with pytest.raises(SynthesisCancelled):
+            list(stream)
+        assert time.monotonic() - began < 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_elevenlabs_request_closes_its_response_on_cancel():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        transport = ElevenLabsTransport("test-key", base_url=f"http://127.0.0.1:{server.server_address[1]}/v1")
+        config = ElevenLabsAudioConfig("test-key", transport=transport, rate_limiter=RateLimiter())
+        token = CancellationToken()
+        voice_data = {"voice_id": "voice123", "model": "eleven_multilingual_v2"}
+
+        threading.Timer(0.2, token.cancel).start()
+        began = time.monotonic()
+        with pytest.raises(SynthesisCancelled):
+            config.generate_to_memory("Hello there.", voice_data, "MP3", cancel_token=token)
+        assert time.monotonic() - began < 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_google_request_is_cancelled_on_the_wire():
+    cancelled = threading.Event()
+
+    def synthesize(request, context):
+        context.add_callback(cancelled.set)
+        while context.is_active():
+            time.sleep(0.01)
+        return texttospeech.SynthesizeSpeechResponse()
+
+    handler = grpc.method_handlers_generic_handler(
+        "google.cloud.texttospeech.v1.TextToSpeech",
+        {
+            "SynthesizeSpeech": grpc.unary_unary_rpc_method_handler(
+                synthesize,
+                request_deserializer=texttospeech.SynthesizeSpeechRequest.deserialize,
+                response_serializer=texttospeech.SynthesizeSpeechResponse.serialize
+            )
+        }
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2), handlers=[handler])
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+        client = texttospeech.TextToSpeechClient(transport=TextToSpeechGrpcTransport(channel=channel))
+        config = GoogleAudioConfig(client, voice_manager=object(), rate_limiter=RateLimiter())
+        token = CancellationToken()
+
+        threading.Timer(0.2, token.cancel).start()
+        began = time.monotonic()
+        with pytest.raises(SynthesisCancelled):
+            config.generate_to_memory("Hello.", voice_data={"language_code": "en-US", "name": "en-US-Wavenet-D"},
+                                      cancel_token=token)
+        assert time.monotonic() - began < 1
+        assert cancelled.wait(1)
+    finally:
+        server.stop(None)
+
+class CancellableResponses:
+    """Mimics a gRPC streaming call whose iteration fails once cancel() is called"""
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+
+    def __iter__(self):
+        yield texttospeech.StreamingSynthesizeResponse(audio_content=b"first")
+        self.cancelled.wait(2)
+        raise google_exceptions.Cancelled("Locally cancelled")
+
+    def cancel(self):
+        self.cancelled.set()
+
+class FakeStreamingClient:
+    def __init__(self):
+        self.responses = CancellableResponses()
+
+    def streaming_synthesize(self, requests, timeout=None):
+        return self.responses
+
+def test_google_stream_cancels_grpc_call():
+    client = FakeStreamingClient()
+    config = GoogleAudioConfig(client, rate_limiter=RateLimiter())
+    token = CancellationToken()
+
+    stream = config.stream("Hi.", voice_data=STREAMING_VOICE, cancel_token=token)
+    assert next(stream) == b"first"
+    threading.Timer(0.05, token.cancel).start()
+    with pytest.raises(SynthesisCancelled):
+        next(stream)
+    assert client.responses.cancelled.is_set()
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize_speech(self, input, voice, audio_config, timeout=None):
+        self.calls += 1
+        return texttospeech.SynthesizeSpeechResponse(audio_content=input.text.encode())
+
+def test_handle_skips_usage_for_undelivered_chunks(monkeypatch, engine_factory):
+    monkeypatch.setattr(GoogleAudioConfig, "MAX_INPUT_BYTES", 20)
+    engine = engine_factory(FakeClient(), chunker=ChunkedSynthesizer(max_workers=1))
+    engine.audio_config.rate_limiter = RateLimiter()
+    text = "First sentence here. Second sentence here. Third sentence here."
+
+    handle = engine.start_synthesis(text, voice_data={"language_code": "en-US", "name": "en-US-Wavenet-D"})
+    first = next(handle)
+    handle.cancel()
+    with pytest.raises(SynthesisCancelled):
+        next(handle)
+    handle.close()
+
+    assert first == b"First sentence here."
+    assert engine.usage_monitor.updates == [len("First sentence here.")]
@@ -0,0 +1,49 @@
+from core.tts.audio_utils import utf8_len
+from core.tts.chunking import ChunkedSynthesizer, split_text
+
+def test_text_within_the_limit_is_one_chunk():
+    text = "  Short text,\n kept exactly as given. "
+    assert split_text(text, 100) == [text]
+
+def test_splits_at_paragraphs_then_sentences_then_words():
+    assert split_text("First para.\n\nSecond para here.", 20) == ["First para.", "Second para here."]
+    assert split_text("One. Two. Three.", 10) == ["One. Two.", "Three."]
+    assert split_text("alpha beta gamma delta", 11) == ["alpha beta", "gamma delta"]
+
+def test_a_word_over_the_limit_is_split_by_characters():
+    chunks = split_text("tiny supercalifragilistic end", 8)
+    assert chunks == ["tiny", "supercal", "ifragili", "stic end"]
+    assert all(len(chunk) <= 8 for chunk in chunks)
+
+def test_multibyte_text_is_measured_in_utf8_bytes():
+    assert split_text("ééééé", 4, utf8_len) == ["éé", "éé", "é"]
+    assert split_text("Héllo wörld. Ça va?", 14, utf8_len) == ["Héllo wörld.", "Ça va?"]
+    chunks = split_text("日本語です。次の文です。", 20, utf8_len)
+    assert chunks == ["日本語です。", "次の文です。"]
+    assert all(utf8_len(chunk) <= 20 for chunk in chunks)
+
+def test_first_chunk_is_short_even_when_the_text_fits_one_request():
+    sentences = [f"Sentence number {i} is here." for i in range(12)]
+    text = " ".join(sentences)
+    chunks = split_text(text, 5000, first_limit=30)
+
+    assert len(chunks) > 1
+    assert chunks[0] == sentences[0]
+    assert " ".join(chunks) == text
+    # Later chunks grow: each may be twice the size of the one before
+    assert all(len(chunk) <= 30 * 2 ** i for i, chunk in enumerate(chunks))
+    assert len(chunks[-1]) > 30
+
+def test_first_chunk_ramp_respects_the_limit():
+    text = " ".join(f"Word{i}." for i in range(400))
+    chunks = split_text(text, 100, first_limit=20)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert len(chunks[0]) <= 20
+    assert split_text("Short.", 100, first_limit=20) == ["Short."]
+
+def test_calls_share_one_pool():
+    chunker = ChunkedSynthesizer(max_workers=2)
+    assert list(chunker.iter_synthesize(["a", "b", "c"], str.encode)) == [b"a", b"b", b"c"]
+    pool = chunker._pool()
+    assert list(chunker.iter_synthesize(["d"], str.encode)) == [b"d"]
+    assert chunker._pool() is pool
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+from google.cloud import texttospeech
+
+from core.tts.concurrency import AdaptiveConcurrencyLimiter
+from core.tts.google.audio_config import GoogleAudioConfig
+from core.tts.google.client_pool import GoogleClientPool, LEAST_IN_FLIGHT, ROUND_ROBIN
+from core.tts.rate_limit import RateLimiter
+
+VOICE = {"language_code": "en-US", "name": "en-US-Wavenet-D"}
+
+class FakeClient:
+    def __init__(self, name, gate=None):
+        self.name = name
+        self.gate = gate
+        self.calls = 0
+
+    def synthesize_speech(self, timeout=None, **request):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(2)
+        return texttospeech.SynthesizeSpeechResponse(audio_content=self.name.encode())
+
+def test_round_robin_rotates_through_clients():
+    pool = GoogleClientPool([FakeClient("a"), FakeClient("b"), FakeClient("c")], ROUND_ROBIN)
+    picked = []
+    for _ in range(6):
+        with pool.lease() as client:
+            picked.append(client.name)
+    assert picked == ["a", "b", "c", "a", "b", "c"]
+
+def test_least_in_flight_avoids_busy_clients():
+    pool = GoogleClientPool([FakeClient("a"), FakeClient("b")], LEAST_IN_FLIGHT)
+    with pool.lease() as first:
+        with pool.lease() as second:
+            assert {first.name, second.name} == {"a", "b"}
+            assert pool.in_flight == [1, 1]
+        with pool.lease() as third:
+            assert third is second
+    assert pool.in_flight == [0, 0]
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        GoogleClientPool([FakeClient("a")], "random")
+
+def test_audio_config_spreads_calls_over_the_pool():
+    gate = threading.Event()
+    clients = [FakeClient(name, gate) for name in "abcd"]
+    config = GoogleAudioConfig(
+        object(),
+        voice_manager=object(),
+        rate_limiter=RateLimiter(),
+        concurrency=AdaptiveConcurrencyLimiter(initial=8, max_limit=8),
+        client_pool=GoogleClientPool(clients)
+    )
+    pool = config.client_pool
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(config.generate_to_memory("Hi", voice_data=VOICE)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 2
+    while sum(pool.in_flight) < 8 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == sorted([b"a", b"b", b"c", b"d"] * 2)
+    assert [client.calls for client in clients] == [2, 2, 2, 2]
+
+def test_shared_pool_is_rebuilt_when_the_credentials_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(GoogleClientPool, "_instances", {})
+    monkeypatch.setattr(GoogleClientPool, "create", classmethod(
+        lambda cls, credentials, size, strategy=LEAST_IN_FLIGHT: cls([FakeClient(credentials)] * size, strategy)
+    ))
+    path = tmp_path / "key.json"
+    path.write_text("old")
+
+    first = GoogleClientPool.for_credentials(str(path), "old", 2)
+    assert GoogleClientPool.for_credentials(str(path), "old", 2) is first
+
+    path.write_text("rotated key")
+    second = GoogleClientPool.for_credentials(str(path), "new", 2)
+    assert second is not first
+    assert second.clients[0].name == "new"
+    assert GoogleClientPool.for_credentials(str(path), "new", 2) is second
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from google.api_core.exceptions import ResourceExhausted
+
+from core.exception import ElevenLabsAPIError
+from core.tts.concurrency import AdaptiveConcurrencyLimiter, is_overload_error
+
+def test_limit_grows_while_latency_is_stable():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=8)
+
+    for _ in range(30):
+        with limiter.slot():
+            pass
+
+    assert limiter.limit == 8
+
+def test_overload_cuts_limit_once_per_window():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+    with limiter.slot():
+        time.sleep(0.05)
+
+    for _ in range(3):
+        with pytest.raises(ElevenLabsAPIError):
+            with limiter.slot():
+                raise ElevenLabsAPIError("Too many concurrent requests", status_code=429)
+
+    assert limiter.limit == 4
+    assert limiter.metrics()["in_flight"] == 0
+
+def test_slot_bounds_in_flight_requests():
+    limiter = AdaptiveConcurrencyLimiter(initial=3, max_limit=3)
+    peak = []
+
+    def work():
+        with limiter.slot():
+            peak.append(limiter.in_flight)
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 3
+
+def test_overload_detection_follows_wrapped_causes():
+    try:
+        try:
+            raise ResourceExhausted("quota")
+        except ResourceExhausted as e:
+            raise RuntimeError("Google TTS API error") from e
+    except RuntimeError as wrapped:
+        assert is_overload_error(wrapped)
+
+    assert not is_overload_error(ElevenLabsAPIError("bad voice", status_code=400))
+
+def test_async_slots_share_the_limit_with_threads():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+    peak = []
+
+    async def work():
+        async with limiter.aslot():
+            peak.append(limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        with limiter.slot(), limiter.slot():
+            tasks = [asyncio.create_task(work()) for _ in range(6)]
+            await asyncio.sleep(0.02)
+            # Both slots are held by this thread, so no task may start
+            assert not peak
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert len(peak) == 6 and max(peak) == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,147 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.exception import ElevenLabsAPIError
+from core.tts.audio_utils import regroup_mp3_frames
+from core.tts.elevenlabs.audio_config import ElevenLabsAudioConfig
+from core.tts.elevenlabs.transport import ElevenLabsTransport
+from core.tts.rate_limit import RateLimiter
+from core.tts.retry import RetryPolicy
+
+# 128 kbps, 44.1 kHz MPEG-1 Layer III frame without padding: 417 bytes
+MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+STREAM_PARTS = [MP3_FRAME * 3, MP3_FRAME[:100], MP3_FRAME[100:] + MP3_FRAME * 2]
+
+class ChunkedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.requests_seen.append(self.path)
+
+        if not self.path.startswith("/v1/text-to-speech/voice123/stream"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for part in STREAM_PARTS:
+            self.wfile.write(f"{len(part):X}\r\n".encode() + part + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChunkedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _audio_config(server):
+    port = server.server_address[1]
+    transport = ElevenLabsTransport("test-key", base_url=f"http://127.0.0.1:{port}/v1")
+    return ElevenLabsAudioConfig("test-key", transport=transport)
+
+def test_stream_yields_chunked_body(stub_server):
+    config = _audio_config(stub_server)
+    voice_data = {"voice_id": "voice123", "model": "eleven_multilingual_v2"}
+
+    chunks = list(config.stream("Hello there.", voice_data, "MP3", chunk_size=512))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == b"".join(STREAM_PARTS)
+    assert ChunkedHandler.requests_seen[-1].startswith("/v1/text-to-speech/voice123/stream?")
+
+def test_stream_raises_api_errors(stub_server):
+    config = _audio_config(stub_server)
+    voice_data = {"voice_id": "missing", "model": "eleven_multilingual_v2"}
+
+    with pytest.raises(ElevenLabsAPIError) as excinfo:
+        list(config.stream("Hello there.", voice_data, "MP3"))
+    assert excinfo.value.status_code == 404
+
+def test_generate_to_memory_wraps_api_errors(stub_server):
+    config = _audio_config(stub_server)
+    voice_data = {"voice_id": "missing", "model": "eleven_multilingual_v2"}
+
+    with pytest.raises(RuntimeError) as excinfo:
+        config.generate_to_memory("Hello there.", voice_data, "MP3")
+    assert isinstance(excinfo.value.__cause__, ElevenLabsAPIError)
+    assert excinfo.value.__cause__.status_code == 404
+
+def test_regroup_mp3_frames_keeps_whole_frames():
+    tag = b"ID3\x03\x00\x00\x00\x00\x00\x05" + b"12345"
+    data = tag + MP3_FRAME * 40
+    network_chunks = [data[i:i + 1000] for i in range(0, len(data), 1000)]
+
+    segments = list(regroup_mp3_frames(network_chunks, segment_bytes=4096))
+
+    assert len(segments) > 1
+    assert all(len(segment) % len(MP3_FRAME) == 0 for segment in segments)
+    assert b"".join(segments) == MP3_FRAME * 40
+
+class RecordedResponse:
+    ok = True
+    content = MP3_FRAME
+
+    def iter_content(self, chunk_size):
+        yield self.content
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+@pytest.mark.parametrize("deadline, expected", [(120.0, (5.0, 60.0)), (2.0, (2.0, 2.0))])
+def test_read_timeout_is_capped_by_the_deadline_not_replaced(monkeypatch, deadline, expected):
+    transport = ElevenLabsTransport("test-key", connect_timeout=5.0, read_timeout=60.0)
+    timeouts = []
+
+    def request(method, url, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        return RecordedResponse()
+
+    monkeypatch.setattr(transport.session, "request", request)
+    config = ElevenLabsAudioConfig("test-key", transport=transport, rate_limiter=RateLimiter(),
+                                   retry_policy=RetryPolicy(deadline=deadline))
+    voice_data = {"voice_id": "voice123", "model": "eleven_multilingual_v2"}
+
+    config.generate_to_memory("Hello there.", voice_data, "MP3")
+    list(config.stream("Hello there.", voice_data, "MP3"))
+
+    assert len(timeouts) == 2
+    for connect, read in timeouts:
+        assert connect == pytest.approx(expected[0], abs=0.5) and connect <= expected[0]
+        assert read == pytest.approx(expected[1], abs=0.5) and read <= expected[1]
+
+def test_exhausted_deadline_is_wrapped_like_other_failures(monkeypatch):
+    transport = ElevenLabsTransport("test-key")
+    monkeypatch.setattr(transport.session, "request", lambda *args, **kwargs: pytest.fail("request sent"))
+    config = ElevenLabsAudioConfig("test-key", transport=transport, rate_limiter=RateLimiter(),
+                                   retry_policy=RetryPolicy(deadline=0.0))
+    voice_data = {"voice_id": "voice123", "model": "eleven_multilingual_v2"}
+
+    with pytest.raises(RuntimeError) as excinfo:
+        config.generate_to_memory("Hello there.", voice_data, "MP3")
+    assert isinstance(excinfo.value.__cause__, TimeoutError)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        list(config.stream("Hello there.", voice_data, "MP3"))
+    assert isinstance(excinfo.value.__cause__, TimeoutError)
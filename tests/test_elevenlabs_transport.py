@@ -0,0 +1,38 @@
+import pytest
+
+from core.tts.elevenlabs.transport import (
+    DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, ElevenLabsTransport
+)
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    monkeypatch.setattr(ElevenLabsTransport, "_instances", {})
+
+def test_one_shared_transport_per_key_and_base_url():
+    first = ElevenLabsTransport.for_api_key("key-a")
+    assert ElevenLabsTransport.for_api_key("key-a") is first
+    assert ElevenLabsTransport.for_api_key("key-a", base_url="https://api.elevenlabs.io/v1/") is first
+    assert ElevenLabsTransport.for_api_key("key-b") is not first
+    assert ElevenLabsTransport.for_api_key("key-a", base_url="http://127.0.0.1:9/v1") is not first
+
+    first.close()
+    replacement = ElevenLabsTransport.for_api_key("key-a")
+    assert replacement is not first
+    # Closing a transport that's no longer registered leaves its replacement alone
+    first.close()
+    assert ElevenLabsTransport.for_api_key("key-a") is replacement
+
+def test_requests_get_default_timeouts_and_the_api_key(monkeypatch):
+    transport = ElevenLabsTransport.for_api_key("key-a")
+    sent = []
+    monkeypatch.setattr(transport.session, "request", lambda method, url, **kwargs: sent.append((method, url, kwargs)))
+
+    transport.get("/voices")
+    transport.post("text-to-speech/abc", json={}, timeout=(1.0, 2.0))
+
+    assert sent[0][:2] == ("GET", "https://api.elevenlabs.io/v1/voices")
+    assert sent[0][2]["timeout"] == (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+    assert sent[1][:2] == ("POST", "https://api.elevenlabs.io/v1/text-to-speech/abc")
+    assert sent[1][2]["timeout"] == (1.0, 2.0)
+    assert transport.session.headers["xi-api-key"] == "key-a"
+    assert transport.session.get_adapter("https://api.elevenlabs.io")._pool_maxsize == transport.pool_size
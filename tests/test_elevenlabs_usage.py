@@ -0,0 +1,53 @@
+import threading
+
+from core.tts.elevenlabs.monitor import ElevenLabsUsageMonitor
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"subscription": {"character_count": 1000, "character_limit": 10000}}
+
+class FakeTransport:
+    """Answers /v1/user once released, so a test can tell whether a caller waited on it"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def get(self, path, **kwargs):
+        self.calls += 1
+        self.release.wait(2)
+        return FakeResponse()
+
+def test_update_usage_does_no_file_io(tmp_path):
+    path = tmp_path / "elevenlabs_usage.json"
+    monitor = ElevenLabsUsageMonitor("key", transport=FakeTransport(), usage_file=path, coalesce_delay=60)
+
+    monitor.update_usage(25)
+    monitor.update_usage(5)
+
+    assert not path.exists()
+    assert monitor.get_usage_stats()["used"] == 30
+    monitor.ledger.flush()
+    assert path.exists()
+    monitor.close()
+
+def test_first_stats_do_not_wait_for_the_api(tmp_path):
+    transport = FakeTransport()
+    synced = []
+    done = threading.Event()
+    monitor = ElevenLabsUsageMonitor(
+        "key", transport=transport, usage_file=tmp_path / "usage.json", coalesce_delay=0,
+        on_sync=lambda stats: (synced.append(stats), done.set())
+    )
+
+    stats = monitor.get_usage_stats()
+    assert stats["source"] == "local"
+
+    transport.release.set()
+    assert done.wait(2)
+    assert synced[0]["source"] == "api"
+    assert synced[0]["api_used"] == 1000
+    monitor.close()
@@ -0,0 +1,70 @@
+import requests
+
+from core.tts.elevenlabs.voice import ElevenLabsVoiceManager
+
+def make_voice(voice_id, language, model="eleven_multilingual_v2", category="premade"):
+    return {
+        "voice_id": voice_id,
+        "name": voice_id.title(),
+        "category": category,
+        "labels": {"gender": "female"},
+        "verified_languages": [{"language": language, "model_id": model, "accent": "standard"}]
+    }
+
+class FakeResponse:
+    def __init__(self, status_code, voices=None, etag=None):
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+        self.voices = voices
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return {"voices": self.voices}
+
+class FakeTransport:
+    """Serves /voices with an ETag and answers 304 to a matching If-None-Match"""
+
+    def __init__(self, voices, etag="v1"):
+        self.voices = voices
+        self.etag = etag
+        self.fail = False
+        self.sent_headers = []
+
+    def get(self, path, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        if self.fail:
+            return FakeResponse(503)
+        if headers and headers.get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.voices, self.etag)
+
+def test_not_modified_keeps_the_existing_index():
+    transport = FakeTransport([make_voice("alice", "en"), make_voice("bruno", "pt-BR", category="cloned")])
+    manager = ElevenLabsVoiceManager("key", transport=transport)
+    assert [v["id"] for v in manager.get_voices_for_language("pt", "cloned")] == ["bruno"]
+    index = manager.library._voices_by_language
+
+    manager.refresh()
+    assert transport.sent_headers[-1] == {"If-None-Match": "v1"}
+    assert manager.library._voices_by_language is index
+    assert [v["id"] for v in manager.get_voices_for_language("en")] == ["alice"]
+
+    # A forced refresh drops the validator and rebuilds from the new list
+    transport.voices, transport.etag = [make_voice("chen", "zh")], "v2"
+    manager.refresh(force=True)
+    assert transport.sent_headers[-1] == {}
+    assert manager.get_voices_for_language("en") == []
+    assert [code for code, _ in manager.get_available_languages()] == ["zh"]
+
+def test_failed_revalidation_serves_cached_voices():
+    transport = FakeTransport([make_voice("alice", "en")])
+    manager = ElevenLabsVoiceManager("key", transport=transport)
+    assert manager.get_available_languages(format="code") == ["en"]
+
+    transport.fail = True
+    manager.refresh()
+    assert [v["id"] for v in manager.get_voices_for_language("en")] == ["alice"]
+    assert len(manager.library.voices_for_model("eleven_multilingual_v2")) == 1
@@ -0,0 +1,95 @@
+import io
+import wave
+
+import pytest
+from google.cloud import texttospeech
+
+from core.tts.google.audio_config import GoogleAudioConfig
+
+STREAMING_VOICE = {"language_code": "en-US", "name": "en-US-Chirp3-HD-Charon"}
+
+class FakeStreamingClient:
+    """Stands in for TextToSpeechClient, answering streaming_synthesize with canned chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.requests = []
+        self.calls = 0
+
+    def streaming_synthesize(self, requests, timeout=None):
+        self.calls += 1
+        self.requests.extend(requests)
+        return iter([texttospeech.StreamingSynthesizeResponse(audio_content=c) for c in self.chunks])
+
+def test_stream_sends_config_then_text():
+    client = FakeStreamingClient([b"one", b"two"])
+    config = GoogleAudioConfig(client)
+
+    chunks = list(config.stream("Hello there.", voice_data=STREAMING_VOICE, audio_format="OGG"))
+
+    assert chunks == [b"one", b"two"]
+    first, second = client.requests
+    assert first.streaming_config.voice.name == STREAMING_VOICE["name"]
+    assert first.streaming_config.streaming_audio_config.audio_encoding == texttospeech.AudioEncoding.OGG_OPUS
+    assert second.input.text == "Hello there."
+
+def test_stream_wraps_pcm_as_wav():
+    pcm = b"\x00\x01" * 240
+    config = GoogleAudioConfig(FakeStreamingClient([pcm]))
+
+    (chunk,) = config.stream("Hi.", voice_data=STREAMING_VOICE, audio_format="WAV")
+
+    with wave.open(io.BytesIO(chunk)) as reader:
+        assert reader.getframerate() == GoogleAudioConfig.STREAMING_SAMPLE_RATE
+        assert reader.readframes(reader.getnframes()) == pcm
+
+def test_supports_streaming_by_voice_family():
+    config = GoogleAudioConfig(FakeStreamingClient([]))
+
+    assert config.supports_streaming(voice_data=STREAMING_VOICE)
+    assert not config.supports_streaming(voice_data={"language_code": "en-US", "name": "en-US-Wavenet-D"})
+
+def test_engine_records_usage_once_and_caches(engine_factory):
+    client = FakeStreamingClient([b"a", b"b", b"c"])
+    engine = engine_factory(client)
+    text = "Streaming keeps the first audio close."
+
+    assert b"".join(engine.stream_audio(text, voice_data=STREAMING_VOICE, audio_format="OGG")) == b"abc"
+    assert engine.usage_monitor.updates == [len(text)]
+
+    assert b"".join(engine.stream_audio(text, voice_data=STREAMING_VOICE, audio_format="OGG")) == b"abc"
+    assert client.calls == 1
+    assert engine.usage_monitor.updates == [len(text)]
+
+def test_stream_rejects_encodings_and_rates_streaming_does_not_support():
+    config = GoogleAudioConfig(FakeStreamingClient([b"one"]))
+
+    with pytest.raises(ValueError, match="MP3"):
+        list(config.stream("Hi.", voice_data=STREAMING_VOICE, audio_format="MP3"))
+    with pytest.raises(ValueError, match="speaking_rate"):
+        list(config.stream("Hi.", voice_data=STREAMING_VOICE, audio_format="OGG", speaking_rate=3.0))
+
+class FallbackClient(FakeStreamingClient):
+    def __init__(self):
+        super().__init__([b"streamed"])
+        self.unary = []
+
+    def synthesize_speech(self, input, voice, audio_config, timeout=None):
+        self.unary.append(audio_config)
+        return texttospeech.SynthesizeSpeechResponse(audio_content=b"unary")
+
+@pytest.mark.parametrize("params", [
+    {"audio_format": "MP3"},
+    {"audio_format": "OGG", "speaking_rate": 3.0},
+    {"audio_format": "OGG", "pitch": 2.0},
+    {"audio_format": "OGG", "effects_profile_id": ["headphone-class-device"]},
+])
+def test_engine_falls_back_to_unary_when_streaming_cannot_honour_the_request(engine_factory, params):
+    client = FallbackClient()
+    engine = engine_factory(client)
+
+    assert b"".join(engine.stream_audio("Hello.", voice_data=STREAMING_VOICE, **params)) == b"unary"
+    assert client.calls == 0
+    (audio_config,) = client.unary
+    assert audio_config.speaking_rate == params.get("speaking_rate", 1.0)
+    assert audio_config.pitch == params.get("pitch", 0.0)
@@ -0,0 +1,142 @@
+import pytest
+from google.api_core.exceptions import RetryError, ServiceUnavailable
+from google.auth.exceptions import TransportError
+from google.cloud import texttospeech
+
+from core.tts.google import voice as voice_module
+from core.tts.google.audio_config import GoogleAudioConfig
+from core.tts.google.voice import GoogleVoiceCatalog, GoogleVoiceManager
+from core.tts.rate_limit import RateLimiter
+
+def make_voice(name, *language_codes):
+    return texttospeech.Voice(
+        name=name,
+        language_codes=list(language_codes),
+        ssml_gender=texttospeech.SsmlVoiceGender.FEMALE,
+        natural_sample_rate_hertz=24000
+    )
+
+class FakeClient:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def list_voices(self):
+        self.calls += 1
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return texttospeech.ListVoicesResponse(voices=response)
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(voice_module.time, "monotonic", clock)
+    return clock
+
+def test_catalog_fetches_once_until_the_ttl_expires(clock):
+    client = FakeClient(
+        [make_voice("en-US-Wavenet-D", "en-US"), make_voice("fr-FR-Neural2-A", "fr-FR")],
+        [make_voice("de-DE-Wavenet-B", "de-DE")]
+    )
+    catalog = GoogleVoiceCatalog(client, str.upper, ttl=60)
+
+    assert catalog.languages() == [("en", "EN"), ("fr", "FR")]
+    assert [v["name"] for v in catalog.voices_for_language("en-us")] == ["en-US-Wavenet-D"]
+    assert catalog.voices_for_language("fr")[0]["voice_type"] == "Neural"
+    clock.now += 59
+    assert catalog.language_codes() == ["en", "fr"]
+    assert client.calls == 1
+
+    clock.now += 1
+    assert catalog.language_codes() == ["de"]
+    assert catalog.voices_for_language("en") == []
+    assert client.calls == 2
+
+def test_catalog_serves_stale_voices_when_a_refresh_fails(clock):
+    client = FakeClient([make_voice("en-US-Wavenet-D", "en-US")], ServiceUnavailable("down"))
+    catalog = GoogleVoiceCatalog(client, str.upper, ttl=60)
+    assert catalog.language_codes() == ["en"]
+
+    clock.now += 60
+    assert catalog.voice_by_name("en-US-Wavenet-D")["language"] == "en-US"
+    assert client.calls == 2
+
+    # The failed refresh backs off briefly instead of retrying on every lookup
+    catalog.voices_for_language("en")
+    assert client.calls == 2
+
+@pytest.mark.parametrize("error", [
+    ServiceUnavailable("down"),
+    RetryError("deadline exceeded", None),
+    TransportError("no route to host"),
+    ConnectionError("reset")
+])
+def test_failed_refresh_is_retried_after_a_short_backoff(clock, error):
+    client = FakeClient(
+        [make_voice("en-US-Wavenet-D", "en-US")], error, [make_voice("de-DE-Wavenet-B", "de-DE")]
+    )
+    catalog = GoogleVoiceCatalog(client, str.upper, ttl=3600, retry_delay=30)
+    assert catalog.language_codes() == ["en"]
+
+    clock.now += 3600
+    assert catalog.language_codes() == ["en"]
+    clock.now += 29
+    assert catalog.language_codes() == ["en"]
+    assert client.calls == 2
+
+    clock.now += 1
+    assert catalog.language_codes() == ["de"]
+    assert client.calls == 3
+
+def test_invalidated_catalog_still_falls_back_to_stale_voices(clock):
+    client = FakeClient([make_voice("en-US-Wavenet-D", "en-US")], ServiceUnavailable("down"))
+    catalog = GoogleVoiceCatalog(client, str.upper)
+    assert catalog.language_codes() == ["en"]
+
+    catalog.invalidate()
+    assert catalog.language_codes() == ["en"]
+    assert client.calls == 2
+
+def test_first_fetch_failure_is_raised(clock):
+    catalog = GoogleVoiceCatalog(FakeClient(ServiceUnavailable("down")), str.upper)
+    with pytest.raises(ServiceUnavailable):
+        catalog.languages()
+
+class SynthesisClient(FakeClient):
+    def __init__(self, voices):
+        super().__init__(voices)
+        self.requests = []
+
+    def synthesize_speech(self, input, voice, audio_config, timeout=None):
+        self.requests.append(voice)
+        return texttospeech.SynthesizeSpeechResponse(audio_content=b"audio")
+
+def test_voice_name_resolves_through_the_catalog_index():
+    client = SynthesisClient([make_voice("en-GB-Wavenet-A", "en-GB"), make_voice("ja-JP-Neural2-B", "ja-JP")])
+    config = GoogleAudioConfig(client, voice_manager=GoogleVoiceManager(client), rate_limiter=RateLimiter())
+
+    assert config.generate_to_memory("Hi.", voice_name="ja-JP-Neural2-B") == b"audio"
+    assert config.generate_to_memory("Hi.", voice_name="en-GB-Wavenet-A") == b"audio"
+    first, second = client.requests
+    assert (first.name, first.language_code, first.ssml_gender) == (
+        "ja-JP-Neural2-B", "ja-JP", texttospeech.SsmlVoiceGender.FEMALE
+    )
+    assert (second.name, second.language_code) == ("en-GB-Wavenet-A", "en-GB")
+    assert client.calls == 1
+
+def test_unknown_voice_name_fails_with_runtime_error():
+    client = SynthesisClient([make_voice("en-US-Wavenet-D", "en-US")])
+    config = GoogleAudioConfig(client, voice_manager=GoogleVoiceManager(client), rate_limiter=RateLimiter())
+
+    with pytest.raises(RuntimeError, match="Unknown Google voice: en-US-Nope") as raised:
+        config.generate_to_memory("Hi.", voice_name="en-US-Nope")
+    assert isinstance(raised.value.__cause__, ValueError)
+    assert client.requests == []
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from gui.tasks import BackgroundTasks
+
+class FakeRoot:
+    """Collects after() callbacks so the test can pump them like a Tk main loop"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, fn, *args):
+        self.scheduled.append((fn, args))
+
+    def pump(self, until, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            scheduled, self.scheduled = self.scheduled, []
+            for fn, args in scheduled:
+                fn(*args)
+            time.sleep(0.01)
+
+def test_callbacks_run_on_the_polling_thread():
+    root = FakeRoot()
+    tasks = BackgroundTasks(root)
+    seen = []
+
+    tasks.submit(lambda: threading.current_thread().name, on_done=lambda name: seen.append((name, threading.current_thread().name)))
+    root.pump(lambda: seen)
+    tasks.shutdown()
+
+    worker, caller = seen[0]
+    assert worker.startswith("tts-gui")
+    assert caller == threading.current_thread().name
+
+def test_later_submission_supersedes_same_key():
+    root = FakeRoot()
+    tasks = BackgroundTasks(root)
+    release = threading.Event()
+    results = []
+
+    tasks.submit(release.wait, on_done=lambda _: results.append("stale"), key="voices")
+    tasks.submit(lambda: "fresh", on_done=results.append, key="voices")
+    release.set()
+    root.pump(lambda: results and not tasks._pending)
+    tasks.shutdown()
+
+    assert results == ["fresh"]
+
+def test_errors_and_posts_reach_the_main_loop():
+    root = FakeRoot()
+    tasks = BackgroundTasks(root)
+    errors, posted = [], []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    tasks.submit(fail, on_error=errors.append)
+    threading.Thread(target=tasks.post, args=(posted.append, "quota")).start()
+    root.pump(lambda: errors and posted)
+    tasks.shutdown()
+
+    assert str(errors[0]) == "boom"
+    assert posted == ["quota"]
+
+def test_failing_callback_does_not_stop_polling():
+    root = FakeRoot()
+    tasks = BackgroundTasks(root)
+    results = []
+
+    def broken(_):
+        raise ValueError("bad callback")
+
+    tasks.post(broken, None)
+    tasks.submit(lambda: "first", on_done=broken)
+    root.pump(lambda: not tasks._pending)
+    tasks.submit(lambda: "second", on_done=results.append)
+    root.pump(lambda: results)
+    tasks.shutdown()
+
+    assert results == ["second"]
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from langcodes import Language
+
+from core.tts import language_names
+from core.tts.language_names import language_name
+from core.tts.language_table import LANGUAGE_NAMES
+
+SRC = Path(__file__).parent.parent / "src"
+
+def test_table_matches_langcodes():
+    for code in ("en", "fr", "zh", "pt", "cmn", "yue", "fil"):
+        assert language_name(code) == Language.get(code).display_name()
+    assert language_name("EN") == "English"
+
+def test_unknown_codes_fall_back_to_langcodes():
+    assert "en-US" not in LANGUAGE_NAMES
+    assert language_name("en-US") == Language.get("en-US").display_name()
+
+def test_table_is_up_to_date():
+    assert language_names.generate_table() == LANGUAGE_NAMES
+
+def test_lookup_does_not_import_langcodes():
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC)!r}); from core.tts.language_names import language_name; "
+        "language_name('de'); print('langcodes' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
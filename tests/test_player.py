@@ -0,0 +1,180 @@
+import time
+
+import pytest
+
+from core.tts.cancellation import CancellationToken, SynthesisHandle
+from gui import player as player_module
+from gui.player import ProgressivePlayer
+
+class FakeRoot:
+    """Collects after() callbacks so the test can pump them like a Tk main loop"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, fn, *args):
+        self.scheduled.append((fn, args))
+
+    def pump(self, until, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            scheduled, self.scheduled = self.scheduled, []
+            for fn, args in scheduled:
+                fn(*args)
+            time.sleep(0.005)
+
+class FakeChannel:
+    """One playing sound plus pygame's single queue slot"""
+
+    def __init__(self, sound):
+        self.playing = sound
+        self.queued = None
+        self.played = [sound.data]
+
+    def get_busy(self):
+        return self.playing is not None
+
+    def get_queue(self):
+        return self.queued
+
+    def queue(self, sound):
+        assert self.queued is None
+        self.queued = sound
+        self.played.append(sound.data)
+
+    def stop(self):
+        self.playing = self.queued = None
+
+    def finish_current(self):
+        self.playing, self.queued = self.queued, None
+
+class FakeSound:
+    def __init__(self, file):
+        self.data = file.read()
+
+    def play(self):
+        return FakeChannel(self)
+
+@pytest.fixture(autouse=True)
+def fake_mixer(monkeypatch):
+    monkeypatch.setattr(player_module.pygame.mixer, "Sound", FakeSound)
+
+def test_segments_queue_behind_the_playing_one_and_end_is_reported_once():
+    root = FakeRoot()
+    player = ProgressivePlayer(root, poll_ms=0)
+    events = []
+
+    player.start(
+        iter([b"one", b"two", b"three"]),
+        on_first_audio=lambda: events.append("first"),
+        on_segment=lambda count, received: events.append(("segment", count, received)),
+        on_audio_ready=lambda parts: events.append(("ready", parts)),
+        on_playback_end=lambda: events.append("end")
+    )
+    root.pump(lambda: player.channel is not None and player.channel.get_queue() is not None)
+    channel = player.channel
+    assert channel.played == [b"one", b"two"]
+
+    # The third segment waits until the queue slot frees up
+    root.pump(lambda: False, timeout=0.05)
+    assert channel.played == [b"one", b"two"]
+    channel.finish_current()
+    root.pump(lambda: len(channel.played) == 3)
+    assert channel.played == [b"one", b"two", b"three"]
+
+    # End of stream is read once the slot frees again, but playback isn't over yet
+    channel.finish_current()
+    root.pump(lambda: ("ready", [b"one", b"two", b"three"]) in events)
+    assert "end" not in events
+
+    channel.finish_current()
+    root.pump(lambda: "end" in events)
+    assert events == [
+        ("segment", 1, 3), "first", ("segment", 2, 6), ("segment", 3, 11),
+        ("ready", [b"one", b"two", b"three"]), "end"
+    ]
+    assert not player.is_active
+    root.pump(lambda: not root.scheduled)
+    assert events.count("end") == 1
+
+def test_failing_callbacks_do_not_stop_playback():
+    root = FakeRoot()
+    player = ProgressivePlayer(root, poll_ms=0)
+    ended = []
+
+    def broken(*args):
+        raise ValueError("bad callback")
+
+    player.start(iter([b"one"]), on_first_audio=broken, on_segment=broken, on_audio_ready=broken,
+                 on_playback_end=lambda: ended.append(True))
+    root.pump(lambda: player._producer_done)
+    player.channel.finish_current()
+    root.pump(lambda: ended)
+
+    assert ended == [True]
+    assert not player.is_active
+
+def test_producer_error_stops_playback_and_reaches_on_error():
+    root = FakeRoot()
+    player = ProgressivePlayer(root, poll_ms=0)
+    errors = []
+
+    def segments():
+        yield b"one"
+        raise RuntimeError("synthesis failed")
+
+    player.start(segments(), on_error=errors.append, on_playback_end=lambda: errors.append("end"))
+    root.pump(lambda: errors)
+
+    assert [str(e) for e in errors] == ["synthesis failed"]
+    assert not player.is_active
+
+def test_stop_from_a_callback_ends_polling():
+    root = FakeRoot()
+    player = ProgressivePlayer(root, poll_ms=0)
+    seen = []
+
+    def stop_after_first(count, received):
+        seen.append(count)
+        player.stop()
+
+    player.start(iter([b"one", b"two"]), on_segment=stop_after_first)
+    root.pump(lambda: seen)
+    root.pump(lambda: not root.scheduled)
+
+    assert seen == [1]
+    assert not root.scheduled and not player.is_active
+
+class TrackedSynthesis:
+    """A SynthesisHandle over endless audio, wrapped the way regroup_mp3_frames wraps it"""
+
+    def __init__(self):
+        self.closed = False
+        self.handle = SynthesisHandle(self._audio(), CancellationToken())
+        self.segments = (segment for segment in self.handle)
+
+    def _audio(self):
+        try:
+            while True:
+                yield b"audio"
+        finally:
+            self.closed = True
+
+@pytest.mark.parametrize("how", ["finish", "stop", "cancel"])
+def test_synthesis_handle_is_closed_when_production_ends(how):
+    root = FakeRoot()
+    player = ProgressivePlayer(root, poll_ms=0, max_buffered=1)
+    synthesis = TrackedSynthesis()
+    segments = synthesis.segments
+    if how == "finish":
+        segments = iter([next(synthesis.segments)])
+
+    player.start(segments, handle=synthesis.handle)
+    root.pump(lambda: player.channel is not None)
+    if how == "cancel":
+        synthesis.handle.cancel()
+    if how != "finish":
+        player.stop()
+    player.join(timeout=2.0)
+
+    assert synthesis.closed
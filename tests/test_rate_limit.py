@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+
+from core.tts.rate_limit import RateLimiter, TokenBucket
+from core.tts.service_types import TTSService
+
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate_per_minute=600, capacity=5)
+
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+def test_limiter_shares_budget_across_threads():
+    limiter = RateLimiter(requests_per_minute=1200)
+    limiter.requests.capacity = limiter.requests._tokens = 1
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One token up front, then one every 50ms for the other five
+    assert time.monotonic() - started >= 0.24
+
+def test_char_budget_applies_to_async_callers():
+    limiter = RateLimiter(chars_per_minute=60_000)
+    limiter.chars.capacity = limiter.chars._tokens = 1000
+
+    async def run():
+        return await asyncio.gather(*(limiter.aacquire(500) for _ in range(4)))
+
+    waits = asyncio.run(run())
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.49 < waits[2] <= 0.5 and 0.99 < waits[3] <= 1.0
+
+def test_registry_is_per_service_and_key():
+    google = RateLimiter.for_service(TTSService.GOOGLE, "project-a")
+
+    assert RateLimiter.for_service(TTSService.GOOGLE, "project-a") is google
+    assert RateLimiter.for_service(TTSService.GOOGLE, "project-b") is not google
+    assert RateLimiter.for_service(TTSService.ELEVENLABS, "key").requests is None
+
+def test_configure_updates_limiters_already_handed_out(monkeypatch):
+    from core.tts.elevenlabs.audio_config import ElevenLabsAudioConfig
+    from core.tts.elevenlabs.transport import ElevenLabsTransport
+
+    monkeypatch.setattr(RateLimiter, "_instances", {})
+    config = ElevenLabsAudioConfig("key", transport=ElevenLabsTransport("key"))
+    assert config.rate_limiter.requests is None
+
+    limiter = RateLimiter.configure(TTSService.ELEVENLABS, "key", requests_per_minute=600)
+
+    assert config.rate_limiter is limiter
+    assert limiter.requests.rate == 10
+    limiter.requests._tokens = 0
+    assert 0.09 < config.rate_limiter.acquire() <= 0.1
+
+    RateLimiter.configure(TTSService.ELEVENLABS, "key", requests_per_minute=1200)
+    assert config.rate_limiter.requests is limiter.requests
+    assert 0.04 < config.rate_limiter.acquire() <= 0.05
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from core.tts.registry import ProviderRegistry
+from core.tts.service_types import TTSService
+
+SRC = Path(__file__).parent.parent / "src"
+
+def test_factory_import_loads_no_backend():
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC)!r}); import core.tts.factory, core.tts.registry; "
+        "print(any(m.startswith(('google.cloud.texttospeech', 'core.tts.google', 'core.tts.elevenlabs')) for m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
+
+def test_elevenlabs_engine_does_not_load_google():
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC)!r}); import core.tts.elevenlabs.elevenlabs; "
+        "print(any(m.startswith('google.') for m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
+
+def test_engines_are_built_once_on_first_use():
+    built = []
+    registry = ProviderRegistry(create=lambda service: built.append(service) or object())
+
+    assert registry.peek(TTSService.GOOGLE) is None
+    engine = registry.get(TTSService.GOOGLE)
+
+    assert registry.get(TTSService.GOOGLE) is engine
+    assert registry.peek(TTSService.GOOGLE) is engine
+    assert built == [TTSService.GOOGLE]
+
+def test_get_waits_for_warm_up():
+    release = threading.Event()
+    built = []
+
+    def create(service):
+        release.wait(2)
+        built.append(service)
+        return object()
+
+    registry = ProviderRegistry(create=create)
+    future = registry.warm(TTSService.ELEVENLABS)
+    assert not registry.is_ready(TTSService.ELEVENLABS)
+
+    threading.Timer(0.05, release.set).start()
+    engine = registry.get(TTSService.ELEVENLABS)
+
+    assert future.result() is engine
+    assert built == [TTSService.ELEVENLABS]
+
+def test_failed_build_is_retried():
+    attempts = []
+
+    def create(service):
+        attempts.append(service)
+        if len(attempts) == 1:
+            raise RuntimeError("no API key")
+        return object()
+
+    registry = ProviderRegistry(create=create)
+    with pytest.raises(RuntimeError):
+        registry.get(TTSService.ELEVENLABS)
+
+    assert registry.get(TTSService.ELEVENLABS) is not None
+    assert len(attempts) == 2
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, ServiceUnavailable
+
+from core.exception import ElevenLabsAPIError
+from core.tts.retry import LatencyTracker, Retrier, RetryPolicy, is_retryable
+
+def test_retries_transient_errors_until_success():
+    outcomes = [ServiceUnavailable("down"), ElevenLabsAPIError("busy", status_code=429), b"audio"]
+    timeouts = []
+
+    def request(timeout, cancel_token):
+        timeouts.append(timeout)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    retrier = Retrier(RetryPolicy(base_delay=0.01, deadline=5.0))
+    assert retrier.call(request) == b"audio"
+    assert len(timeouts) == 3
+    assert all(0 < t <= 5.0 for t in timeouts) and timeouts[2] < timeouts[0]
+
+def test_permanent_errors_are_not_retried():
+    calls = []
+
+    def request(timeout, cancel_token):
+        calls.append(timeout)
+        raise InvalidArgument("bad voice")
+
+    with pytest.raises(InvalidArgument):
+        Retrier(RetryPolicy(base_delay=0.01)).call(request)
+    assert len(calls) == 1
+
+def test_retries_stop_at_max_attempts():
+    calls = []
+
+    def request(timeout, cancel_token):
+        calls.append(timeout)
+        raise ElevenLabsAPIError("server error", status_code=502)
+
+    with pytest.raises(ElevenLabsAPIError):
+        Retrier(RetryPolicy(max_attempts=3, base_delay=0.01)).call(request)
+    assert len(calls) == 3
+
+def test_hedge_races_a_duplicate_past_p95():
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.record(0.02)
+    retrier = Retrier(RetryPolicy(hedge=True), tracker)
+    calls = []
+    lock = threading.Lock()
+
+    def request(timeout, cancel_token):
+        with lock:
+            calls.append(timeout)
+            straggler = len(calls) == 1
+        time.sleep(1.0 if straggler else 0.01)
+        return "hedged" if not straggler else "straggler"
+
+    started = time.monotonic()
+    assert retrier.call(request) == "hedged"
+    assert time.monotonic() - started < 0.5
+    assert len(calls) == 2
+
+def test_hedge_cancels_the_losing_copy():
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.record(0.02)
+    retrier = Retrier(RetryPolicy(hedge=True), tracker)
+    tokens = []
+    lock = threading.Lock()
+
+    def request(timeout, cancel_token):
+        with lock:
+            tokens.append(cancel_token)
+            straggler = len(tokens) == 1
+        if straggler:
+            cancel_token.wait(2.0)
+            return "straggler"
+        return "hedged"
+
+    assert retrier.call(request) == "hedged"
+    straggler, winner = tokens
+    assert straggler.cancelled and not winner.cancelled
+
+def test_retryable_classification_follows_causes():
+    try:
+        try:
+            raise ElevenLabsAPIError("overloaded", status_code=503)
+        except ElevenLabsAPIError as e:
+            raise RuntimeError("ElevenLabs TTS generation failed") from e
+    except RuntimeError as wrapped:
+        assert is_retryable(wrapped)
+
+    assert not is_retryable(ElevenLabsAPIError("unauthorized", status_code=401))
@@ -0,0 +1,56 @@
+import json
+
+from core.tts import snapshot as snapshot_module
+from core.tts.service_types import TTSService
+from core.tts.snapshot import WarmStartSnapshot
+
+LANGUAGES = [("en", "English"), ("fr", "French")]
+VOICES = [{"name": "en-US-Wavenet-D", "gender": "MALE", "language": "en-US", "sample_rate": 24000}]
+
+def test_round_trip_per_service_and_model(tmp_path):
+    path = tmp_path / "warm_start.json"
+    snapshot = WarmStartSnapshot(path)
+    snapshot.put_languages(TTSService.GOOGLE, None, LANGUAGES)
+    snapshot.put_languages(TTSService.ELEVENLABS, "eleven_turbo_v2", LANGUAGES[:1])
+    snapshot.put_voices(TTSService.GOOGLE, "en", VOICES)
+    snapshot.put_usage(TTSService.GOOGLE, {"used": 42, "limit": 1000000})
+
+    reloaded = WarmStartSnapshot(path)
+
+    assert reloaded.languages(TTSService.GOOGLE) == LANGUAGES
+    assert reloaded.languages(TTSService.ELEVENLABS, "eleven_turbo_v2") == LANGUAGES[:1]
+    assert reloaded.languages(TTSService.ELEVENLABS, "eleven_multilingual_v2") is None
+    assert reloaded.voices(TTSService.GOOGLE, "en") == VOICES
+    assert reloaded.usage(TTSService.GOOGLE) == {"used": 42, "limit": 1000000}
+    assert reloaded.usage(TTSService.ELEVENLABS) is None
+
+def test_unreadable_or_foreign_files_start_empty(tmp_path):
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    old = tmp_path / "old.json"
+    old.write_text(json.dumps({"version": 0, "services": {"google": {"usage": {"used": 1}}}}))
+
+    assert WarmStartSnapshot(corrupt).usage(TTSService.GOOGLE) is None
+    assert WarmStartSnapshot(old).usage(TTSService.GOOGLE) is None
+
+def test_unchanged_data_is_not_rewritten(tmp_path, monkeypatch):
+    snapshot = WarmStartSnapshot(tmp_path / "warm_start.json")
+    writes = []
+    monkeypatch.setattr(snapshot_module, "atomic_write_bytes", lambda path, data: writes.append(data))
+
+    snapshot.put_usage(TTSService.GOOGLE, {"used": 1})
+    snapshot.put_usage(TTSService.GOOGLE, {"used": 1})
+    snapshot.put_languages(TTSService.GOOGLE, None, LANGUAGES)
+    snapshot.put_languages(TTSService.GOOGLE, None, list(LANGUAGES))
+
+    assert len(writes) == 2
+
+def test_voice_lists_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot_module, "MAX_VOICE_LANGUAGES", 2)
+    snapshot = WarmStartSnapshot(tmp_path / "warm_start.json")
+
+    for language in ("en", "fr", "de"):
+        snapshot.put_voices(TTSService.GOOGLE, language, VOICES)
+
+    assert snapshot.voices(TTSService.GOOGLE, "en") is None
+    assert snapshot.voices(TTSService.GOOGLE, "de") == VOICES
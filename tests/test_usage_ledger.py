@@ -0,0 +1,102 @@
+import json
+import threading
+
+from core.tts import usage_ledger
+from core.tts.google.monitor import GoogleUsageMonitor
+from core.tts.usage_ledger import UsageLedger
+
+def test_counts_are_written_behind(tmp_path):
+    path = tmp_path / "usage.json"
+    ledger = UsageLedger(path)
+
+    ledger.add(120)
+    ledger.add(30)
+
+    assert not path.exists()
+    assert ledger.used() == 150
+    ledger.flush()
+    assert json.loads(path.read_text())["used"] == 150
+    assert ledger.used() == 150
+
+def test_processes_sharing_a_file_merge_their_counts(tmp_path):
+    path = tmp_path / "usage.json"
+    ledgers = [UsageLedger(path) for _ in range(4)]
+
+    def spend(ledger):
+        for _ in range(50):
+            ledger.add(10)
+            ledger.flush()
+
+    threads = [threading.Thread(target=spend, args=(ledger,)) for ledger in ledgers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert json.loads(path.read_text())["used"] == 4 * 50 * 10
+
+def test_month_rollover_keeps_last_months_pending_usage(tmp_path, monkeypatch):
+    path = tmp_path / "usage.json"
+    path.write_text(json.dumps({"month": "2026-09", "used": 500}))
+    month = ["2026-09"]
+    monkeypatch.setattr(usage_ledger, "current_month", lambda: month[0])
+    ledger = UsageLedger(path)
+
+    ledger.add(40)
+    month[0] = "2026-10"
+    ledger.add(7)
+    ledger.flush()
+
+    data = json.loads(path.read_text())
+    assert data["month"] == "2026-10" and data["used"] == 7
+    assert data["history"] == {"2026-09": 540}
+    assert ledger.used("2026-09") == 540
+
+def test_monitors_share_one_ledger_per_file(tmp_path):
+    path = tmp_path / "google_usage.json"
+    first = GoogleUsageMonitor(None, usage_file=path)
+    second = GoogleUsageMonitor(None, usage_file=path)
+    flushers = [t for t in threading.enumerate() if t.name == "usage-flush-google_usage"]
+
+    first.update_usage(10)
+    second.update_usage(5)
+
+    assert first.ledger is second.ledger
+    assert len(flushers) == 1
+    assert second.get_character_stats()["used"] == 15
+    first.close()
+    assert json.loads(path.read_text())["used"] == 15
+
+def test_legacy_ledger_is_merged_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage_ledger, "current_month", lambda: "2026-10")
+    path, legacy = tmp_path / "app" / "usage.json", tmp_path / "usage.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({"month": "2026-10", "used": 100, "history": {"2026-09": 10}}))
+    legacy.write_text(json.dumps({"month": "2026-09", "used": 40, "api_sync_time": "2026-09-30T12:00:00"}))
+
+    UsageLedger(path, legacy_path=legacy).migrate()
+    UsageLedger(path, legacy_path=legacy).migrate()
+
+    data = json.loads(path.read_text())
+    assert data["used"] == 100 and data["history"] == {"2026-09": 50}
+    assert data["api_sync_time"] == "2026-09-30T12:00:00"
+    assert not legacy.exists() and (tmp_path / "usage.json.migrated").exists()
+
+def test_legacy_ledger_seeds_a_new_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage_ledger, "current_month", lambda: "2026-10")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "google_usage.json").write_text(json.dumps({"month": "2026-10", "used": 25}))
+    path = tmp_path / "app" / "google_usage.json"
+    ledger = UsageLedger.for_file(path, legacy_path="google_usage.json")
+
+    ledger.add(5)
+
+    assert ledger.used() == 30
+    ledger.close()
+    assert json.loads(path.read_text())["used"] == 30
+
+def test_usage_ledgers_share_the_app_data_directory():
+    from core.tts.elevenlabs.monitor import ELEVENLABS_USAGE_FILE
+    from core.tts.google.monitor import GOOGLE_USAGE_FILE
+
+    assert GOOGLE_USAGE_FILE.parent == ELEVENLABS_USAGE_FILE.parent